@@ -0,0 +1,7 @@
+"""
+# Log Viewer package. Run the GUI with 'python -m code.main' or a script headless with 'python -m code.cli run <script>'.
+# 로그 뷰어 패키지입니다. GUI는 'python -m code.main', 헤드리스 실행은 'python -m code.cli run <script>'로 시작합니다.
+
+# This file makes 'code' a regular package, so it takes precedence over the standard library module of the same name.
+# 이 파일은 'code'를 일반 패키지로 만들어, 같은 이름의 표준 라이브러리 모듈보다 우선하게 합니다.
+"""
@@ -0,0 +1,163 @@
+"""
+# Headless command-line runner for the Log Viewer.
+# 로그 뷰어의 헤드리스 명령줄 실행기입니다.
+
+# Runs a script through the same engine as the GUI (interpreter resolution, level classification, PROGRESS
+# collapsing, log_viewer_<timestamp>.log files) and streams the classified output to the terminal and to the
+# log directory at pipe speed, without a display.
+# GUI와 같은 엔진(인터프리터 결정, 레벨 분류, PROGRESS 정리, log_viewer_<timestamp>.log 파일)으로 스크립트를
+# 실행하고, 분류된 출력을 디스플레이 없이 파이프 속도로 터미널과 로그 디렉토리에 스트리밍합니다.
+
+# Usage (사용법):
+#     python -m code.cli run <script> [--log-dir DIR] [--hide LEVEL[,LEVEL...]] [--color auto|always|never] [--no-file] [--quiet]
+"""
+
+import os
+import sys
+import argparse
+import threading
+from pathlib import Path
+from typing import List, Optional, Tuple, TextIO
+
+from .gui.config import DATA_DIR, LOG_DIR
+from .gui.classifier import LevelClassifier
+from .gui.engine import EngineError, LogIngestor, ScriptRun, load_custom_logs, new_log_file_path, resolve_command
+from .gui.log_writer import LogWriter
+from .gui.theme import DefaultTheme
+
+# ANSI SGR codes per level; levels not listed are printed uncolored.
+# 레벨별 ANSI SGR 코드입니다. 목록에 없는 레벨은 색 없이 출력됩니다.
+LEVEL_ANSI = {
+    'TRACE': '90', 'DEBUG': '37', 'PROGRESS': '35', 'WARNING': '33', 'ERROR': '31', 'FATAL': '1;31',
+    'COMMENT': '33', 'SYSTEM': '36',
+}
+
+class TerminalOutput:
+    """
+    # Writes classified entries to a text stream, one write per batch. On a terminal, the latest PROGRESS update is
+    # shown as a transient status line below the output.
+    # 분류된 항목을 배치마다 한 번의 쓰기로 텍스트 스트림에 기록합니다. 터미널에서는 최신 PROGRESS 업데이트가
+    # 출력 아래의 임시 상태 라인으로 표시됩니다.
+    """
+    def __init__(self, stream: TextIO, hidden_levels=(), color: bool = False, interactive: bool = False):
+        self.stream = stream
+        self.hidden_levels = frozenset(hidden_levels)
+        self.color = color
+        self.interactive = interactive
+        self.progress_text = ''
+        self._progress_shown = False
+
+    def write(self, entries: List[Tuple[str, str]], progress_text: Optional[str] = None):
+        parts = []
+        if self._progress_shown:
+            parts.append('\r\x1b[K')
+            self._progress_shown = False
+        hidden, color = self.hidden_levels, self.color
+        for message, level in entries:
+            if level in hidden:
+                continue
+            code = LEVEL_ANSI.get(level) if color else None
+            parts.append(f"\x1b[{code}m{message}\x1b[0m\n" if code else message + '\n')
+        if progress_text is not None:
+            self.progress_text = progress_text
+        if self.interactive and self.progress_text and 'PROGRESS' not in hidden:
+            parts.append(self.progress_text)
+            self._progress_shown = True
+        if parts:
+            self.stream.write(''.join(parts))
+            self.stream.flush()
+
+    def close(self):
+        if self._progress_shown:
+            self.stream.write('\r\x1b[K')
+            self.stream.flush()
+            self._progress_shown = False
+
+def run(args: argparse.Namespace) -> int:
+    """
+    # Runs args.script to completion and returns its exit code (2 if it could not be started).
+    # args.script를 끝까지 실행하고 종료 코드를 반환합니다 (시작할 수 없으면 2).
+    """
+    try:
+        command, cwd, note, is_warning = resolve_command(args.script)
+        log_path = None if args.no_file else new_log_file_path(args.log_dir)
+    except EngineError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    if note and not args.quiet:
+        print(note, file=sys.stderr)
+
+    levels = list(DefaultTheme.LOG_LEVEL_COLORS) + list(load_custom_logs(args.data_dir))
+    ingestor = LogIngestor(LevelClassifier(levels))
+    hidden = {level.strip().upper() for value in args.hide for level in value.split(',') if level.strip()}
+    use_color = args.color == 'always' or (args.color == 'auto' and sys.stdout.isatty() and 'NO_COLOR' not in os.environ)
+    output = TerminalOutput(sys.stdout, hidden, color=use_color, interactive=sys.stdout.isatty())
+    try:
+        writer = LogWriter(log_path) if log_path else None
+    except OSError as e:
+        print(f"Error opening log file: {e}", file=sys.stderr)
+        return 2
+
+    # On Windows every pipe has its own reader thread, so batches are applied one at a time.
+    # Windows에서는 파이프마다 리더 스레드가 있으므로, 배치를 한 번에 하나씩 적용합니다.
+    lock = threading.RLock()
+    def apply(batch):
+        with lock:
+            entries, progress_text = ingestor.ingest(batch)
+            if writer is not None:
+                writer.write_lines([message for message, _ in entries])
+            output.write(entries, progress_text)
+
+    script_run = ScriptRun(command, cwd=cwd, data_dir=Path(args.data_dir),
+                           pause_flag_path=Path(args.data_dir) / "pause.flag")
+    try:
+        with lock:
+            script_run.start(lambda lines: apply([(line, None) for line in lines]))
+            apply([("Process started.", 'SYSTEM')])
+        # Wait in short steps so Ctrl+C is handled promptly on every platform.
+        # 모든 플랫폼에서 Ctrl+C가 즉시 처리되도록 짧은 간격으로 기다립니다.
+        while (returncode := script_run.wait(0.25)) is None:
+            pass
+    except EngineError as e:
+        print(e, file=sys.stderr)
+        returncode = 2
+    except KeyboardInterrupt:
+        message = script_run.kill()
+        returncode = script_run.wait()
+        if not args.quiet:
+            print(f"\n{message}", file=sys.stderr)
+    finally:
+        output.close()
+        if writer is not None:
+            writer.close()
+            if writer.error:
+                print(f"Error writing to log file: {writer.error}", file=sys.stderr)
+    if not args.quiet:
+        print(f"Process finished with exit code {returncode}." + (f" Log: {log_path}" if log_path else ""), file=sys.stderr)
+    return returncode
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m code.cli", description="Headless Log Viewer runner.")
+    subcommands = parser.add_subparsers(dest="command", required=True)
+    run_parser = subcommands.add_parser("run", help="Run a script and stream its classified output.")
+    run_parser.add_argument("script", help="Script path, or a full command line in quotes.")
+    run_parser.add_argument("--log-dir", default=str(LOG_DIR), help="Directory for the log_viewer_<timestamp>.log file.")
+    run_parser.add_argument("--data-dir", default=str(DATA_DIR), help="Data directory passed to the script (pause flag, custom_logs.json).")
+    run_parser.add_argument("--hide", action="append", default=[], metavar="LEVEL[,LEVEL...]", help="Do not print these levels (they are still logged to the file).")
+    run_parser.add_argument("--color", choices=("auto", "always", "never"), default="auto", help="Color the output by level.")
+    run_parser.add_argument("--no-file", action="store_true", help="Do not write a log file.")
+    run_parser.add_argument("--quiet", action="store_true", help="Only print the script output.")
+    return parser
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    # Command-line entry point.
+    # 명령줄 진입점입니다.
+    """
+    args = build_parser().parse_args(argv)
+    if hasattr(sys.stdout, 'reconfigure'):
+        sys.stdout.reconfigure(errors='replace')
+    return run(args)
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,102 @@
+"""
+# Log level classification for the logging GUI application.
+# 로깅 GUI 애플리케이션을 위한 로그 레벨 분류 모듈입니다.
+
+# The classifier is compiled once from the active theme's levels (plus custom levels)
+# and shared by live ingest, log file loading and the editor window.
+# 분류기는 현재 테마의 레벨(및 사용자 정의 레벨)로 한 번만 컴파일되며,
+# 실시간 수집, 로그 파일 로드, 에디터 창에서 공유됩니다.
+"""
+
+import re
+from typing import Iterable, Optional
+
+# Matches the leading "[HH:MM:SS] [LEVEL] " header written by the viewer and the test surrogates.
+# 뷰어와 테스트 대리 스크립트가 기록하는 선행 "[HH:MM:SS] [LEVEL] " 헤더와 일치합니다.
+HEADER_PATTERN = re.compile(r'^\s*\[\d{2}:\d{2}:\d{2}\]\s*\[[A-Z_]+\]\s*')
+
+class LevelClassifier:
+    """
+    # Classifies log lines by level, parsing the leading tokens by slicing before falling back to a precompiled regex.
+    # 선행 토큰을 문자열 슬라이싱으로 먼저 파싱하고, 실패하면 미리 컴파일된 정규식으로 로그 라인의 레벨을 분류합니다.
+    """
+    def __init__(self, levels: Iterable[str], default: str = 'INFO'):
+        """
+        # Initializes the classifier.
+        # 분류기를 초기화합니다.
+
+        # Args:
+        #     levels (Iterable[str]): The known log level names (e.g., theme.LOG_LEVEL_COLORS keys).
+        #                             (알려진 로그 레벨 이름, 예: theme.LOG_LEVEL_COLORS의 키)
+        #     default (str): The level returned when no known level is found.
+        #                    (알려진 레벨을 찾지 못했을 때 반환할 레벨)
+        """
+        self.levels = frozenset(level.upper() for level in levels)
+        self.default = default
+        alternation = "|".join(re.escape(level) for level in sorted(self.levels, key=len, reverse=True))
+        self._level_pattern = re.compile(rf"\[({alternation})\]", re.I) if alternation else None
+
+    def classify(self, text: str) -> str:
+        """
+        # Returns the log level of a line.
+        # 한 라인의 로그 레벨을 반환합니다.
+        """
+        level = self.fast_level(text)
+        if level is not None:
+            return level
+        return self.regex_level(text)
+
+    def fast_level(self, text: str) -> Optional[str]:
+        """
+        # Parses a leading "[HH:MM:SS] [LEVEL]" or "[LEVEL]" header with plain string slicing.
+        # 선행 "[HH:MM:SS] [LEVEL]" 또는 "[LEVEL]" 헤더를 일반 문자열 슬라이싱으로 파싱합니다.
+
+        # Returns:
+        #     Optional[str]: The level, or None if the header is not recognized.
+        #                    (레벨. 헤더를 인식하지 못하면 None)
+        """
+        start = 0
+        if text[:1] != '[':
+            text = text.lstrip()
+            if text[:1] != '[':
+                return None
+        end = text.find(']', 1)
+        if end == -1:
+            return None
+        if end == 9 and text[3] == ':' and text[6] == ':':
+            start = end + 1
+            while text[start:start + 1] == ' ':
+                start += 1
+            if text[start:start + 1] != '[':
+                return None
+            end = text.find(']', start + 1)
+            if end == -1:
+                return None
+        token = text[start + 1:end]
+        if token in self.levels:
+            return token
+        token = token.upper()
+        return token if token in self.levels else None
+
+    def regex_level(self, text: str) -> str:
+        """
+        # Searches the whole line for a known "[LEVEL]" token using the precompiled pattern.
+        # 미리 컴파일된 패턴으로 라인 전체에서 알려진 "[LEVEL]" 토큰을 검색합니다.
+        """
+        if self._level_pattern is None:
+            return self.default
+        match = self._level_pattern.search(text)
+        return match.group(1).upper() if match else self.default
+
+    @staticmethod
+    def strip_header(text: str) -> str:
+        """
+        # Removes the leading "[HH:MM:SS] [LEVEL] " header from a line, leaving only the message body.
+        # 라인에서 선행 "[HH:MM:SS] [LEVEL] " 헤더를 제거하고 메시지 본문만 남깁니다.
+        """
+        if text[:1] == '[' and text[9:12] == '] [' and text[3] == ':' and text[6] == ':':
+            end = text.find(']', 12)
+            level = text[12:end]
+            if end != -1 and level.replace('_', '').isalpha() and level.isupper() and text[1:9].replace(':', '').isdigit():
+                return text[end + 1:].lstrip()
+        return HEADER_PATTERN.sub('', text, count=1)
@@ -79,3 +79,206 @@ INTERPRETER_MAP = load_json_config(_interpreter_json_path, {})
 
 if not INTERPRETER_MAP:
     print(f"Warning: '{_interpreter_json_path}' not found or invalid. Interpreters will not be mapped automatically.")
+
+# --- Ingest Configuration (수집 설정) ---
+
+# Maximum number of queued log lines applied to the log area in a single UI tick.
+# 한 번의 UI 틱에서 로그 영역에 반영되는 최대 로그 라인 수입니다.
+INGEST_MAX_LINES_PER_TICK = 5000
+
+# Time budget (ms) for draining the log queue in a single UI tick.
+# 한 번의 UI 틱에서 로그 큐를 비우는 데 사용할 수 있는 시간 예산(ms)입니다.
+INGEST_TIME_BUDGET_MS = 30
+
+# Maximum number of display updates per second. Reader threads wake the UI when output arrives, and bursts are
+# coalesced into frames at most this often; a silent child causes no wakeups at all.
+# 초당 최대 화면 갱신 횟수입니다. 출력이 도착하면 리더 스레드가 UI를 깨우고, 연속된 출력은 최대 이 빈도의
+# 프레임으로 병합됩니다. 자식 프로세스가 조용하면 깨우기가 전혀 발생하지 않습니다.
+INGEST_MAX_FPS = 30
+
+# Maximum number of lines waiting in the ingest queue between the reader threads and the display.
+# 리더 스레드와 화면 사이의 수집 큐에서 대기할 수 있는 최대 라인 수입니다.
+INGEST_QUEUE_MAX_LINES = 200_000
+
+# What happens when the child writes faster than the display keeps up and the ingest queue is full:
+# 'block' (pause reading, so the child blocks on its pipe), 'drop' (discard and count), or 'disk' (write to the log file only, displaying a sample).
+# 자식이 화면보다 빠르게 출력하여 수집 큐가 가득 찼을 때의 동작입니다:
+# 'block'(읽기를 멈춰 자식이 파이프에서 대기), 'drop'(버리고 개수 집계), 'disk'(로그 파일에만 기록하고 일부만 표시).
+INGEST_OVERFLOW_POLICY = 'block'
+
+# With the 'disk' policy, one of every N overflowing lines is still displayed.
+# 'disk' 정책에서 넘치는 라인 N개 중 하나는 계속 화면에 표시됩니다.
+INGEST_SAMPLE_EVERY = 100
+
+# With the 'disk' policy, the most lines (displayed or not) that overflow items may hold for the log file; beyond it
+# the reader thread waits as with 'block', so sustained overload cannot grow the queue without limit.
+# 'disk' 정책에서 오버플로 항목이 로그 파일용으로 보유할 수 있는 최대 라인 수입니다 (표시 여부와 무관). 이를 넘으면
+# 'block'처럼 리더 스레드가 대기하므로, 지속적인 과부하에도 큐가 무한히 커지지 않습니다.
+INGEST_DISK_HELD_MAX_LINES = 2_000_000
+
+# --- Log View Configuration (로그 뷰 설정) ---
+
+# Maximum number of log lines held by the log area at once (visible window plus margins).
+# 로그 영역이 한 번에 보유하는 최대 로그 라인 수입니다 (보이는 창과 여백 포함).
+VIEW_WINDOW_LINES = 600
+
+# Number of lines rendered above the first visible line; the window is re-centred when scrolling gets closer than half of this.
+# 첫 번째로 보이는 라인 위에 렌더링되는 라인 수입니다. 스크롤이 이 값의 절반보다 가까워지면 창을 다시 배치합니다.
+VIEW_WINDOW_MARGIN = 150
+
+# Upper bound on the rows scanned for one window when hidden (elided) levels leave few visible lines.
+# 숨겨진(elide) 레벨 때문에 보이는 라인이 적을 때 한 창에 대해 스캔하는 최대 행 수입니다.
+VIEW_WINDOW_MAX_ROWS = 10000
+
+# --- Search Configuration (검색 설정) ---
+
+# Delay after the last keystroke before a search starts.
+# 마지막 키 입력 후 검색이 시작되기까지의 지연 시간입니다.
+SEARCH_DEBOUNCE_MS = 150
+
+# Interval at which the GUI checks for the result of a running background search.
+# GUI가 실행 중인 백그라운드 검색의 결과를 확인하는 간격입니다.
+SEARCH_POLL_INTERVAL_MS = 30
+
+# --- Log Writer Configuration (로그 기록기 설정) ---
+
+# Durability of the run log file: 'none' (flush on close only), 'flush' (hand data to the OS every interval)
+# or 'fsync' (force data to disk every interval).
+# 실행 로그 파일의 내구성입니다: 'none'(닫을 때만 플러시), 'flush'(주기마다 OS에 전달),
+# 'fsync'(주기마다 디스크에 강제 기록).
+LOG_WRITER_DURABILITY = 'flush'
+
+# Interval between flushes (or fsyncs) while the writer thread has unsynced data.
+# 쓰기 스레드에 동기화되지 않은 데이터가 있을 때 플러시(또는 fsync) 간격입니다.
+LOG_WRITER_FLUSH_INTERVAL_MS = 250
+
+# Size of the log file write buffer.
+# 로그 파일 쓰기 버퍼의 크기입니다.
+LOG_WRITER_BUFFER_BYTES = 1024 * 1024
+
+# Interval at which the writer throughput and backlog are refreshed in the status bar.
+# 상태 표시줄의 쓰기 처리량과 백로그가 갱신되는 간격입니다.
+LOG_WRITER_STATUS_INTERVAL_MS = 1000
+
+# --- Process Output Reader Configuration (프로세스 출력 리더 설정) ---
+
+# Maximum number of bytes read from a child process pipe per os.read call.
+# os.read 호출마다 자식 프로세스 파이프에서 읽는 최대 바이트 수입니다.
+READER_CHUNK_BYTES = 64 * 1024
+
+# --- Log File Index Configuration (로그 파일 인덱스 설정) ---
+
+# Size of the blocks in which an opened log file is scanned by the background indexer.
+# 백그라운드 인덱서가 열린 로그 파일을 스캔하는 블록의 크기입니다.
+INDEX_CHUNK_BYTES = 8 * 1024 * 1024
+
+# Size of the end of a log file that is indexed and shown first when more than this remains to be scanned;
+# the rest of the file is then filled in above it. 0 always indexes from the start.
+# 스캔할 양이 이보다 많을 때 먼저 인덱싱되어 표시되는 로그 파일 끝부분의 크기입니다. 나머지 부분은 그 위로
+# 채워집니다. 0이면 항상 처음부터 인덱싱합니다.
+INDEX_TAIL_BYTES = 1024 * 1024
+
+# Interval at which newly indexed lines are published to the log view while a file is being indexed.
+# 파일을 인덱싱하는 동안 새로 인덱싱된 라인이 로그 뷰에 게시되는 간격입니다.
+INDEX_POLL_INTERVAL_MS = 50
+
+# Directory holding the sidecar indexes of previously opened log files.
+# 이전에 열었던 로그 파일의 사이드카 인덱스를 보관하는 디렉토리입니다.
+INDEX_DIR = DATA_DIR / "log_index"
+
+# Number of bytes hashed at the head and at the end of the indexed range to validate a sidecar index.
+# 사이드카 인덱스를 검증하기 위해 인덱싱된 범위의 앞부분과 끝부분에서 해시하는 바이트 수입니다.
+INDEX_HASH_BYTES = 64 * 1024
+
+# Limits of the sidecar index directory: sidecars unused for longer than INDEX_MAX_AGE_DAYS are deleted, and the least
+# recently used ones are deleted while the total exceeds INDEX_MAX_BYTES. 0 disables a limit.
+# 사이드카 인덱스 디렉토리의 제한입니다: INDEX_MAX_AGE_DAYS보다 오래 사용되지 않은 사이드카는 삭제되며, 전체 크기가
+# INDEX_MAX_BYTES를 넘는 동안 가장 오래전에 사용된 것부터 삭제됩니다. 0이면 해당 제한을 사용하지 않습니다.
+INDEX_MAX_AGE_DAYS = 30
+INDEX_MAX_BYTES = 512 * 1024 * 1024
+
+# --- Undo Configuration (실행 취소 설정) ---
+
+# Maximum number of edits kept in the undo journal; the oldest edits are dropped first.
+# 실행 취소 저널에 보관되는 최대 편집 수입니다. 가장 오래된 편집부터 버려집니다.
+UNDO_MAX_DEPTH = 1000
+
+# Approximate memory budget of the undo journal (the text of the recorded field changes).
+# 실행 취소 저널의 대략적인 메모리 예산입니다 (기록된 필드 변경의 텍스트 기준).
+UNDO_MAX_BYTES = 8 * 1024 * 1024
+
+# --- Save Configuration (저장 설정) ---
+
+# Buffer size of the temporary file written by a save, and the largest block copied from the original file at once.
+# 저장 시 기록되는 임시 파일의 버퍼 크기이자, 원본 파일에서 한 번에 복사하는 최대 블록 크기입니다.
+SAVE_BUFFER_BYTES = 1024 * 1024
+
+# Interval at which the progress of a background save is checked.
+# 백그라운드 저장의 진행률을 확인하는 간격입니다.
+SAVE_POLL_INTERVAL_MS = 50
+
+# Whether every edit journal record is forced to disk (fsync), not only handed to the OS.
+# 편집 저널 기록마다 OS에 넘기는 것뿐만 아니라 디스크에 강제로 기록(fsync)할지 여부입니다.
+EDIT_JOURNAL_FSYNC = True
+
+# --- Scrollback Configuration (스크롤백 설정) ---
+
+# Number of the newest lines of a run whose text is kept in memory; the text of older lines is moved to a spill
+# segment on disk and read back when it is scrolled to or searched. 0 disables the line limit.
+# 실행에서 텍스트를 메모리에 유지하는 최신 라인 수입니다. 더 오래된 라인의 텍스트는 디스크의 스필 세그먼트로
+# 옮겨지고, 스크롤하거나 검색할 때 다시 읽힙니다. 0이면 라인 제한을 사용하지 않습니다.
+SCROLLBACK_MAX_LINES = 500_000
+
+# Memory budget for the text of a run's lines; older text beyond it is spilled to disk. 0 disables the byte limit.
+# 실행 라인 텍스트의 메모리 예산입니다. 이를 넘는 오래된 텍스트는 디스크로 옮겨집니다. 0이면 바이트 제한을 사용하지 않습니다.
+SCROLLBACK_MAX_BYTES = 64 * 1024 * 1024
+
+# Fraction by which a limit may be exceeded before lines are spilled, so spilling happens in large, infrequent steps.
+# 라인을 옮기기 전에 제한을 초과할 수 있는 비율로, 옮기기가 드물게 큰 단위로 일어나도록 합니다.
+SCROLLBACK_SLACK = 0.25
+
+# Directory holding the spill segments of running sessions.
+# 실행 중인 세션의 스필 세그먼트를 보관하는 디렉토리입니다.
+SPILL_DIR = DATA_DIR / "spill"
+
+# --- Instrumentation Configuration (계측 설정) ---
+
+# Number of recent samples per pipeline histogram from which the live percentiles are computed.
+# 실시간 백분위수를 계산하는, 파이프라인 히스토그램별 최근 샘플 수입니다.
+INSTRUMENTATION_WINDOW = 2048
+
+# Window over which the per-second rates of the pipeline meters are averaged.
+# 파이프라인 미터의 초당 속도를 평균하는 구간(초)입니다.
+INSTRUMENTATION_RATE_WINDOW_S = 5
+
+# Refresh interval of the instrumentation overlay while it is shown.
+# 계측 오버레이가 표시되는 동안의 갱신 간격입니다.
+INSTRUMENTATION_REFRESH_MS = 500
+
+# --- Profiling Configuration (프로파일링 설정) ---
+
+# Number of functions (CPU) or allocation sites (memory) listed in the /profile text reports.
+# /profile 텍스트 보고서에 나열되는 함수(CPU) 또는 할당 위치(메모리)의 수입니다.
+PROFILE_TOP_N = 40
+
+# Number of stack frames tracemalloc keeps per allocation; more frames give deeper tracebacks at a higher overhead.
+# tracemalloc이 할당마다 보관하는 스택 프레임 수입니다. 많을수록 추적이 깊어지지만 부하가 커집니다.
+PROFILE_TRACEMALLOC_FRAMES = 10
+
+# --- Watchdog Configuration (감시자 설정) ---
+
+# Whether the UI stall watchdog runs.
+# UI 멈춤 감시자를 실행할지 여부입니다.
+WATCHDOG_ENABLED = True
+
+# Interval at which the Tk loop updates the watchdog heartbeat (and the watchdog checks it).
+# Tk 루프가 감시자 하트비트를 갱신하는 (그리고 감시자가 확인하는) 간격입니다.
+WATCHDOG_INTERVAL_MS = 100
+
+# How late the heartbeat may be before it is reported as a stall, with the Tk thread's stack.
+# 하트비트가 이만큼 늦어지면 Tk 스레드의 스택과 함께 멈춤으로 보고됩니다.
+WATCHDOG_STALL_MS = 500
+
+# Diagnostics log the stalls and their summaries are appended to.
+# 멈춤과 그 요약이 추가되는 진단 로그입니다.
+WATCHDOG_LOG_PATH = LOG_DIR / "ui_stalls.log"
@@ -0,0 +1,103 @@
+import os
+import json
+from typing import List, Optional, Tuple
+from .config import EDIT_JOURNAL_FSYNC
+
+JOURNAL_SUFFIX = '.journal'
+JOURNAL_VERSION = 1
+
+def journal_path(log_path: str) -> str:
+    """
+    # Returns the path of the edit journal kept next to a log file.
+    # 로그 파일 옆에 보관되는 편집 저널의 경로를 반환합니다.
+    """
+    return log_path + JOURNAL_SUFFIX
+
+class EditJournal:
+    """
+    # Append-only, crash-safe record of the edits made to an opened log file since it was last saved.
+    # 열린 로그 파일이 마지막으로 저장된 이후의 편집을 기록하는, 추가 전용의 충돌 안전 기록입니다.
+
+    # The first line is a JSON header with the size and mtime of the log file; every further line is one applied
+    # transition [label, index, current, target] in the diff format of UndoJournal. A torn last line is ignored on load.
+    # 첫 줄은 로그 파일의 크기와 수정 시각을 담은 JSON 헤더이며, 이후 각 줄은 UndoJournal의 diff 형식으로 된
+    # 적용된 전환 [label, index, current, target] 하나입니다. 로드 시 잘린 마지막 줄은 무시됩니다.
+    """
+    def __init__(self, log_path: str, fsync: bool = EDIT_JOURNAL_FSYNC):
+        """
+        # Prepares the journal of a log file. The journal file is only (re)created by the first append().
+        # 로그 파일의 저널을 준비합니다. 저널 파일은 첫 append() 때만 (다시) 생성됩니다.
+        """
+        self.log_path = log_path
+        self.path = journal_path(log_path)
+        self.fsync = fsync
+        self.file = None
+        self.error: Optional[OSError] = None
+
+    def append(self, label: str, index: int, current: Optional[tuple], target: Optional[tuple]):
+        """
+        # Appends one applied transition and makes it durable before returning.
+        # 적용된 전환 하나를 추가하고, 반환하기 전에 영구적으로 기록합니다.
+        """
+        if self.error is not None:
+            return
+        try:
+            if self.file is None:
+                stat = os.stat(self.log_path)
+                self.file = open(self.path, 'w', encoding='utf-8')
+                self.file.write(json.dumps({'version': JOURNAL_VERSION, 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}) + '\n')
+            self.file.write(json.dumps([label, index, current, target], ensure_ascii=False) + '\n')
+            self.file.flush()
+            if self.fsync:
+                os.fsync(self.file.fileno())
+        except OSError as e:
+            self.error = e
+
+    def close(self):
+        """
+        # Closes the journal file and keeps it, so the edits can be recovered when the log is opened again.
+        # 저널 파일을 닫고 보존하여, 로그를 다시 열 때 편집을 복구할 수 있게 합니다.
+        """
+        file, self.file = self.file, None
+        if file is not None:
+            try: file.close()
+            except OSError: pass
+
+    def discard(self):
+        """
+        # Closes and deletes the journal file, e.g. after the edits were saved or abandoned.
+        # 저널 파일을 닫고 삭제합니다. 예: 편집이 저장되었거나 폐기된 후.
+        """
+        self.close()
+        try: os.remove(self.path)
+        except FileNotFoundError: pass
+        except OSError as e: self.error = e
+
+    @staticmethod
+    def load(log_path: str) -> Optional[List[Tuple[str, int, Optional[tuple], Optional[tuple]]]]:
+        """
+        # Reads the journaled transitions of a log file.
+        # 로그 파일의 저널에 기록된 전환들을 읽습니다.
+
+        # Returns:
+        #     list | None: The transitions, or None if there is no journal or it belongs to another version of the file.
+        #                  (전환 목록. 저널이 없거나 파일의 다른 버전에 속하면 None)
+        """
+        try:
+            with open(journal_path(log_path), encoding='utf-8') as f:
+                lines = f.read().split('\n')
+            header = json.loads(lines[0])
+            stat = os.stat(log_path)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(header, dict) or header.get('version') != JOURNAL_VERSION or \
+                header.get('size') != stat.st_size or header.get('mtime_ns') != stat.st_mtime_ns:
+            return None
+        records = []
+        for line in lines[1:]:
+            try:
+                label, index, current, target = json.loads(line)
+            except (ValueError, TypeError):
+                break
+            records.append((label, index, tuple(current) if current is not None else None, tuple(target) if target is not None else None))
+        return records
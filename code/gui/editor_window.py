@@ -1,8 +1,6 @@
 
 import tkinter as tk
 from tkinter import Button, Label
-import re
-import copy
 from datetime import datetime
 from typing import TYPE_CHECKING
 from .gui_widgets import StyledButton
@@ -138,7 +136,7 @@ class EditorWindow(tk.Toplevel):
             # Edit mode: Fill with existing log data.
             # 편집 모드: 기존 로그 데이터로 채웁니다.
             original_log = self.master_app.all_logs[log_index]
-            message_only = re.sub(r'^\s*\[\d{2}:\d{2}:\d{2}\]\s*\[[A-Z_]+\]\s*', '', original_log['message'])
+            message_only = self.master_app.level_classifier.strip_header(original_log['message'])
             self.editor_text.delete(1.0, tk.END)
             self.editor_text.insert(tk.END, message_only)
             self.selected_level_var.set(original_log.get('level', 'COMMENT'))
@@ -200,6 +198,9 @@ class EditorWindow(tk.Toplevel):
         # Saves the current content of the editor and closes the window.
         # 에디터의 현재 내용을 저장하고 창을 닫습니다.
         """
+        if self.master_app.log_saver is not None:
+            self.master_app.update_status("Cannot edit while saving.", self.master_app.theme.DISABLED_TEXT_COLOR)
+            return
         content = self.editor_text.get(1.0, tk.END).strip()
         if not content:
             self.master_app.update_status("Editor content is empty.", self.master_app.theme.LOG_LEVEL_COLORS['DELETED'])
@@ -215,22 +216,21 @@ class EditorWindow(tk.Toplevel):
             # 'Add' 모드일 경우, 새 로그 항목을 생성하고 메인 로그 목록에 삽입합니다.
             new_log = {'message': formatted_message, 'level': selected_level, 'state': 'ADDED'}
             insert_pos = self.master_app.selected_log_abs_index + 1 if self.master_app.selected_log_abs_index is not None else len(self.master_app.all_logs)
-            self.master_app.all_logs.insert(insert_pos, new_log)
-            self.master_app._record_action('add', {'line_num': insert_pos, 'log_entry': new_log})
+            self.master_app.all_logs.insert(insert_pos, **new_log)
+            self.master_app._record_action('add', insert_pos, None, new_log)
             self.master_app.update_status("New log entry added.", self.master_app.theme.LOG_LEVEL_COLORS['ADDED'])
         else:
             # In 'Edit' mode, update the existing log entry.
             # 'Edit' 모드일 경우, 기존 로그 항목을 업데이트합니다.
             if self.current_log_index is not None and 0 <= self.current_log_index < len(self.master_app.all_logs):
                 line_num = self.current_log_index
-                original_log = copy.deepcopy(self.master_app.all_logs[line_num])
-                self.master_app.all_logs[line_num].update({'message': formatted_message, 'level': selected_level, 'state': 'MODIFIED'})
-                self.master_app._record_action('edit', {'line_num': line_num, 'original_log': original_log})
+                original_log = self.master_app.all_logs[line_num]
+                self.master_app.all_logs.update(line_num, message=formatted_message, level=selected_level, state='MODIFIED')
+                self.master_app._record_action('edit', line_num, original_log, self.master_app.all_logs[line_num])
                 self.master_app.update_status(f"Log line {line_num + 1} updated.", self.master_app.theme.LOG_LEVEL_COLORS['MODIFIED'])
             else:
                 self.master_app.update_status("Error: Log to edit no longer exists.", self.master_app.theme.LOG_LEVEL_COLORS['DELETED'])
         
-        self.master_app._perform_search_and_filter_logs(scroll_to_end=False)
         self.close_window()
 
     def _show_log_level_picker(self, event):
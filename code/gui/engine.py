@@ -0,0 +1,255 @@
+"""
+# Tk-free run engine shared by the GUI and the command-line runner.
+# GUI와 명령줄 실행기가 공유하는, Tk에 의존하지 않는 실행 엔진입니다.
+
+# It resolves the interpreter of a script, names the run log file, starts, pauses and kills the child process,
+# reads its output at pipe speed and turns raw lines into classified log entries with PROGRESS updates collapsed.
+# 스크립트의 인터프리터를 결정하고, 실행 로그 파일의 이름을 정하며, 자식 프로세스를 시작, 일시정지, 종료하고,
+# 출력을 파이프 속도로 읽어 PROGRESS 업데이트가 정리된 분류된 로그 항목으로 변환합니다.
+"""
+
+import os
+import re
+import sys
+import json
+import shlex
+import shutil
+import subprocess
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, List, Optional, Sequence, Tuple
+from .config import INTERPRETER_MAP, DATA_DIR, PAUSE_FLAG_PATH
+from .classifier import LevelClassifier
+from .stream_reader import ChunkedStreamReader
+
+# Lines announcing a pause or resume do not end a pending PROGRESS line.
+# 일시정지나 재개를 알리는 라인은 대기 중인 PROGRESS 라인을 끝내지 않습니다.
+PAUSE_RESUME_PATTERN = re.compile(r'\b(resumed|paused)\b', re.I)
+
+class EngineError(Exception):
+    """
+    # A run could not be prepared or started; the message is meant for the user.
+    # 실행을 준비하거나 시작할 수 없습니다. 메시지는 사용자에게 보여 주기 위한 것입니다.
+    """
+
+def load_custom_logs(data_dir: Path = DATA_DIR) -> dict:
+    """
+    # Loads the custom log level definitions ({level: color}) from custom_logs.json.
+    # custom_logs.json에서 사용자 정의 로그 레벨 정의({레벨: 색상})를 로드합니다.
+    """
+    try:
+        custom_log_file = Path(data_dir) / "custom_logs.json"
+        if custom_log_file.exists():
+            with open(custom_log_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+    except (json.JSONDecodeError, IOError) as e:
+        print(f"Error loading custom_logs.json: {e}")
+    return {}
+
+def resolve_command(command_input: str) -> Tuple[List[str], Optional[str], str, bool]:
+    """
+    # Turns a script path (or a full command line) into the command to run, using INTERPRETER_MAP by file extension.
+    # 스크립트 경로(또는 전체 명령줄)를 파일 확장자별 INTERPRETER_MAP을 사용해 실행할 명령으로 변환합니다.
+
+    # Returns:
+    #     tuple: (command, cwd, note, is_warning). cwd is the script's directory, or None (the current directory) for a
+    #            command line; note describes how the command was chosen ('' for a command line).
+    #            ((명령, 작업 디렉토리, 설명, 경고 여부). 작업 디렉토리는 스크립트의 디렉토리이며 명령줄이면 None
+    #            (현재 디렉토리). 설명은 명령이 어떻게 선택되었는지를 나타냄, 명령줄이면 '')
+
+    # Raises:
+    #     EngineError: If the script or its interpreter cannot be found. (스크립트나 인터프리터를 찾을 수 없는 경우)
+    """
+    command_input = command_input.strip()
+    if not command_input:
+        raise EngineError("Script path is empty.")
+    script_path = Path(command_input)
+    if ' ' in command_input and not script_path.exists():
+        return shlex.split(command_input), None, "", False
+    if not script_path.is_file():
+        raise EngineError(f"Script not found at {command_input}")
+
+    # The child runs in the script's directory, so a relative path would no longer point at the script.
+    # 자식은 스크립트의 디렉토리에서 실행되므로, 상대 경로는 더 이상 스크립트를 가리키지 않습니다.
+    script_path = script_path.resolve()
+    cwd = str(script_path.parent)
+    ext = script_path.suffix.lower()
+    interpreter_config = INTERPRETER_MAP.get(ext)
+    if ext == '.py':
+        # Special handling for Python to check for 'python3' or 'python'
+        # 'python3' 또는 'python'을 확인하기 위한 Python 특별 처리
+        interpreter_path = shutil.which("python3") or shutil.which("python")
+        if not interpreter_path:
+            raise EngineError("'python' or 'python3' not found in PATH.")
+        return [interpreter_path, str(script_path)], cwd, f"Found interpreter '{os.path.basename(interpreter_path)}' for '.py' file.", False
+    if interpreter_config:
+        # Standard handling for other interpreters like 'go run', 'java -jar'
+        # 'go run', 'java -jar'와 같은 다른 인터프리터를 위한 표준 처리
+        base_command = interpreter_config[0]
+        interpreter_path = shutil.which(base_command)
+        if not interpreter_path:
+            raise EngineError(f"Interpreter '{base_command}' not found in PATH.")
+        return [interpreter_path] + interpreter_config[1:] + [str(script_path)], cwd, f"Found interpreter '{base_command}' for '{ext}' file.", False
+    if os.access(script_path, os.X_OK):
+        # Fallback for executable files with no mapped interpreter
+        # 매핑된 인터프리터가 없는 실행 파일에 대한 폴백
+        return [str(script_path)], cwd, "No interpreter mapped. Attempting to run file directly.", True
+    raise EngineError("Unknown file type and no execute permission.")
+
+def new_log_file_path(log_dir: str) -> str:
+    """
+    # Creates log_dir if needed and returns the path of a new run log file, log_viewer_<YYYYmmdd_HHMMSS>.log.
+    # 필요하면 log_dir을 만들고 새 실행 로그 파일의 경로 log_viewer_<YYYYmmdd_HHMMSS>.log를 반환합니다.
+
+    # Raises:
+    #     EngineError: If the directory cannot be created. (디렉토리를 만들 수 없는 경우)
+    """
+    if not Path(log_dir).is_dir():
+        try: os.makedirs(log_dir, exist_ok=True)
+        except OSError as e: raise EngineError(f"Cannot create log directory: {e}") from e
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    return os.path.join(log_dir, f"log_viewer_{timestamp}.log")
+
+class LogIngestor:
+    """
+    # Classifies raw output lines and collapses PROGRESS updates: only the latest one is shown as a status line, and it
+    # is kept in the log as an INFO entry once a regular line follows it.
+    # 원시 출력 라인을 분류하고 PROGRESS 업데이트를 정리합니다. 가장 최근 것만 상태 라인으로 표시되며, 이후 일반
+    # 라인이 오면 INFO 항목으로 로그에 남습니다.
+    """
+    def __init__(self, classifier: Optional[LevelClassifier] = None):
+        self.classifier = classifier
+        self.last_progress_message = None
+
+    def reset(self):
+        self.last_progress_message = None
+
+    def ingest(self, batch: Sequence[Tuple[str, Optional[str]]], paused: bool = False) -> Tuple[List[Tuple[str, str]], Optional[str]]:
+        """
+        # Processes a batch of (message, level or None) pairs; lines without a level are classified.
+        # (메시지, 레벨 또는 None) 쌍의 배치를 처리합니다. 레벨이 없는 라인은 분류됩니다.
+
+        # Returns:
+        #     tuple: (entries, progress_text). entries are (message, level) pairs for the log; progress_text is the
+        #            new status line, '' to clear it, or None if unchanged.
+        #            ((항목, 진행 텍스트). 항목은 로그용 (메시지, 레벨) 쌍이며, 진행 텍스트는 새 상태 라인,
+        #            지울 때는 '', 변경이 없으면 None)
+        """
+        classify = self.classifier.classify
+        entries = []
+        progress_text = None
+        for msg_text, level in batch:
+            level = level or classify(msg_text)
+            if level == 'PROGRESS':
+                progress_text = msg_text.replace('\r', '').strip()
+                self.last_progress_message = msg_text
+                continue
+            if self.last_progress_message:
+                is_resume_or_pause_message = bool(PAUSE_RESUME_PATTERN.search(msg_text))
+                if not paused and not is_resume_or_pause_message:
+                    final_message = self.last_progress_message.replace('\r', '').strip()
+                    entries.append((final_message, 'INFO'))
+                    self.last_progress_message = None
+                    progress_text = ""
+            entries.append((msg_text, level))
+        return entries, progress_text
+
+class ScriptRun:
+    """
+    # One run of a monitored script: the child process, the thread reading its output and the pause flag file.
+    # 모니터링되는 스크립트의 한 번의 실행입니다: 자식 프로세스, 출력을 읽는 스레드, 일시정지 플래그 파일.
+    """
+    def __init__(self, command: List[str], cwd: Optional[str] = None, data_dir: Path = DATA_DIR, pause_flag_path: Path = PAUSE_FLAG_PATH):
+        """
+        # Prepares a run. '--data-dir <data_dir>' is appended to the command unless it already has one, so the child
+        # finds the pause flag.
+        # 실행을 준비합니다. 명령에 '--data-dir'이 없으면 '--data-dir <data_dir>'를 덧붙여 자식이 일시정지 플래그를
+        # 찾을 수 있게 합니다.
+        """
+        self.command = list(command)
+        if "--data-dir" not in self.command:
+            self.command.extend(["--data-dir", str(data_dir)])
+        self.cwd = cwd
+        self.pause_flag_path = pause_flag_path
+        self.process: Optional[subprocess.Popen] = None
+        self.returncode: Optional[int] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def pid(self) -> Optional[int]:
+        return self.process.pid if self.process is not None else None
+
+    def is_alive(self) -> bool:
+        return self.process is not None and self.process.poll() is None
+
+    def start(self, sink: Callable[[List[str]], None], on_exit: Optional[Callable[[int], None]] = None):
+        """
+        # Starts the child process and a thread that passes its output to sink(lines) and calls on_exit(returncode) at the end.
+        # 자식 프로세스와, 그 출력을 sink(lines)로 전달하고 끝나면 on_exit(returncode)를 호출하는 스레드를 시작합니다.
+
+        # sink runs on the reader thread; blocking in it blocks reading (and eventually the child on its pipe).
+        # sink는 리더 스레드에서 실행되며, 그 안에서 블로킹하면 읽기가 (결국 파이프의 자식도) 블로킹됩니다.
+
+        # Raises:
+        #     EngineError: If the process cannot be started. (프로세스를 시작할 수 없는 경우)
+        """
+        self.resume()
+        try:
+            self.process = subprocess.Popen(
+                self.command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, bufsize=0,
+                creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0,
+                cwd=self.cwd
+            )
+        except (OSError, ValueError) as e:
+            raise EngineError(f"Error starting process: {e}") from e
+        self._thread = threading.Thread(target=self._read_output, args=(sink, on_exit), name="ScriptRun", daemon=True)
+        self._thread.start()
+
+    def wait(self, timeout: Optional[float] = None) -> Optional[int]:
+        """
+        # Waits until the output is fully read and the process has exited; returns its exit code (None on timeout).
+        # 출력을 모두 읽고 프로세스가 종료될 때까지 기다리고, 종료 코드를 반환합니다 (시간 초과 시 None).
+        """
+        if self._thread is not None:
+            self._thread.join(timeout)
+        return self.returncode
+
+    def kill(self) -> str:
+        """
+        # Kills the process (and, on Windows, its process tree) and returns a status message.
+        # 프로세스(Windows에서는 프로세스 트리)를 종료하고 상태 메시지를 반환합니다.
+        """
+        if not self.is_alive():
+            return "Process is not running."
+        pid = self.process.pid
+        try:
+            subprocess.run(f"taskkill /F /PID {pid} /T", check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, creationflags=subprocess.CREATE_NO_WINDOW)
+            return f"Killed process tree (PID: {pid})."
+        except Exception:
+            self.process.kill()
+            return f"Killed process (PID: {pid}, fallback)."
+
+    def pause(self):
+        """
+        # Creates the pause flag file that the child polls (see _check_pause in the test surrogates).
+        # 자식이 주기적으로 확인하는 일시정지 플래그 파일을 생성합니다 (테스트 대리 스크립트의 _check_pause 참고).
+        """
+        with open(self.pause_flag_path, "w") as f: f.write("paused")
+
+    def resume(self):
+        try:
+            if os.path.exists(self.pause_flag_path): os.remove(self.pause_flag_path)
+        except OSError: pass
+
+    def _read_output(self, sink: Callable[[List[str]], None], on_exit: Optional[Callable[[int], None]]):
+        """
+        # Reader thread: reads the process output until it closes, then waits for the exit code.
+        # 리더 스레드: 프로세스 출력이 닫힐 때까지 읽은 뒤 종료 코드를 기다립니다.
+        """
+        try:
+            ChunkedStreamReader([self.process.stdout, self.process.stderr], sink).run()
+        finally:
+            self.returncode = self.process.wait()
+            if on_exit is not None:
+                on_exit(self.returncode)
@@ -0,0 +1,125 @@
+import time
+import queue
+import threading
+from collections import deque
+from typing import Any, Tuple
+from .config import INGEST_QUEUE_MAX_LINES, INGEST_OVERFLOW_POLICY, INGEST_SAMPLE_EVERY, INGEST_DISK_HELD_MAX_LINES
+
+# Overflow policies: 'block' makes the reader thread wait (backpressure on the child's pipe), 'drop' discards and counts
+# the lines that do not fit, 'disk' still writes them to the log file but only displays every INGEST_SAMPLE_EVERY-th line.
+# 오버플로 정책: 'block'은 리더 스레드를 대기시키고 (자식 파이프에 역압), 'drop'은 들어가지 않는 라인을 버리고 세며,
+# 'disk'는 라인을 로그 파일에는 그대로 기록하되 INGEST_SAMPLE_EVERY번째 라인만 화면에 표시합니다.
+OVERFLOW_POLICIES = ('block', 'drop', 'disk')
+
+class IngestQueue:
+    """
+    # A bounded queue of log output between the reader threads and the UI, sized in lines.
+    # 리더 스레드와 UI 사이의 로그 출력용 제한 큐로, 크기는 라인 수로 정해집니다.
+
+    # Items are (action, data) pairs as put by LogDisplay: ('lines', [str]), ('add', dict) or, for the 'disk' policy,
+    # ('sampled', ([str] for the file, [str] for the display)). 'add' items are never refused or blocked, since they come
+    # from the UI thread itself. depth counts the displayed lines; held counts the file lines of 'sampled' items, which
+    # are limited separately by max_held_lines.
+    # 항목은 LogDisplay가 넣는 (action, data) 쌍입니다: ('lines', [str]), ('add', dict), 그리고 'disk' 정책의 경우
+    # ('sampled', (파일용 [str], 화면용 [str])). 'add' 항목은 UI 스레드 자신이 넣으므로 거부되거나 블로킹되지 않습니다.
+    # depth는 화면에 표시될 라인을 세며, held는 'sampled' 항목의 파일용 라인을 세고 max_held_lines로 따로 제한됩니다.
+    """
+    def __init__(self, max_lines: int = INGEST_QUEUE_MAX_LINES, policy: str = INGEST_OVERFLOW_POLICY, sample_every: int = INGEST_SAMPLE_EVERY,
+                 max_held_lines: int = INGEST_DISK_HELD_MAX_LINES):
+        """
+        # Initializes an empty queue.
+        # 빈 큐를 초기화합니다.
+
+        # Raises:
+        #     ValueError: If the policy is unknown. (알 수 없는 정책인 경우)
+        """
+        if policy not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown ingest overflow policy: {policy}")
+        self.max_lines = max_lines
+        self.policy = policy
+        self.sample_every = max(1, sample_every)
+        self.max_held_lines = max_held_lines
+        self.depth = 0
+        self.held = 0
+        self.dropped = 0
+        self.disk_only = 0
+        self.blocked_seconds = 0.0
+        self._items = deque()
+        self._condition = threading.Condition()
+        self._closed = False
+
+    def put(self, action: str, data: Any) -> bool:
+        """
+        # Queues an item, applying the overflow policy to 'lines' items that do not fit. Returns whether anything was queued.
+        # 항목을 큐에 넣으며, 들어가지 않는 'lines' 항목에는 오버플로 정책을 적용합니다. 무엇이든 큐에 들어갔는지 반환합니다.
+        """
+        size = len(data) if action == 'lines' else 1
+        with self._condition:
+            if action == 'lines' and self.depth and self.depth + size > self.max_lines:
+                if self.policy == 'drop':
+                    self.dropped += size
+                    return False
+                if self.policy == 'disk':
+                    start = time.perf_counter()
+                    while not self._closed and self.held and self.held + size > self.max_held_lines:
+                        self._condition.wait()
+                    self.blocked_seconds += time.perf_counter() - start
+                    sample = data[::self.sample_every]
+                    self.disk_only += size - len(sample)
+                    self.held += size
+                    action, data, size = 'sampled', (data, sample), len(sample)
+                else:
+                    start = time.perf_counter()
+                    while not self._closed and self.depth and self.depth + size > self.max_lines:
+                        self._condition.wait()
+                    self.blocked_seconds += time.perf_counter() - start
+            if self._closed:
+                return False
+            self._items.append((time.monotonic(), action, data, size))
+            self.depth += size
+            return True
+
+    def get_nowait(self) -> Tuple[str, Any]:
+        """
+        # Removes and returns the oldest (action, data) item.
+        # 가장 오래된 (action, data) 항목을 꺼내 반환합니다.
+
+        # Raises:
+        #     queue.Empty: If the queue is empty. (큐가 비어 있는 경우)
+        """
+        with self._condition:
+            if not self._items:
+                raise queue.Empty
+            _, action, data, size = self._items.popleft()
+            self.depth -= size
+            if action == 'sampled':
+                self.held -= len(data[0])
+            self._condition.notify_all()
+            return action, data
+
+    def empty(self) -> bool:
+        return not self._items
+
+    def lag(self) -> float:
+        """
+        # Seconds the oldest queued item has been waiting, i.e. how far the display is behind the child's output.
+        # 가장 오래된 큐 항목이 대기한 시간(초)으로, 화면이 자식 출력보다 얼마나 뒤처졌는지를 나타냅니다.
+        """
+        items = self._items
+        try:
+            return time.monotonic() - items[0][0] if items else 0.0
+        except IndexError:
+            return 0.0
+
+    def close(self):
+        """
+        # Releases blocked producers and refuses further items, e.g. when a new run replaces this queue.
+        # 블로킹된 생산자를 풀어 주고 이후 항목을 거부합니다. 예: 새 실행이 이 큐를 대체할 때.
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+    def stats(self) -> dict:
+        return {'depth': self.depth, 'held': self.held, 'lag': self.lag(), 'dropped': self.dropped, 'disk_only': self.disk_only,
+                'blocked_seconds': self.blocked_seconds, 'policy': self.policy}
@@ -0,0 +1,156 @@
+import time
+import threading
+from bisect import bisect_left
+from collections import deque
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+from .config import INSTRUMENTATION_WINDOW, INSTRUMENTATION_RATE_WINDOW_S
+
+# Upper bounds of the histogram buckets, in the unit of the recorded values (milliseconds for timings, lines for depths).
+# The last bucket is unbounded.
+# 히스토그램 버킷의 상한값으로, 기록되는 값의 단위를 따릅니다 (시간은 밀리초, 깊이는 라인 수). 마지막 버킷은 상한이 없습니다.
+BUCKET_BOUNDS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 10_000, 100_000, 1_000_000)
+
+class Histogram:
+    """
+    # Distribution of a stage measurement: fixed buckets over the whole session plus the most recent samples, from
+    # which the live percentiles are taken.
+    # 단계 측정값의 분포입니다. 세션 전체에 대한 고정 버킷과 최근 샘플을 보관하며, 실시간 백분위수는 최근 샘플에서 구합니다.
+    """
+    def __init__(self, window: int = INSTRUMENTATION_WINDOW):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = [0] * (len(BUCKET_BOUNDS) + 1)
+        self.recent = deque(maxlen=window)
+
+    def observe(self, value: float):
+        self.count += 1
+        self.total += value
+        if value > self.max: self.max = value
+        self.buckets[bisect_left(BUCKET_BOUNDS, value)] += 1
+        self.recent.append(value)
+
+    def snapshot(self) -> dict:
+        recent = sorted(self.recent)
+        def percentile(p):
+            return recent[min(len(recent) - 1, int(p * len(recent)))] if recent else 0.0
+        return {
+            'count': self.count,
+            'mean': self.total / self.count if self.count else 0.0,
+            'max': self.max,
+            'last': self.recent[-1] if self.recent else 0.0,
+            'p50': percentile(0.50),
+            'p90': percentile(0.90),
+            'p99': percentile(0.99),
+            'buckets': {(f"<={bound:g}" if i < len(BUCKET_BOUNDS) else f">{BUCKET_BOUNDS[-1]:g}"): n
+                        for i, (bound, n) in enumerate(zip(BUCKET_BOUNDS + (None,), self.buckets)) if n},
+        }
+
+class Meter:
+    """
+    # A running total with its rate over the last INSTRUMENTATION_RATE_WINDOW_S seconds, counted in one-second slots.
+    # 누적 합계와 최근 INSTRUMENTATION_RATE_WINDOW_S초 동안의 속도로, 1초 단위 슬롯으로 셉니다.
+    """
+    def __init__(self, window_s: int = INSTRUMENTATION_RATE_WINDOW_S):
+        self.total = 0
+        self.window_s = max(1, window_s)
+        self._slots = deque()
+
+    def add(self, n: int, now: float):
+        self.total += n
+        second = int(now)
+        if self._slots and self._slots[-1][0] == second:
+            self._slots[-1][1] += n
+        else:
+            self._slots.append([second, n])
+            while self._slots[0][0] <= second - self.window_s:
+                self._slots.popleft()
+
+    def rate(self, now: float) -> float:
+        """
+        # Average per second over the completed slots of the window (the current, partial second is left out).
+        # 창의 완료된 슬롯에 대한 초당 평균입니다 (진행 중인 현재 초는 제외됩니다).
+        """
+        second = int(now)
+        counted = sum(n for slot, n in self._slots if second - self.window_s <= slot < second)
+        return counted / self.window_s
+
+class PipelineStats:
+    """
+    # Named meters and histograms for the stages of the ingest/render pipeline, shared by the reader, UI and writer threads.
+    # 수집/렌더링 파이프라인 단계별로 이름 붙은 미터와 히스토그램으로, 리더, UI, 쓰기 스레드가 공유합니다.
+
+    # Recording is cheap (one lock per batch, not per line), so it stays on for the whole session.
+    # 기록 비용이 작으므로 (라인이 아닌 배치마다 잠금 한 번) 세션 내내 켜 둡니다.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.started_at = time.monotonic()
+            self.meters: Dict[str, Meter] = {}
+            self.histograms: Dict[str, Histogram] = {}
+
+    def count(self, name: str, n: int = 1):
+        """
+        # Adds n to the meter name, e.g. the lines read from the child.
+        # 미터 name에 n을 더합니다 (예: 자식에서 읽은 라인 수).
+        """
+        with self._lock:
+            meter = self.meters.get(name)
+            if meter is None: meter = self.meters[name] = Meter()
+            meter.add(n, time.monotonic())
+
+    def observe(self, name: str, value: float):
+        """
+        # Records one value (milliseconds for timings) in the histogram name.
+        # 히스토그램 name에 값 하나를 기록합니다 (시간은 밀리초).
+        """
+        with self._lock:
+            histogram = self.histograms.get(name)
+            if histogram is None: histogram = self.histograms[name] = Histogram()
+            histogram.observe(value)
+
+    @contextmanager
+    def timed(self, name: str) -> Iterator[None]:
+        """
+        # Records the duration of the with-block in milliseconds in the histogram name, also when it raises.
+        # with 블록의 소요 시간을 밀리초로 히스토그램 name에 기록하며, 예외가 발생해도 기록합니다.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, (time.perf_counter() - start) * 1000)
+
+    def snapshot(self) -> dict:
+        """
+        # Returns a JSON-serializable copy of every meter and histogram.
+        # 모든 미터와 히스토그램의 JSON 직렬화 가능한 사본을 반환합니다.
+        """
+        with self._lock:
+            now = time.monotonic()
+            return {
+                'uptime_s': now - self.started_at,
+                'meters': {name: {'total': meter.total, 'per_sec': meter.rate(now)} for name, meter in self.meters.items()},
+                'histograms': {name: histogram.snapshot() for name, histogram in self.histograms.items()},
+            }
+
+    def format_table(self, snapshot: Optional[dict] = None) -> str:
+        """
+        # Formats a snapshot as a fixed-width table for the overlay.
+        # 스냅샷을 오버레이용 고정 폭 표로 만듭니다.
+        """
+        snapshot = snapshot or self.snapshot()
+        rows = [f"{'meter':<16}{'per sec':>12}{'total':>14}"]
+        for name, meter in sorted(snapshot['meters'].items()):
+            rows.append(f"{name:<16}{meter['per_sec']:>12,.0f}{meter['total']:>14,}")
+        rows.append("")
+        rows.append(f"{'histogram':<16}{'last':>9}{'p50':>9}{'p99':>9}{'max':>10}{'count':>10}")
+        for name, histogram in sorted(snapshot['histograms'].items()):
+            rows.append(f"{name:<16}{histogram['last']:>9.2f}{histogram['p50']:>9.2f}{histogram['p99']:>9.2f}"
+                        f"{histogram['max']:>10.1f}{histogram['count']:>10,}")
+        return "\n".join(rows)
@@ -1,19 +1,15 @@
 import tkinter as tk
 from tkinter import Button, Checkbutton, Entry, Frame, BooleanVar, Label, filedialog, Canvas, Menu, messagebox
 from tkinter import ttk
-import threading
 import queue
 from datetime import datetime
-import subprocess
 import os
-import sys
 import webbrowser
 import re
-import copy
 from pathlib import Path
 import json
-import shlex
-import shutil
+import time
+from bisect import bisect_left
 
 try:
     from tkinterdnd2 import DND_FILES, TkinterDnD
@@ -22,9 +18,29 @@ except ImportError:
     DND_SUPPORT = False
 
 from .theme import load_themes
-from .config import INTERPRETER_MAP, PAUSE_FLAG_PATH, DATA_DIR, SCRIPT_PATH, LOG_DIR
+from .config import DATA_DIR, SCRIPT_PATH, LOG_DIR
+from .config import INGEST_MAX_LINES_PER_TICK, INGEST_TIME_BUDGET_MS, INGEST_MAX_FPS, LOG_WRITER_STATUS_INTERVAL_MS
+from .config import INDEX_POLL_INTERVAL_MS, SAVE_POLL_INTERVAL_MS
+from .config import SCROLLBACK_MAX_LINES, SCROLLBACK_MAX_BYTES, SCROLLBACK_SLACK
+from .config import INSTRUMENTATION_REFRESH_MS, WATCHDOG_ENABLED
 from .editor_window import EditorWindow
+from .classifier import LevelClassifier
+from .log_view import VirtualLogView
+from .log_store import LogStore, INSERTED, REMOVED, RESET
+from .undo_journal import UndoJournal
+from .search import SearchEngine
+from .log_writer import LogWriter
+from .log_index import LogFileIndexer
+from .edit_journal import EditJournal
+from .log_saver import LogSaver
 from .gui_widgets import StyledButton
+from .ui_wakeup import UiWakeup
+from .ingest_queue import IngestQueue
+from .spill_segment import SpillSegment
+from .instrumentation import PipelineStats
+from .profiler import SessionProfiler, ProfilerError, PROFILE_KINDS
+from .watchdog import StallWatchdog
+from .engine import EngineError, LogIngestor, ScriptRun, load_custom_logs, new_log_file_path, resolve_command
 
 SETTINGS_FILE = DATA_DIR / "gui_settings.json"
 
@@ -35,7 +51,8 @@ class LogDisplay(tk.Frame):
     """
     def __init__(self, master=None, script_path: str = "", log_dir: str = ""):
         self.themes = load_themes()
-        self.custom_logs = self._load_custom_logs()
+        self.custom_logs = load_custom_logs()
+        self.ingestor = LogIngestor()
         self.filterable_log_types = [
             "TRACE", "DEBUG", "INFO", "WARNING", "ERROR", "FATAL", "COMMENT"
         ]
@@ -52,6 +69,7 @@ class LogDisplay(tk.Frame):
 
         self.theme = self.themes[self.theme_name.get()]()
         self.theme.LOG_LEVEL_COLORS.update(self.custom_logs)
+        self._rebuild_level_classifier()
 
         super().__init__(master, bg=self.theme.BG_COLOR)
         self.master = master
@@ -72,28 +90,41 @@ class LogDisplay(tk.Frame):
         if log_dir and not self.log_dir_var.get():
             self.log_dir_var.set(str(LOG_DIR))
 
-        self.all_logs = []; self.undo_stack = []; self.redo_stack = []
+        SpillSegment.remove_stale()
+        self.search_engine = SearchEngine(self)
+        self.all_logs = self._new_log_store(); self.undo_journal = UndoJournal()
+        self.spill_error = None
         self.autocomplete_commands = {'/add': ["TRACE", "DEBUG", "INFO", "WARNING", "ERROR", "FATAL"] + list(self.custom_logs.keys())}
         self.autocomplete_popup = None
-        self.log_queue = queue.Queue()
-        self.last_progress_message = None
+        self.log_queue = IngestQueue()
+        self.ingest_wakeup = UiWakeup(self.master, self.process_log_queue, INGEST_MAX_FPS)
+        self.ingest_stats = {'ticks': 0, 'lines': 0, 'last_tick_lines': 0, 'last_tick_ms': 0.0, 'max_tick_lines': 0, 'max_tick_ms': 0.0}
+        self.pipeline_stats = PipelineStats()
+        self.stats_overlay = None; self._stats_overlay_job = None
+        self.profiler = SessionProfiler()
         self.filter_button_text = tk.StringVar()
         self.filter_popup = None
         self.theme_popup = None
         self.is_running = False; self.is_paused = False; self.log_file_open = False
-        self.think_core_process = None; self.current_log_file_path = None
-        self.log_area_insert_index = None; self.selected_log_line_index = None; self.selected_log_abs_index = None
+        self.log_writer = None; self._writer_bytes_seen = 0; self._run_status_job = None
+        self.file_indexer = None; self._index_published = 0; self._tail_published = False
+        self.edit_journal = None; self._recovered_edits = None; self._restore_view_row = None
+        self.log_saver = None
+        self.undo_journal.on_apply = self._journal_edit
+        self.script_run = None; self.current_log_file_path = None
+        self.log_area_insert_index = None; self.selected_log_line_index = None
         self.log_font_size = 10; self.editor_window_instance = None
         self._animation_ids = {}
         self._is_resetting = False
         
         self.search_var = tk.StringVar()
-        self.search_var.trace_add("write", lambda *args: self._perform_search_and_filter_logs())
+        self.search_var.trace_add("write", lambda *args: self.search_engine.schedule())
         self.case_sensitive_var = tk.BooleanVar(value=False)
-        self.case_sensitive_var.trace_add("write", lambda *args: self._perform_search_and_filter_logs())
+        self.case_sensitive_var.trace_add("write", lambda *args: self.search_engine.schedule())
         self.regex_var = tk.BooleanVar(value=False)
-        self.regex_var.trace_add("write", lambda *args: self._perform_search_and_filter_logs())
+        self.regex_var.trace_add("write", lambda *args: self.search_engine.schedule())
 
+        self.search_matches = []
         self.search_results = []
         self.current_search_index = -1
         self.is_full_screen_log = False
@@ -107,21 +138,17 @@ class LogDisplay(tk.Frame):
         self.script_path_var.trace_add("write", auto_save)
         self.log_dir_var.trace_add("write", auto_save)
         self.master.protocol("WM_DELETE_WINDOW", self._on_closing)
+        self.watchdog = StallWatchdog(self.master) if WATCHDOG_ENABLED else None
+        if self.watchdog is not None: self.watchdog.start()
 
-    def _load_custom_logs(self):
+    def _rebuild_level_classifier(self):
         """
-        # Loads custom log level definitions from a JSON file.
-        # JSON 파일에서 사용자 정의 로그 레벨 정의를 로드합니다.
+        # Rebuilds the shared level classifier from the current theme and custom log levels.
+        # 현재 테마와 사용자 정의 로그 레벨로 공유 레벨 분류기를 다시 생성합니다.
         """
-        try:
-            custom_log_file = DATA_DIR / "custom_logs.json"
-            if custom_log_file.exists():
-                with open(custom_log_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-        except (json.JSONDecodeError, IOError) as e:
-            print(f"Error loading custom_logs.json: {e}")
-        return {}
-    
+        self.level_classifier = LevelClassifier(list(self.theme.LOG_LEVEL_COLORS.keys()) + list(self.custom_logs.keys()))
+        self.ingestor.classifier = self.level_classifier
+
     def _load_settings(self):
         """
         # Loads GUI settings from the settings file.
@@ -191,6 +218,16 @@ class LogDisplay(tk.Frame):
         # 창 닫기 이벤트를 처리하여 설정을 저장합니다.
         """
         self._save_settings()
+        # Write out running profiles rather than losing them with the window.
+        # 실행 중인 프로파일을 창과 함께 잃지 않도록 기록합니다.
+        if self.profiler.active: self._profile_command("stop")
+        if self.watchdog is not None: self.watchdog.stop()
+        self.log_queue.close()
+        if self.log_saver is not None:
+            self.log_saver.cancel()
+        self._close_log_writer()
+        self._close_edit_journal()
+        self._close_file_indexer()
         if self.editor_window_instance and self.editor_window_instance.winfo_exists():
             self.editor_window_instance.destroy()
         self.master.destroy()
@@ -242,6 +279,7 @@ class LogDisplay(tk.Frame):
         self.master.bind_all("<Control-y>", lambda e: self._redo(1))
         self.master.bind_all("<Button-1>", self._on_global_click, add="+ ")
         self.master.bind_all("<Escape>", self._on_escape_key)
+        self.master.bind_all("<F12>", lambda e: self._toggle_stats_overlay())
 
     def _on_escape_key(self, event=None):
         """
@@ -447,9 +485,9 @@ class LogDisplay(tk.Frame):
         self.log_area.grid(row=0, column=0, sticky="nsew")
         self.log_area.bind("<Button-1>", self._handle_log_area_click)
 
-        self.vsb = ttk.Scrollbar(text_sub_frame, orient="vertical", command=self.log_area.yview, style="Custom.Vertical.TScrollbar")
+        self.vsb = ttk.Scrollbar(text_sub_frame, orient="vertical", style="Custom.Vertical.TScrollbar")
         self.vsb.grid(row=0, column=1, sticky="ns")
-        self.log_area.config(yscrollcommand=self.vsb.set)
+        self.log_view = VirtualLogView(self, self.log_area, self.vsb)
         
         self.progress_label = Label(self.log_area_frame, text="", font=(self.theme.FONT_FAMILY_LOG, self.log_font_size), bg=self.theme.LOG_AREA_BG_COLOR, fg=self.theme.LOG_LEVEL_COLORS['PROGRESS'], anchor="w", padx=5)
         self.progress_label.grid(row=1, column=0, sticky="ew")
@@ -486,6 +524,15 @@ class LogDisplay(tk.Frame):
         status_frame = Frame(bottom_frame, bg=self.theme.BG_COLOR); status_frame.grid(row=1, column=0, sticky="e", padx=5, pady=(5,0))
         self.status_canvas = Canvas(status_frame, width=10, height=10, bg=self.theme.BG_COLOR, highlightthickness=0); self.status_canvas.pack(side="left", pady=2)
         self.status_label = Label(status_frame, text="Idle", font=(self.theme.FONT_FAMILY_UI, 9), bg=self.theme.BG_COLOR, fg=self.theme.DISABLED_TEXT_COLOR); self.status_label.pack(side="left", padx=(5,0))
+        # Shown next to the status while a log file is loading; packed and forgotten by _update_load_indicator().
+        # 로그 파일을 로드하는 동안 상태 옆에 표시되며, _update_load_indicator()가 배치하고 숨깁니다.
+        self.load_frame = Frame(status_frame, bg=self.theme.BG_COLOR)
+        self.load_label = Label(self.load_frame, text="", font=(self.theme.FONT_FAMILY_UI, 9), bg=self.theme.BG_COLOR, fg=self.theme.DISABLED_TEXT_COLOR); self.load_label.pack(side="left")
+        self.load_progressbar = ttk.Progressbar(self.load_frame, orient="horizontal", mode="determinate", length=100, maximum=1.0, style="Custom.Horizontal.TProgressbar"); self.load_progressbar.pack(side="left", padx=(5,0))
+        self.load_cancel_label = Label(self.load_frame, text="Cancel", font=(self.theme.FONT_FAMILY_UI, 9, "underline"), bg=self.theme.BG_COLOR, fg=self.theme.ACCENT_COLOR, cursor="hand2"); self.load_cancel_label.pack(side="left", padx=(5,0))
+        self.load_cancel_label.bind("<Button-1>", lambda e: self._cancel_file_load())
+        self.writer_status_label = Label(status_frame, text="", font=(self.theme.FONT_FAMILY_UI, 9), bg=self.theme.BG_COLOR, fg=self.theme.DISABLED_TEXT_COLOR); self.writer_status_label.pack(side="left", padx=(10,0))
+        self.ingest_status_label = Label(status_frame, text="", font=(self.theme.FONT_FAMILY_UI, 9), bg=self.theme.BG_COLOR, fg=self.theme.DISABLED_TEXT_COLOR); self.ingest_status_label.pack(side="left", padx=(10,0))
         self.log_area.tag_bind("FILE_LINK", "<Enter>", self._on_link_enter); self.log_area.tag_bind("FILE_LINK", "<Leave>", self._on_link_leave)
         self.log_area.tag_bind("WEB_LINK", "<Enter>", self._on_link_enter); self.log_area.tag_bind("WEB_LINK", "<Leave>", self._on_link_leave)
         
@@ -539,6 +586,7 @@ class LogDisplay(tk.Frame):
         if new_theme_class:
             self.theme = new_theme_class()
             self.theme.LOG_LEVEL_COLORS.update(self.custom_logs)
+            self._rebuild_level_classifier()
             self._apply_theme()
             if self.editor_window_instance and self.editor_window_instance.winfo_exists():
                 self.editor_window_instance._apply_theme()
@@ -566,6 +614,7 @@ class LogDisplay(tk.Frame):
         style = ttk.Style()
         style.configure("Custom.Vertical.TScrollbar", gripcount=0, background=self.theme.WIDGET_BG_COLOR, darkcolor=self.theme.WIDGET_BG_COLOR, lightcolor=self.theme.WIDGET_BG_COLOR, troughcolor=self.theme.BG_COLOR, bordercolor=self.theme.BG_COLOR, relief="flat", arrowsize=0)
         style.map("Custom.Vertical.TScrollbar", background=[('active', self.theme.ACCENT_COLOR), ('!disabled', self.theme.WIDGET_BG_COLOR)], relief=[('pressed', 'sunken'), ('!pressed', 'flat')])
+        style.configure("Custom.Horizontal.TProgressbar", thickness=6, background=self.theme.ACCENT_COLOR, darkcolor=self.theme.ACCENT_COLOR, lightcolor=self.theme.ACCENT_COLOR, troughcolor=self.theme.WIDGET_BG_COLOR, bordercolor=self.theme.BG_COLOR)
 
         if hasattr(self, 'dnd_overlay'):
             overlay_bg = getattr(self.theme, 'DROP_OVERLAY_BG_COLOR', self.theme.HIGHLIGHT_BG_COLOR)
@@ -610,6 +659,10 @@ class LogDisplay(tk.Frame):
         self.status_label.configure(bg=self.theme.BG_COLOR)
         self.status_canvas.configure(bg=self.theme.BG_COLOR)
         self.status_label.configure(fg=self.theme.DISABLED_TEXT_COLOR)
+        self.writer_status_label.configure(bg=self.theme.BG_COLOR, fg=self.theme.DISABLED_TEXT_COLOR)
+        self.ingest_status_label.configure(bg=self.theme.BG_COLOR, fg=self.theme.DISABLED_TEXT_COLOR)
+        self.load_label.configure(bg=self.theme.BG_COLOR, fg=self.theme.DISABLED_TEXT_COLOR)
+        self.load_cancel_label.configure(bg=self.theme.BG_COLOR, fg=self.theme.ACCENT_COLOR)
         
         self.update_ui_for_state()
         self.configure_tags()
@@ -846,7 +899,7 @@ class LogDisplay(tk.Frame):
 
         def select_all(select=True):
             for var in self.log_filter_vars.values(): var.set(select)
-            self._perform_search_and_filter_logs()
+            self._apply_level_filters()
 
         all_button = tk.Button(controls_frame, text="Select All", command=lambda: select_all(True), bg=DROPDOWN_BG_COLOR, fg=self.theme.TEXT_COLOR, relief="flat", font=(self.theme.FONT_FAMILY_UI, 9), activebackground=DROPDOWN_HOVER_BG_COLOR)
         all_button.pack(side="left", padx=(5,0))
@@ -869,7 +922,7 @@ class LogDisplay(tk.Frame):
             chk_color = self.theme.LOG_LEVEL_COLORS.get(log_type, self.theme.TEXT_COLOR)
             
             container = Frame(check_frame, bg=DROPDOWN_BG_COLOR)
-            chk = Checkbutton(container, text=log_type, variable=var, command=self._perform_search_and_filter_logs,
+            chk = Checkbutton(container, text=log_type, variable=var, command=self._apply_level_filters,
                               bg=DROPDOWN_BG_COLOR, fg=chk_color, selectcolor=self.theme.ENTRY_BG_COLOR,
                               font=(self.theme.FONT_FAMILY_UI, 9, "bold"), bd=0, highlightthickness=0,
                               activebackground=DROPDOWN_BG_COLOR, activeforeground=chk_color,
@@ -907,6 +960,9 @@ class LogDisplay(tk.Frame):
         self.search_var.set("")
         self.log_area.tag_remove("search_highlight", '1.0', tk.END)
         self.log_area.tag_remove("current_search_highlight", '1.0', tk.END)
+        self.log_view.search_spans = {}
+        self.log_view.current_match = None
+        self.search_matches = []
         self.search_results = []
         self.current_search_index = -1
         self.search_count_label.config(text="0/0")
@@ -940,107 +996,149 @@ class LogDisplay(tk.Frame):
         """
         self.log_area.tag_remove("current_search_highlight", "1.0", tk.END)
         if not self.search_results or self.current_search_index < 0:
+            self.log_view.current_match = None
             return
 
-        result = self.search_results[self.current_search_index]
-        start_index, end_index = result['start'], result['end']
-        
-        self.log_area.tag_add("current_search_highlight", start_index, end_index)
-        self.log_area.see(start_index)
+        match = self.search_results[self.current_search_index]
+        self.log_view.current_match = match
+        abs_index, start, end = match
+        line = self.log_view.see_abs(abs_index)
+        if line is not None:
+            self.log_area.tag_add("current_search_highlight", f"{line}.{start}", f"{line}.{end}")
+            self.log_area.see(f"{line}.{start}")
         
         self.search_count_label.config(text=f"{self.current_search_index + 1}/{len(self.search_results)}")
 
-    def _perform_search_and_filter_logs(self, scroll_to_end=False):
+    def _get_hidden_levels(self) -> set:
         """
-        # Refreshes the log display based on current filters and search terms.
-        # 현재 필터 및 검색어에 따라 로그 표시를 새로 고칩니다.
+        # Returns the set of log levels currently hidden by the level filters.
+        # 현재 레벨 필터에 의해 숨겨진 로그 레벨 집합을 반환합니다.
         """
-        self._update_filter_button_text()
-        
-        self.log_area.tag_remove("search_highlight", '1.0', tk.END)
-        self.log_area.tag_remove("current_search_highlight", '1.0', tk.END)
-        self.search_results = []
-        self.current_search_index = -1
-
-        current_scroll_fraction = self.log_area.yview()[0]
-        self.log_area.configure(state='normal')
-        self.log_area.delete(1.0, tk.END)
+        return {level for level, var in self.log_filter_vars.items() if not var.get()}
 
-        search_term = self.search_var.get()
-        search_flags = 0 if self.case_sensitive_var.get() else re.IGNORECASE
-        use_regex = self.regex_var.get()
-
-        temp_search_results = []
-
-        for i, log_entry in enumerate(self.all_logs):
-            level = log_entry.get('level', 'INFO')
-            is_filterable = level in self.filterable_log_types
-            level_should_display = not is_filterable or self.log_filter_vars.get(level, BooleanVar(value=True)).get()
-
-            if log_entry.get('state') != 'DELETED' and level_should_display:
-                base_tags = list(self._get_tags_for_log(log_entry)) + [f"log_index_{i}"]
-                log_message = log_entry['message']
-                links = self._find_links_in_text(log_message)
+    def _update_level_elision(self):
+        """
+        # Elides the level tags of hidden levels, so level filtering never re-renders the log area.
+        # 숨겨진 레벨의 레벨 태그를 생략(elide)하여, 레벨 필터링 시 로그 영역을 다시 렌더링하지 않습니다.
+        """
+        for level, var in self.log_filter_vars.items():
+            self.log_area.tag_config(level, elide=not var.get())
 
-                if not links:
-                    self.log_area.insert(tk.END, log_message + '\n', tuple(base_tags))
-                else:
-                    last_index = 0
-                    sorted_links = sorted(links, key=lambda l: l[1])
-                    for link_type, link_start, link_end in sorted_links:
-                        plain_text = log_message[last_index:link_start]
-                        if plain_text:
-                            self.log_area.insert(tk.END, plain_text, tuple(base_tags))
-                        link_text = log_message[link_start:link_end]
-                        link_tags = tuple(base_tags + [link_type])
-                        self.log_area.insert(tk.END, link_text, link_tags)
-                        last_index = link_end
-                    remaining_text = log_message[last_index:]
-                    if remaining_text:
-                        self.log_area.insert(tk.END, remaining_text, tuple(base_tags))
-                    self.log_area.insert(tk.END, '\n')
-
-                if search_term:
-                    line_start_index = self.log_area.index(f"end-2c linestart")
-                    try:
-                        if use_regex:
-                            for match in re.finditer(search_term, log_message, search_flags):
-                                start, end = match.span()
-                                temp_search_results.append({
-                                    'start': f"{line_start_index}+{start}c",
-                                    'end': f"{line_start_index}+{end}c"
-                                })
-                        else:
-                            start = 0
-                            while True:
-                                start = log_message.lower().find(search_term.lower(), start) if not self.case_sensitive_var.get() else log_message.find(search_term, start)
-                                if start == -1: break
-                                end = start + len(search_term)
-                                temp_search_results.append({
-                                    'start': f"{line_start_index}+{start}c",
-                                    'end': f"{line_start_index}+{end}c"
-                                })
-                                start += 1
-                    except re.error as e:
-                        self.update_status(f"Regex Error: {e}", self.theme.LOG_LEVEL_COLORS['DELETED'])
-                        pass
-
-        for result in temp_search_results:
-            self.log_area.tag_add("search_highlight", result['start'], result['end'])
-        
-        self.search_results = temp_search_results
-        self.log_area.configure(state='disabled')
+    def _filter_search_results(self, follow=True):
+        """
+        # Narrows the search matches to visible levels, keeping the current match if it is still visible.
+        # 검색 결과를 보이는 레벨로 좁히며, 현재 결과가 여전히 보이면 유지합니다.
 
-        if scroll_to_end:
-            self.log_area.yview_moveto(1.0)
+        # Args:
+        #     follow (bool): Whether to jump to the first result when the current match is gone. (현재 결과가 사라졌을 때 첫 결과로 이동할지 여부)
+        """
+        hidden_codes = self.all_logs.codes_for(self._get_hidden_levels())
+        if hidden_codes:
+            levels = self.all_logs.levels
+            self.search_results = [match for match in self.search_matches if levels[match[0]] not in hidden_codes]
         else:
-            self.log_area.yview_moveto(current_scroll_fraction)
-
-        if self.search_results:
+            self.search_results = self.search_matches
+        current = self.log_view.current_match
+        if current is not None and current in self.search_results:
+            self.current_search_index = self.search_results.index(current)
+            self.search_count_label.config(text=f"{self.current_search_index + 1}/{len(self.search_results)}")
+        elif not follow:
+            self.current_search_index = -1
+            self.log_view.current_match = None
+            self.log_area.tag_remove("current_search_highlight", "1.0", tk.END)
+            self.search_count_label.config(text=f"0/{len(self.search_results)}")
+        elif self.search_results:
             self.current_search_index = 0
             self._update_search_highlight()
         else:
+            self.current_search_index = -1
+            self._update_search_highlight()
             self.search_count_label.config(text="0/0")
+
+    def _apply_level_filters(self):
+        """
+        # Applies the level filter checkboxes: a tag reconfiguration plus a filter of the existing search matches.
+        # 레벨 필터 체크박스를 적용합니다: 태그 재구성과 기존 검색 결과의 필터링만 수행합니다.
+        """
+        self._update_filter_button_text()
+        self._update_level_elision()
+        self._filter_search_results()
+        self.log_view.on_filter_change()
+
+    def _apply_search_results(self, spans: dict, matches: list):
+        """
+        # Applies the result of a background search: only the search highlight tags of the rendered window change.
+        # 백그라운드 검색 결과를 적용합니다: 렌더링된 창의 검색 하이라이트 태그만 변경됩니다.
+
+        # Args:
+        #     spans (dict): {log index: [(start, end), ...]}
+        #     matches (list): [(log index, start, end), ...]
+        """
+        self.log_view.search_spans = spans
+        self.search_matches = matches
+        self.log_view.current_match = None
+        self.current_search_index = -1
+        self.log_view.redecorate_search()
+        self._filter_search_results()
+
+    def _new_log_store(self, with_timestamps=False) -> LogStore:
+        """
+        # Creates an empty log store whose single-entry edits are patched into the display.
+        # 단일 항목 편집이 화면에 국소적으로 반영되는 빈 로그 저장소를 생성합니다.
+        """
+        store = LogStore(with_timestamps=with_timestamps)
+        store.subscribe(self._on_log_change)
+        store.before_relocate = self.search_engine.stop
+        return store
+
+    def _on_log_change(self, event: str, index: int):
+        """
+        # Log store listener: patches the log area and the search results for one inserted, removed or replaced entry.
+        # 로그 저장소 리스너: 삽입, 제거 또는 교체된 항목 하나에 대해 로그 영역과 검색 결과를 국소적으로 수정합니다.
+
+        # A RESET from a multi-edit transaction (e.g. '/undo 50') is applied as one rebuild instead.
+        # 여러 편집으로 된 트랜잭션(예: '/undo 50')의 RESET은 대신 한 번의 재구성으로 적용됩니다.
+        """
+        if event == RESET:
+            self._perform_search_and_filter_logs(scroll_to_end=False)
+            return
+        store = self.all_logs
+        spans = []
+        if event != REMOVED and not store.is_deleted(index) and self.search_var.get():
+            spans = self.search_engine.spans_for(store.message(index))
+        self.log_view.apply_change(event, index, spans)
+        if not self.search_var.get():
+            return
+
+        matches = self.search_matches
+        start = bisect_left(matches, (index,))
+        end = start if event == INSERTED else bisect_left(matches, (index + 1,))
+        shift = {INSERTED: 1, REMOVED: -1}.get(event, 0)
+        tail = [(i + shift, s, e) for i, s, e in matches[end:]] if shift else matches[end:]
+        self.search_matches = matches[:start] + [(index, s, e) for s, e in spans] + tail
+        self.search_engine.invalidate()
+        if self.search_engine.busy:
+            self.search_engine.run()
+        self._filter_search_results(follow=False)
+
+    def _perform_search_and_filter_logs(self, scroll_to_end=False):
+        """
+        # Refreshes the log display based on current filters and search terms.
+        # 현재 필터 및 검색어에 따라 로그 표시를 새로 고칩니다.
+        """
+        with self.pipeline_stats.timed('rerender'):
+            self._update_filter_button_text()
+            self._update_level_elision()
+
+            self.log_view.search_spans, self.search_matches, self.search_results = {}, [], []
+            self.log_view.current_match = None
+            self.current_search_index = -1
+            self.log_view.rebuild(scroll_to_end=scroll_to_end)
+            self.search_engine.invalidate()
+            if self.search_var.get():
+                self.search_engine.run()
+            else:
+                self.search_count_label.config(text="0/0")
                 
     def _browse_script_file(self):
         """
@@ -1132,34 +1230,21 @@ class LogDisplay(tk.Frame):
                 self.update_status(f"Folder not found: {dir_path}", self.theme.LOG_LEVEL_COLORS['DELETED'])
             return "break"
 
-        is_editable = (self.is_running and self.is_paused) or not self.is_running
+        is_editable = ((self.is_running and self.is_paused) or not self.is_running) and not self._file_loading()
         if not is_editable or link_type:
             return
 
-        clicked_index = self.log_area.index(f"@{event.x},{event.y}")
-        line_start = clicked_index.split('.')[0] + '.0'
-        if self.selected_log_line_index == line_start or not self.log_area.get(line_start, f"{line_start} lineend").strip():
+        abs_index = self.log_view.abs_for_line(int(index.split('.')[0]))
+        if abs_index is None or abs_index == self.selected_log_abs_index:
             self.selected_log_line_index = self.selected_log_abs_index = self.log_area_insert_index = None
-            self._normalize_all_logs(scroll_to_end=False)
             if self.editor_window_instance and self.editor_window_instance.winfo_exists():
                 self.editor_window_instance.update_content(None)
         else:
-            tags = self.log_area.tag_names(line_start)
-            abs_index = None
-            for tag in tags:
-                if tag.startswith("log_index_"):
-                    try:
-                        abs_index = int(tag.split('_')[-1])
-                        break
-                    except (ValueError, IndexError):
-                        continue
-            if abs_index is None: return
-            self._normalize_all_logs(scroll_to_end=False)
-            self.log_area.tag_add("highlight", line_start, f"{line_start} lineend")
-            self.log_area_insert_index = f"{line_start} lineend"
-            self.selected_log_line_index = line_start
             self.selected_log_abs_index = abs_index
-            self.update_status(f"Selected line {int(line_start.split('.')[0])}", self.theme.ACCENT_COLOR)
+            line = self.log_view.text_line_for_abs(abs_index)
+            self.selected_log_line_index = f"{line}.0" if line is not None else None
+            self.log_area_insert_index = f"{line}.0 lineend" if line is not None else None
+            self.update_status(f"Selected line {abs_index + 1}", self.theme.ACCENT_COLOR)
             if self.editor_window_instance and self.editor_window_instance.winfo_exists():
                 self.editor_window_instance.update_content(self.selected_log_abs_index)
 
@@ -1189,7 +1274,7 @@ class LogDisplay(tk.Frame):
         # 댓글 입력창의 키 입력 이벤트를 처리합니다. (예: 에디터 창을 여는 Ctrl+E)
         """
         if self.comment_entry['state'] == 'disabled': return "break"
-        is_editable = (self.is_running and self.is_paused) or not self.is_running
+        is_editable = ((self.is_running and self.is_paused) or not self.is_running) and not self._file_loading()
         if event.state & 0x4 and event.keysym.lower() == 'e' and is_editable: self.open_editor_window(); return "break"
         
     def open_editor_window(self):
@@ -1218,12 +1303,17 @@ class LogDisplay(tk.Frame):
         
         self.editor_window_instance.geometry(f"{editor_w}x{editor_h}+{pos_x}+{pos_y}")
 
-    def _normalize_all_logs(self, scroll_to_end=True):
+    @property
+    def selected_log_abs_index(self):
         """
-        # Helper function to redraw all logs based on current filters and search.
-        # 현재 필터와 검색에 따라 모든 로그를 다시 그리는 헬퍼 함수입니다.
+        # The absolute index of the selected log entry. The selection is view state; assigning it only retags the old and new line.
+        # 선택된 로그 항목의 절대 인덱스입니다. 선택은 뷰 상태이며, 값을 지정하면 이전 라인과 새 라인만 다시 태그합니다.
         """
-        self._perform_search_and_filter_logs(scroll_to_end=scroll_to_end)
+        return self.log_view.selected_abs
+
+    @selected_log_abs_index.setter
+    def selected_log_abs_index(self, abs_index):
+        self.log_view.select(abs_index)
 
     def configure_tags(self):
         """
@@ -1247,15 +1337,14 @@ class LogDisplay(tk.Frame):
         highlight_fg = getattr(self.theme, 'SEARCH_HIGHLIGHT_FG', '#000000')
         self.log_area.tag_config("search_highlight", background=highlight_bg, foreground=highlight_fg)
         self.log_area.tag_config("current_search_highlight", background=self.theme.ACCENT_COLOR, foreground=self.theme.BG_COLOR)
+        self._update_level_elision()
 
-    def _get_tags_for_log(self, log_entry):
+    def _get_tags_for_log(self, level, state):
         """
-        # Gets the appropriate tags for a given log entry based on its level and state.
-        # 주어진 로그 항목의 레벨과 상태에 따라 적절한 태그를 가져옵니다.
+        # Gets the appropriate tags for a log entry based on its level and state.
+        # 로그 항목의 레벨과 상태에 따라 적절한 태그를 가져옵니다.
         """
-        tags = [log_entry.get('level', 'INFO')]
-        if 'state' in log_entry and log_entry['state'] != 'SAVED': tags.append(log_entry['state'])
-        return tuple(tags)
+        return (level,) if state == 'SAVED' else (level, state)
 
     def _find_links_in_text(self, line_text):
         """
@@ -1279,56 +1368,121 @@ class LogDisplay(tk.Frame):
         # Adds a log entry to the display and optionally to the log file.
         # 로그 항목을 화면에 추가하고, 선택적으로 로그 파일에도 기록합니다.
         """
-        log_entry = {'message': message, 'level': level, 'state': 'SAVED'}
-        self.all_logs.append(log_entry)
-        
-        is_filterable = level in self.filterable_log_types
-        should_display_level = not is_filterable or self.log_filter_vars.get(level, BooleanVar(value=True)).get()
-        
-        if should_display_level:
-            self.log_area.config(state='normal')
-            i = len(self.all_logs) - 1
-            base_tags = list(self._get_tags_for_log(log_entry)) + [f"log_index_{i}"]
-            links = self._find_links_in_text(log_entry['message'])
-
-            if not links:
-                self.log_area.insert(tk.END, log_entry['message'] + '\n', tuple(base_tags))
+        self._append_logs([(message, level)], to_file=to_file, scroll=scroll)
+
+    def _build_log_segments(self, message, base_tags):
+        """
+        # Builds the flat (text, tags, text, tags, ...) argument list for inserting one log line, splitting out links.
+        # 링크를 분리하여 로그 한 줄을 삽입하기 위한 (텍스트, 태그, 텍스트, 태그, ...) 평면 인수 목록을 만듭니다.
+        """
+        links = self._find_links_in_text(message)
+        if not links:
+            return [message + '\n', base_tags]
+        segments = []
+        last_index = 0
+        for link_type, link_start, link_end in sorted(links, key=lambda l: l[1]):
+            plain_text = message[last_index:link_start]
+            if plain_text:
+                segments += [plain_text, base_tags]
+            segments += [message[link_start:link_end], base_tags + (link_type,)]
+            last_index = link_end
+        segments += [message[last_index:] + '\n', base_tags]
+        return segments
+
+    def _append_logs(self, entries, to_file=True, scroll=True):
+        """
+        # Appends a batch of (message, level) entries with a single Text insert and a single log file write.
+        # (메시지, 레벨) 항목 배치를 한 번의 Text 삽입과 한 번의 로그 파일 쓰기로 추가합니다.
+        """
+        start_index = len(self.all_logs)
+        self.all_logs.extend(entries)
+        with self.pipeline_stats.timed('text_insert'):
+            self.log_view.append_from(start_index, scroll=scroll)
+        self._enforce_scrollback()
+
+        if to_file:
+            writer = self._ensure_log_writer()
+            if writer is not None:
+                writer.write_lines([message for message, _ in entries])
+
+    def _enforce_scrollback(self):
+        """
+        # Moves the text of the oldest lines of a run to a spill segment on disk once the scrollback limits are exceeded.
+        # 스크롤백 제한을 넘으면 실행의 가장 오래된 라인들의 텍스트를 디스크의 스필 세그먼트로 옮깁니다.
+
+        # Spilling relocates text, so it waits while a search worker or a save reads the store.
+        # 옮기기는 텍스트의 위치를 바꾸므로, 검색 작업 스레드나 저장이 저장소를 읽는 동안에는 기다립니다.
+        """
+        store = self.all_logs
+        if not self.is_running or self.spill_error or self.log_saver is not None or self.search_engine.busy:
+            return
+        lines, text_bytes = store.resident()
+        limit = 1 + SCROLLBACK_SLACK
+        if not (SCROLLBACK_MAX_LINES and lines > SCROLLBACK_MAX_LINES * limit) and \
+                not (SCROLLBACK_MAX_BYTES and text_bytes > SCROLLBACK_MAX_BYTES * limit):
+            return
+        try:
+            if store.spill_segment is None:
+                store.attach_spill(SpillSegment())
+            with self.pipeline_stats.timed('spill'):
+                store.spill(SCROLLBACK_MAX_LINES, SCROLLBACK_MAX_BYTES)
+        except OSError as e:
+            # Keep everything in memory for the rest of the run rather than retrying on every batch.
+            # 매 배치마다 다시 시도하지 않고, 실행이 끝날 때까지 모든 것을 메모리에 유지합니다.
+            self.spill_error = e
+            self.update_status(f"Error spilling scrollback to disk: {e}", self.theme.LOG_LEVEL_COLORS['DELETED'])
+
+    def _ensure_log_writer(self):
+        """
+        # Returns the run log writer, opening it on first use. Returns None when no run is active or the file cannot be opened.
+        # 실행 로그 기록기를 반환하며, 처음 사용할 때 엽니다. 실행 중이 아니거나 파일을 열 수 없으면 None을 반환합니다.
+        """
+        if self.log_writer is None and self.is_running:
+            try:
+                self.log_writer = LogWriter(self.current_log_file_path, stats=self.pipeline_stats)
+                self.log_file_open = True
+            except OSError as e:
+                self.update_status(f"Error opening log file: {e}", self.theme.LOG_LEVEL_COLORS['DELETED'])
+        return self.log_writer if self.is_running else None
+
+    def _update_run_status(self):
+        """
+        # Shows the log writer throughput and backlog and the ingest queue depth, lag and overflow counts in the status bar during a run.
+        # 실행 중 상태 표시줄에 로그 기록기의 처리량과 백로그, 수집 큐의 깊이, 지연 및 오버플로 개수를 표시합니다.
+        """
+        ingest = self.log_queue.stats()
+        ingest_text = f"Queue {ingest['depth']:,} | Lag {ingest['lag']:.1f}s"
+        if ingest['dropped']: ingest_text += f" | Dropped {ingest['dropped']:,}"
+        if ingest['disk_only']: ingest_text += f" | Disk-only {ingest['disk_only']:,}"
+        overloaded = ingest['dropped'] or ingest['disk_only'] or ingest['lag'] >= 1.0
+        self.ingest_status_label.config(text=ingest_text, fg=self.theme.WARNING_COLOR if overloaded else self.theme.DISABLED_TEXT_COLOR)
+        writer = self.log_writer
+        if writer is not None:
+            stats = writer.stats()
+            rate = (stats['bytes_written'] - self._writer_bytes_seen) * 1000 / LOG_WRITER_STATUS_INTERVAL_MS
+            self._writer_bytes_seen = stats['bytes_written']
+            if stats['error']:
+                self.writer_status_label.config(text=f"Log write error: {stats['error']}", fg=self.theme.LOG_LEVEL_COLORS['DELETED'])
             else:
-                last_index = 0
-                sorted_links = sorted(links, key=lambda l: l[1])
-                for link_type, link_start, link_end in sorted_links:
-                    plain_text = log_entry['message'][last_index:link_start]
-                    if plain_text:
-                        self.log_area.insert(tk.END, plain_text, tuple(base_tags))
-                    link_text = log_entry['message'][link_start:link_end]
-                    link_tags = tuple(base_tags + [link_type])
-                    self.log_area.insert(tk.END, link_text, link_tags)
-                    last_index = link_end
-                remaining_text = log_entry['message'][last_index:]
-                if remaining_text:
-                    self.log_area.insert(tk.END, remaining_text, tuple(base_tags))
-                self.log_area.insert(tk.END, '\n')
-
-            if scroll:
-                self.log_area.see(tk.END)
-            self.log_area.config(state='disabled')
-
-        if to_file and self.is_running:
-            if not hasattr(self, 'log_file') or not self.log_file or self.log_file.closed:
-                try:
-                    self.log_file = open(self.current_log_file_path, "a", encoding="utf-8", buffering=1)
-                    self.log_file_open = True
-                except IOError as e:
-                    self.update_status(f"Error opening log file: {e}", self.theme.LOG_LEVEL_COLORS['DELETED'])
-                    self.log_file = None
-                    return
-            if self.log_file and not self.log_file.closed:
-                try:
-                    self.log_file.write(message + '\n')
-                    self.log_file.flush()
-                except IOError as e:
-                    self.update_status(f"Error writing to log file: {e}", self.theme.LOG_LEVEL_COLORS['DELETED'])
-                        
+                writer_text = f"Disk {rate / 1024:,.0f} KB/s | Backlog {stats['backlog']:,}"
+                segment = self.all_logs.spill_segment
+                if segment is not None: writer_text += f" | Spilled {segment.size / (1024 * 1024):,.0f} MB"
+                self.writer_status_label.config(text=writer_text, fg=self.theme.DISABLED_TEXT_COLOR)
+        self._run_status_job = self.master.after(LOG_WRITER_STATUS_INTERVAL_MS, self._update_run_status) if self.is_running else None
+
+    def _close_log_writer(self):
+        """
+        # Flushes and closes the run log writer, reporting a write error if one occurred.
+        # 실행 로그 기록기를 플러시하고 닫으며, 쓰기 오류가 발생했다면 보고합니다.
+        """
+        writer, self.log_writer = self.log_writer, None
+        if writer is None:
+            return
+        writer.close()
+        self.writer_status_label.config(text="")
+        if writer.error:
+            self.update_status(f"Error writing to log file: {writer.error}", self.theme.LOG_LEVEL_COLORS['DELETED'])
+
     def update_progress_display(self, message):
         """
         # Updates the progress bar/spinner display area.
@@ -1351,95 +1505,99 @@ class LogDisplay(tk.Frame):
             formatted_message = f"[{timestamp}] [COMMENT] {comment_text}"
             insert_pos = self.selected_log_abs_index + 1 if self.selected_log_abs_index is not None else len(self.all_logs)
             new_log = {'message': formatted_message, 'level': 'COMMENT', 'state': 'ADDED'}
-            self.all_logs.insert(insert_pos, new_log)
-            self._record_action('add', {'line_num': insert_pos, 'log_entry': new_log})
+            self.all_logs.insert(insert_pos, **new_log)
+            self._record_action('add', insert_pos, None, new_log)
             self.selected_log_line_index = self.selected_log_abs_index = None
-            self._perform_search_and_filter_logs(scroll_to_end=False)
             self.update_status("Comment added.", self.theme.LOG_LEVEL_COLORS['ADDED'])
         
         self.comment_entry.delete(1.0, tk.END)
         return "break"
 
-    def _record_action(self, action_type, details):
+    def _record_action(self, action_type, line_num, before, after):
         """
-        # Records a user action for the undo/redo stack.
-        # 실행 취소/다시 실행 스택에 대한 사용자 작업을 기록합니다.
+        # Records a user action in the undo journal as the difference between two entry snapshots.
+        # 사용자 작업을 두 항목 스냅샷 간의 차이로 실행 취소 저널에 기록합니다.
         """
-        self.undo_stack.append({'type': action_type, 'details': details})
-        self.redo_stack.clear()
+        self.undo_journal.record(action_type, line_num, before, after)
         self.update_ui_for_state()
 
+    def _journal_edit(self, label, index, current, target):
+        """
+        # Undo journal hook: appends every applied edit to the edit journal of the opened log file.
+        # 실행 취소 저널 훅: 적용된 모든 편집을 열린 로그 파일의 편집 저널에 추가합니다.
+        """
+        journal = self.edit_journal
+        if journal is None or journal.error is not None:
+            return
+        journal.append(label, index, current, target)
+        if journal.error is not None:
+            self.update_status(f"Error writing edit journal: {journal.error}", self.theme.LOG_LEVEL_COLORS['DELETED'])
+
+    def _close_edit_journal(self, discard=False):
+        """
+        # Closes the edit journal of the opened log file; it is kept for recovery unless discard is set.
+        # 열린 로그 파일의 편집 저널을 닫습니다. discard가 설정되지 않으면 복구를 위해 보존됩니다.
+        """
+        journal, self.edit_journal = self.edit_journal, None
+        self._recovered_edits = None
+        if journal is not None:
+            if discard: journal.discard()
+            else: journal.close()
+
+    def _offer_edit_recovery(self):
+        """
+        # Once a log file is fully indexed, offers to replay the unsaved edits journaled by a previous session.
+        # 로그 파일이 모두 인덱싱되면, 이전 세션이 저널에 기록한 저장되지 않은 편집을 다시 적용할지 묻습니다.
+        """
+        records, self._recovered_edits = self._recovered_edits, None
+        if not records or self.edit_journal is None:
+            return
+        name = os.path.basename(self.current_log_file_path)
+        if not messagebox.askyesno("Recover Unsaved Edits", f"{len(records)} unsaved edit(s) to {name} from a previous session were found.\n\nRestore them?"):
+            if not self.undo_journal.has_changes:
+                self.edit_journal.discard()
+            return
+        try:
+            self.undo_journal.restore(self.all_logs, records)
+        except (IndexError, TypeError, ValueError) as e:
+            self.update_status(f"Error restoring edits: {e}", self.theme.LOG_LEVEL_COLORS['DELETED'])
+            return
+        self.update_ui_for_state()
+        self.update_status(f"Restored {len(records)} unsaved edit(s).", self.theme.LOG_LEVEL_COLORS['MODIFIED'])
+
     def _undo(self, count=1):
         """
-        # Undoes the last user action(s).
-        # 마지막 사용자 작업을 실행 취소합니다.
-        """
-        undone = False
-        for _ in range(count):
-            if self.undo_stack:
-                action = self.undo_stack.pop()
-                action_type, details = action['type'], action['details']
-                line_num = details['line_num']
-                status_message = ""
-                if action_type == 'add':
-                    if 0 <= line_num < len(self.all_logs):
-                        self.all_logs.pop(line_num)
-                        self.redo_stack.append(action)
-                        status_message = f"Undid: Add log at line {line_num + 1}"
-                elif action_type == 'delete':
-                    self.all_logs[line_num]['state'] = details['log_entry']['state']
-                    self.all_logs[line_num]['message'] = details['log_entry']['message']
-                    self.redo_stack.append(action)
-                    status_message = f"Undid: Delete log at line {line_num + 1}"
-                elif action_type == 'edit':
-                    original_log = details['original_log']
-                    current_log_state = copy.deepcopy(self.all_logs[line_num])
-                    self.all_logs[line_num] = original_log
-                    self.redo_stack.append({'type': 'edit', 'details': {'line_num': line_num, 'original_log': current_log_state}})
-                    status_message = f"Undid: Edit log at line {line_num + 1}"
-                
-                self._perform_search_and_filter_logs(scroll_to_end=False)
-                self.update_ui_for_state()
-                if status_message: self.update_status(status_message, self.theme.LOG_LEVEL_COLORS['MODIFIED'])
-                undone = True
-            else: self.update_status("Nothing to undo.", self.theme.DISABLED_TEXT_COLOR); break
-        if not undone: self.update_ui_for_state()
+        # Undoes the last user action(s) as one transaction with a single view update.
+        # 마지막 사용자 작업을 하나의 트랜잭션으로 실행 취소하며, 화면은 한 번만 갱신합니다.
+        """
+        if self.log_saver is not None:
+            self.update_status("Cannot undo while saving.", self.theme.DISABLED_TEXT_COLOR); return
+        applied = self.undo_journal.undo(self.all_logs, count)
+        self.update_ui_for_state()
+        if not applied:
+            self.update_status("Nothing to undo.", self.theme.DISABLED_TEXT_COLOR)
+        elif len(applied) == 1:
+            action_type, line_num = applied[0]
+            self.update_status(f"Undid: {action_type.capitalize()} log at line {line_num + 1}", self.theme.LOG_LEVEL_COLORS['MODIFIED'])
+        else:
+            self.update_status(f"Undid {len(applied)} actions.", self.theme.LOG_LEVEL_COLORS['MODIFIED'])
 
     def _redo(self, count=1):
         """
-        # Redoes the last undone user action(s).
-        # 마지막으로 실행 취소된 사용자 작업을 다시 실행합니다.
-        """
-        redone = False
-        for _ in range(count):
-            if self.redo_stack:
-                action = self.redo_stack.pop()
-                action_type, details = action['type'], action['details']
-                line_num = details['line_num']
-                status_message = ""
-                if action_type == 'add':
-                    self.all_logs.insert(line_num, details['log_entry'])
-                    self.undo_stack.append(action)
-                    status_message = f"Redid: Add log at line {line_num + 1}"
-                elif action_type == 'delete':
-                    if 0 <= line_num < len(self.all_logs):
-                        self.all_logs[line_num]['state'] = 'DELETED'
-                        self.all_logs[line_num]['message'] = 'DELETED: ' + details['log_entry']['message'].replace('DELETED: ', '', 1)
-                        self.undo_stack.append(action)
-                        status_message = f"Redid: Delete log at line {line_num + 1}"
-                elif action_type == 'edit':
-                    edited_log = details['original_log']
-                    current_log_state = copy.deepcopy(self.all_logs[line_num])
-                    self.all_logs[line_num] = edited_log
-                    self.undo_stack.append({'type': 'edit', 'details': {'line_num': line_num, 'original_log': current_log_state}})
-                    status_message = f"Redid: Edit log at line {line_num + 1}"
-
-                self._perform_search_and_filter_logs(scroll_to_end=False)
-                self.update_ui_for_state()
-                if status_message: self.update_status(status_message, self.theme.LOG_LEVEL_COLORS['MODIFIED'])
-                redone = True
-            else: self.update_status("Nothing to redo.", self.theme.DISABLED_TEXT_COLOR); break
-        if not redone: self.update_ui_for_state()
+        # Redoes the last undone user action(s) as one transaction with a single view update.
+        # 마지막으로 실행 취소된 사용자 작업을 하나의 트랜잭션으로 다시 실행하며, 화면은 한 번만 갱신합니다.
+        """
+        if self.log_saver is not None:
+            self.update_status("Cannot redo while saving.", self.theme.DISABLED_TEXT_COLOR); return
+        applied = self.undo_journal.redo(self.all_logs, count)
+        self.update_ui_for_state()
+        if not applied:
+            self.update_status("Nothing to redo.", self.theme.DISABLED_TEXT_COLOR)
+        elif len(applied) == 1:
+            action_type, line_num = applied[0]
+            self.update_status(f"Redid: {action_type.capitalize()} log at line {line_num + 1}", self.theme.LOG_LEVEL_COLORS['MODIFIED'])
+        else:
+            self.update_status(f"Redid {len(applied)} actions.", self.theme.LOG_LEVEL_COLORS['MODIFIED'])
 
     def _show_command_dropdown(self):
         """
@@ -1456,7 +1614,10 @@ class LogDisplay(tk.Frame):
             "/add <TYPE> [content]": "Adds a new log of the specified TYPE.",
             "/delete": "Deletes the selected log line.",
             "/edit [content]": "Replaces the content of the selected log with [content].",
-            "/undo [count]": "Undoes the last operation.", "/redo [count]": "Redoes the last undone operation."
+            "/undo [count]": "Undoes the last operation.", "/redo [count]": "Redoes the last undone operation.",
+            "/stats [dump|reset]": "Toggles the pipeline statistics overlay (F12), or dumps them to JSON.",
+            "/profile start|stop [cpu|mem]": "Profiles the session; on stop, writes the reports to the log directory.",
+            "/stalls [reset]": "Summarizes UI stalls per callback in the stall diagnostics log."
         }
         self.command_listbox = tk.Listbox(self.command_popup, bg=self.theme.WIDGET_BG_COLOR, fg=self.theme.TEXT_COLOR, selectbackground=self.theme.ACCENT_COLOR, selectforeground=self.theme.BG_COLOR, highlightthickness=0, relief="flat")
         self.command_listbox.pack(fill="both", expand=True)
@@ -1502,24 +1663,21 @@ class LogDisplay(tk.Frame):
         if command == "/delete":
             if self.selected_log_abs_index is not None and 0 <= self.selected_log_abs_index < len(self.all_logs):
                 line_num = self.selected_log_abs_index
-                original_log = copy.deepcopy(self.all_logs[line_num])
-                self.all_logs[line_num]['state'] = 'DELETED'
-                if not self.all_logs[line_num]['message'].strip().startswith('DELETED:'): self.all_logs[line_num]['message'] = 'DELETED: ' + original_log['message']
-                self._record_action('delete', {'line_num': line_num, 'log_entry': original_log})
+                original_log = self.all_logs[line_num]
+                self.all_logs.mark_deleted(line_num)
+                self._record_action('delete', line_num, original_log, self.all_logs[line_num])
                 self.update_status(f"Marked line {line_num + 1} for deletion.", self.theme.LOG_LEVEL_COLORS['DELETED'])
-                self._perform_search_and_filter_logs(scroll_to_end=False)
                 self.selected_log_line_index = self.selected_log_abs_index = None
             else: self.update_status("No log line selected for deletion.", self.theme.LOG_LEVEL_COLORS['DELETED'])
         elif command == "/edit":
             if self.selected_log_abs_index is not None and 0 <= self.selected_log_abs_index < len(self.all_logs) and args_str:
                 line_num = self.selected_log_abs_index
-                original_log = copy.deepcopy(self.all_logs[line_num])
-                timestamp, current_level = datetime.now().strftime('%H:%M:%S'), self.all_logs[line_num].get('level', 'COMMENT')
+                original_log = self.all_logs[line_num]
+                timestamp, current_level = datetime.now().strftime('%H:%M:%S'), original_log['level']
                 new_message = f"[{timestamp}] [{current_level}] {args_str}"
-                self.all_logs[line_num]['message'], self.all_logs[line_num]['state'] = new_message, 'MODIFIED'
-                self._record_action('edit', {'line_num': line_num, 'original_log': original_log})
+                self.all_logs.update(line_num, message=new_message, state='MODIFIED')
+                self._record_action('edit', line_num, original_log, self.all_logs[line_num])
                 self.update_status(f"Edited line {line_num + 1}.", self.theme.LOG_LEVEL_COLORS['MODIFIED'])
-                self._perform_search_and_filter_logs(scroll_to_end=False)
                 self.selected_log_line_index = self.selected_log_abs_index = None
             else: self.update_status("No log line selected or no content provided for editing.", self.theme.LOG_LEVEL_COLORS['DELETED'])
         elif command == "/add":
@@ -1532,18 +1690,84 @@ class LogDisplay(tk.Frame):
                     formatted_message = f"[{timestamp}] [{log_type}] {content}"
                     new_log = {'message': formatted_message, 'level': log_type, 'state': 'ADDED'}
                     insert_pos = self.selected_log_abs_index + 1 if self.selected_log_abs_index is not None else len(self.all_logs)
-                    self.all_logs.insert(insert_pos, new_log)
-                    self._record_action('add', {'line_num': insert_pos, 'log_entry': new_log})
+                    self.all_logs.insert(insert_pos, **new_log)
+                    self._record_action('add', insert_pos, None, new_log)
                     self.update_status(f"Added {log_type} log at line {insert_pos + 1}.", self.theme.LOG_LEVEL_COLORS['ADDED'])
-                    self._perform_search_and_filter_logs(scroll_to_end=False)
                     self.selected_log_line_index = self.selected_log_abs_index = None
                 else: self.update_status(f"Usage: /add <TYPE> [content]. Valid types: {', '.join(log_types)}", self.theme.LOG_LEVEL_COLORS['DELETED'])
             except ValueError: self.update_status("Usage: /add <TYPE> [content]. Invalid format.", self.theme.LOG_LEVEL_COLORS['DELETED'])
         elif command == "/undo": self._undo(int(args_str) if args_str.isdigit() else 1)
         elif command == "/redo": self._redo(int(args_str) if args_str.isdigit() else 1)
+        elif command == "/stats":
+            action = args_str.strip().lower()
+            if not action: self._toggle_stats_overlay()
+            elif action == "dump": self._dump_pipeline_stats()
+            elif action == "reset":
+                self.pipeline_stats.reset()
+                self.update_status("Pipeline statistics reset.", self.theme.ACCENT_COLOR)
+            else: self.update_status("Usage: /stats [dump|reset]", self.theme.LOG_LEVEL_COLORS['DELETED'])
+        elif command == "/profile": self._profile_command(args_str)
+        elif command == "/stalls": self._stalls_command(args_str)
         else: self.update_status(f"Unknown command: {command}", self.theme.LOG_LEVEL_COLORS['DELETED'])
         self.comment_entry.delete(1.0, tk.END)
 
+    def _profile_command(self, args_str):
+        """
+        # Handles '/profile start|stop [cpu|mem]'. start defaults to cpu; stop without a kind stops every running profile.
+        # '/profile start|stop [cpu|mem]'를 처리합니다. start의 기본값은 cpu이며, 종류 없는 stop은 실행 중인 모든 프로파일을 중지합니다.
+
+        # The CPU profile is enabled from this callback on the Tk thread, so it covers every Tk callback until it is stopped.
+        # CPU 프로파일은 Tk 스레드의 이 콜백에서 활성화되므로, 중지될 때까지 모든 Tk 콜백을 포함합니다.
+        """
+        error_color = self.theme.LOG_LEVEL_COLORS['DELETED']
+        parts = args_str.lower().split()
+        action = parts[0] if parts else ""
+        kinds = parts[1:] or (["cpu"] if action == "start" else self.profiler.active)
+        if action not in ("start", "stop") or len(parts) > 2 or any(kind not in PROFILE_KINDS for kind in kinds):
+            self.update_status("Usage: /profile start|stop [cpu|mem]", error_color)
+            return
+        if action == "start":
+            try: self.profiler.start(kinds[0])
+            except ProfilerError as e: self.update_status(str(e), error_color); return
+            self.update_status(f"Started {kinds[0]} profiling. Use '/profile stop' to write the report.", self.theme.ACCENT_COLOR)
+            return
+        if not kinds:
+            self.update_status("No profile is running.", error_color)
+            return
+        out_dir = self.log_dir_var.get() or str(LOG_DIR)
+        written = []
+        for kind in kinds:
+            try: written += self.profiler.stop(kind, out_dir)
+            except (ProfilerError, OSError) as e: self.update_status(f"Error stopping {kind} profile: {e}", error_color); return
+        self.update_status(f"Profile written to {', '.join(os.path.basename(path) for path in written)} in {out_dir}", self.theme.ACCENT_COLOR)
+
+    def _stalls_command(self, args_str):
+        """
+        # Handles '/stalls [reset]': appends the per-callback stall summary to the diagnostics log and shows the worst
+        # callback in the status bar, or clears the summary.
+        # '/stalls [reset]'를 처리합니다: 콜백별 멈춤 요약을 진단 로그에 추가하고 가장 심한 콜백을 상태 표시줄에 표시하거나,
+        # 요약을 지웁니다.
+        """
+        error_color = self.theme.LOG_LEVEL_COLORS['DELETED']
+        action = args_str.strip().lower()
+        if self.watchdog is None:
+            self.update_status("The stall watchdog is disabled (WATCHDOG_ENABLED).", error_color)
+        elif action == "reset":
+            self.watchdog.reset()
+            self.update_status("Stall summary reset.", self.theme.ACCENT_COLOR)
+        elif action:
+            self.update_status("Usage: /stalls [reset]", error_color)
+        else:
+            rows = self.watchdog.summary()
+            try: path = self.watchdog.write_summary()
+            except OSError as e: self.update_status(f"Error writing stall summary: {e}", error_color); return
+            if not rows:
+                self.update_status(f"No UI stalls recorded. Diagnostics log: {path}", self.theme.ACCENT_COLOR)
+                return
+            worst = rows[0]
+            self.update_status(f"{sum(row['count'] for row in rows):,} stalls in {len(rows)} callbacks; worst: {worst['label']} "
+                               f"({worst['count']}x, max {worst['max_ms']:,.0f} ms). Summary in {path}", self.theme.WARNING_COLOR)
+
     def _on_command_listbox_select(self, event):
         """
         # Handles selection from the command dropdown, inserting the command into the entry.
@@ -1552,7 +1776,7 @@ class LogDisplay(tk.Frame):
         if not self.command_listbox.curselection(): return
         selected_command_text = self.command_listbox.get(self.command_listbox.curselection()[0])
         base_command = selected_command_text.split(' | ')[0].split()[0]
-        commands_that_need_space = ['/add', '/edit', '/undo', '/redo']
+        commands_that_need_space = ['/add', '/edit', '/undo', '/redo', '/stats', '/profile', '/stalls']
         final_text = base_command + (' ' if base_command in commands_that_need_space else '')
         self.comment_entry.delete(1.0, tk.END)
         self.comment_entry.insert(tk.END, final_text)
@@ -1618,182 +1842,234 @@ class LogDisplay(tk.Frame):
         # 대상 스크립트의 실행을 토글합니다 (실행/종료).
         """
         if self.is_running:
-            if self.think_core_process and self.think_core_process.poll() is None:
-                pid = self.think_core_process.pid
-                try:
-                    kill_command = f"taskkill /F /PID {pid} /T"
-                    subprocess.run(kill_command, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, creationflags=subprocess.CREATE_NO_WINDOW)
-                    self.update_status(f"Killed process tree (PID: {pid}).", self.theme.LOG_LEVEL_COLORS['DELETED'])
-                except Exception:
-                    self.think_core_process.kill()
-                    self.update_status(f"Killed process (PID: {pid}, fallback).", self.theme.LOG_LEVEL_COLORS['DELETED'])
+            if self.script_run is not None and self.script_run.is_alive():
+                self.update_status(self.script_run.kill(), self.theme.LOG_LEVEL_COLORS['DELETED'])
         else:
+            if self.log_saver is not None:
+                self.update_status("Cannot start a run while saving.", self.theme.LOG_LEVEL_COLORS['DELETED']); return
             command_input = self.script_path_var.get().strip()
-            if not command_input:
-                self.update_status("Error: Script path is empty.", self.theme.LOG_LEVEL_COLORS['DELETED'])
+            try:
+                command_to_run, cwd, note, is_warning = resolve_command(command_input)
+            except EngineError as e:
+                self.update_status(f"Error: {e}", self.theme.LOG_LEVEL_COLORS['DELETED'])
                 return
+            if note:
+                self.update_status(note, self.theme.LOG_LEVEL_COLORS['WARNING'] if is_warning else self.theme.ACCENT_COLOR)
 
-            command_to_run = []
-            script_path = Path(command_input)
-            
-            if ' ' in command_input and not script_path.exists():
-                command_to_run = shlex.split(command_input)
-            else:
-                if not script_path.is_file():
-                    self.update_status(f"Error: Script not found at {command_input}", self.theme.LOG_LEVEL_COLORS['DELETED'])
-                    return
-
-                ext = script_path.suffix.lower()
-                interpreter_config = INTERPRETER_MAP.get(ext)
-
-                if ext == '.py':
-                    # Special handling for Python to check for 'python3' or 'python'
-                    # 'python3' 또는 'python'을 확인하기 위한 Python 특별 처리
-                    interpreter_path = shutil.which("python3") or shutil.which("python")
-                    if interpreter_path:
-                        command_to_run = [interpreter_path, str(script_path)]
-                        self.update_status(f"Found interpreter '{os.path.basename(interpreter_path)}' for '.py' file.", self.theme.ACCENT_COLOR)
-                    else:
-                        self.update_status("Error: 'python' or 'python3' not found in PATH.", self.theme.LOG_LEVEL_COLORS['DELETED'])
-                        return
-                elif interpreter_config:
-                    # Standard handling for other interpreters like 'go run', 'java -jar'
-                    # 'go run', 'java -jar'와 같은 다른 인터프리터를 위한 표준 처리
-                    base_command = interpreter_config[0]
-                    interpreter_path = shutil.which(base_command)
-                    if interpreter_path:
-                        command_args = interpreter_config[1:]
-                        command_to_run = [interpreter_path] + command_args + [str(script_path)]
-                        self.update_status(f"Found interpreter '{base_command}' for '{ext}' file.", self.theme.ACCENT_COLOR)
-                    else:
-                        self.update_status(f"Error: Interpreter '{base_command}' not found in PATH.", self.theme.LOG_LEVEL_COLORS['DELETED'])
-                        return
-                elif os.access(script_path, os.X_OK):
-                    # Fallback for executable files with no mapped interpreter
-                    # 매핑된 인터프리터가 없는 실행 파일에 대한 폴백
-                    command_to_run = [str(script_path)]
-                    self.update_status("No interpreter mapped. Attempting to run file directly.", self.theme.LOG_LEVEL_COLORS['WARNING'])
-                else:
-                    # Error if no interpreter is found and the file is not executable
-                    # 인터프리터를 찾을 수 없고 파일이 실행 가능하지 않은 경우 오류
-                    self.update_status("Error: Unknown file type and no execute permission.", self.theme.LOG_LEVEL_COLORS['DELETED'])
-                    return
-
-            log_dir = self.log_dir_var.get()
-            
             try:
                 current_file_path = Path(__file__).resolve()
-                target_path = Path(command_input.strip()).resolve()
+                target_path = Path(command_input).resolve()
                 if current_file_path == target_path:
                     messagebox.showerror("Execution Error", "The Log Viewer cannot run its own source file. Please select the script you wish to monitor.")
                     return
             except (OSError, ValueError): pass
-            
-            if not Path(log_dir).is_dir():
-                try: os.makedirs(log_dir, exist_ok=True)
-                except OSError as e:
-                    self.update_status(f"Error: Cannot create log directory: {e}", self.theme.LOG_LEVEL_COLORS['DELETED'])
-                    return
-            try: 
-                if os.path.exists(PAUSE_FLAG_PATH): os.remove(PAUSE_FLAG_PATH)
-            except Exception: pass
+
+            try:
+                log_file_path = new_log_file_path(self.log_dir_var.get())
+            except EngineError as e:
+                self.update_status(f"Error: {e}", self.theme.LOG_LEVEL_COLORS['DELETED'])
+                return
 
             self.is_paused = False
-            self.all_logs.clear(); self.undo_stack.clear(); self.redo_stack.clear()
-            self.log_area.config(state='normal'); self.log_area.delete(1.0, tk.END); self.log_area.config(state='disabled')
+            self.all_logs = self._new_log_store(with_timestamps=True); self.undo_journal.clear()
+            self.spill_error = None
+            self._close_file_indexer()
+            self.log_view.reset()
             self.update_status(f"Starting script: {Path(command_input).name}", self.theme.ACCENT_COLOR)
             self.master.update_idletasks()
-            self.last_progress_message = None
+            self.ingestor.reset()
             self.update_progress_display("")
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            log_filename = f"log_viewer_{timestamp}.log"
-
-            self.current_log_file_path = os.path.join(log_dir, log_filename)
-            self.log_file = None
+            self.ingest_stats.update(ticks=0, lines=0, last_tick_lines=0, last_tick_ms=0.0, max_tick_lines=0, max_tick_ms=0.0)
+            self.pipeline_stats.reset()
+            self.log_queue.close()
+            self.log_queue = IngestQueue()
+
+            self.current_log_file_path = log_file_path
+            self._close_log_writer()
+            self._close_edit_journal()
+            self._writer_bytes_seen = 0
             self.log_file_open = False
 
+            self.script_run = ScriptRun(command_to_run, cwd=cwd)
             try:
-                if "--data-dir" not in command_to_run:
-                    command_to_run.extend(["--data-dir", str(DATA_DIR)])
-
-                project_root = Path(command_input.strip()).resolve().parent
-                self.think_core_process = subprocess.Popen(
-                    command_to_run, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
-                    text=True, encoding='utf-8', errors='replace', bufsize=1,
-                    creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0,
-                    cwd=str(project_root)
-                )
+                self.script_run.start(lambda lines: self._enqueue_log('lines', lines), lambda returncode: self.master.after(0, self._on_run_finish))
+            except EngineError as e:
+                self.update_status(str(e), self.theme.LOG_LEVEL_COLORS['DELETED'])
+            else:
                 self.is_running = True
-                self.log_queue.put(('add', {'message': "Process started.", 'level': 'SYSTEM'}))
-                threading.Thread(target=self._read_think_core_output, daemon=True).start()
-                self.master.after(50, self.process_log_queue)
-            except Exception as e: self.update_status(f"Error starting process: {e}", self.theme.LOG_LEVEL_COLORS['DELETED'])
+                self._enqueue_log('add', {'message': "Process started.", 'level': 'SYSTEM'})
+                self.ingest_wakeup.start()
+                # A finished run's status loop may still be pending; only one may run at a time.
+                # 끝난 실행의 상태 루프가 아직 예약되어 있을 수 있으므로, 하나만 동작하도록 합니다.
+                if self._run_status_job: self.master.after_cancel(self._run_status_job)
+                self._run_status_job = self.master.after(LOG_WRITER_STATUS_INTERVAL_MS, self._update_run_status)
         self.update_ui_for_state()
 
+    def _enqueue_log(self, action, data):
+        """
+        # Queues log output for the display and wakes the UI loop. Safe to call from reader threads.
+        # 화면에 표시할 로그 출력을 큐에 넣고 UI 루프를 깨웁니다. 리더 스레드에서 호출해도 안전합니다.
+
+        # When the queue is full, the reader blocks, or the lines are dropped or sampled, per INGEST_OVERFLOW_POLICY.
+        # 큐가 가득 차면 INGEST_OVERFLOW_POLICY에 따라 리더가 대기하거나, 라인이 버려지거나 표본만 표시됩니다.
+        """
+        if action == 'lines': self.pipeline_stats.count('reader', len(data))
+        if self.log_queue.put(action, data):
+            self.ingest_wakeup.notify()
+
     def process_log_queue(self):
         """
-        # Processes log messages from the queue and adds them to the display.
-        # 큐의 로그 메시지를 처리하고 디스플레이에 추가합니다.
+        # Drains a bounded batch of log messages from the queue and applies it to the display in one pass.
+        # 큐에서 제한된 크기의 로그 메시지 배치를 꺼내 한 번에 화면에 반영합니다.
+
+        # Runs as the frame callback of ingest_wakeup, so it is only scheduled when output arrived or a backlog remains.
+        # ingest_wakeup의 프레임 콜백으로 실행되므로, 출력이 도착했거나 백로그가 남아 있을 때만 예약됩니다.
         """
-        messages_processed = False
+        tick_start = time.perf_counter()
+        deadline = tick_start + INGEST_TIME_BUDGET_MS / 1000
+        self.pipeline_stats.observe('queue_depth', self.log_queue.depth)
+        batch = []
         try:
-            while True:
+            while len(batch) < INGEST_MAX_LINES_PER_TICK:
                 action, data = self.log_queue.get_nowait()
-                messages_processed = True
-                msg_text = data.get('message', '')
-                all_log_types = "|".join(re.escape(k) for k in self.theme.LOG_LEVEL_COLORS.keys())
-                log_level_pattern = rf"\s*\[({all_log_types})]\\/\[({all_log_types})?\]"
-                level_match = re.search(log_level_pattern, msg_text, re.I)
-                level = level_match.group(1).upper() if level_match else 'INFO'
-                if level == 'PROGRESS':
-                    self.update_progress_display(msg_text.replace('\r', '').strip())
-                    self.last_progress_message = data
-                    continue
-                if self.last_progress_message:
-                    is_resume_or_pause_message = bool(re.search(r'\b(resumed|paused)\b', msg_text, re.I))
-                    if not self.is_paused and not is_resume_or_pause_message:
-                        final_message = self.last_progress_message['message'].replace('\r', '').strip()
-                        self.add_log(final_message, 'INFO', scroll=False)
-                        self.last_progress_message = None
-                        self.update_progress_display("")
-                self.add_log(msg_text, level, scroll=False)
+                if action == 'lines':
+                    batch += [(line, None) for line in data]
+                    if time.perf_counter() >= deadline: break
+                elif action == 'sampled':
+                    # Overflow under the 'disk' policy: everything goes to the file, only the sample to the display.
+                    # 'disk' 정책의 오버플로: 모든 라인은 파일로, 표본만 화면으로 보냅니다.
+                    file_lines, sample = data
+                    if batch: self._ingest_batch(batch); batch = []
+                    writer = self._ensure_log_writer()
+                    if writer is not None: writer.write_lines(file_lines)
+                    self._ingest_batch([(line, None) for line in sample], to_file=False)
+                    if time.perf_counter() >= deadline: break
+                else:
+                    batch.append((data.get('message', ''), data.get('level')))
+                    if len(batch) % 256 == 0 and time.perf_counter() >= deadline: break
         except queue.Empty: pass
+        try:
+            if batch: self._ingest_batch(batch)
         finally:
-            if messages_processed and self.log_area: self.log_area.see(tk.END)
-            if self.is_running or not self.log_queue.empty(): self.master.after(50, self.process_log_queue)
+            self._record_ingest_tick(len(batch), time.perf_counter() - tick_start)
+            if not self.log_queue.empty(): self.ingest_wakeup.request_frame()
+
+    def _ingest_batch(self, batch, to_file=True):
+        """
+        # Classifies a batch of queued (message, level or None) pairs, collapses PROGRESS updates (see LogIngestor) and appends the result to the log.
+        # 큐에서 꺼낸 (메시지, 레벨 또는 None) 쌍의 배치를 분류하고, PROGRESS 업데이트를 정리한 뒤 (LogIngestor 참고) 결과를 로그에 추가합니다.
+        """
+        with self.pipeline_stats.timed('classify'):
+            entries, progress_text = self.ingestor.ingest(batch, paused=self.is_paused)
+        if progress_text is not None: self.update_progress_display(progress_text)
+        if entries: self._append_logs(entries, to_file=to_file)
+
+    def _record_ingest_tick(self, line_count, duration):
+        """
+        # Updates the ingest counters (lines per tick, tick duration) used to monitor UI responsiveness.
+        # UI 응답성 확인에 사용되는 수집 카운터(틱당 라인 수, 틱 소요 시간)를 갱신합니다.
+        """
+        stats = self.ingest_stats
+        tick_ms = duration * 1000
+        self.pipeline_stats.count('displayed', line_count)
+        self.pipeline_stats.observe('frame', tick_ms)
+        stats['ticks'] += 1
+        stats['lines'] += line_count
+        stats['last_tick_lines'] = line_count
+        stats['last_tick_ms'] = tick_ms
+        stats['max_tick_lines'] = max(stats['max_tick_lines'], line_count)
+        stats['max_tick_ms'] = max(stats['max_tick_ms'], tick_ms)
+
+    def get_ingest_stats(self) -> dict:
+        """
+        # Returns a snapshot of the ingest counters, including the average lines per tick.
+        # 틱당 평균 라인 수를 포함한 수집 카운터의 스냅샷을 반환합니다.
+        """
+        stats = dict(self.ingest_stats)
+        stats['avg_tick_lines'] = stats['lines'] / stats['ticks'] if stats['ticks'] else 0.0
+        return stats
+
+    def get_pipeline_stats(self) -> dict:
+        """
+        # Returns the per-stage pipeline meters and histograms together with the ingest, queue and writer counters.
+        # 단계별 파이프라인 미터와 히스토그램을 수집, 큐, 기록기 카운터와 함께 반환합니다.
+        """
+        stats = self.pipeline_stats.snapshot()
+        stats['ingest'] = self.get_ingest_stats()
+        stats['queue'] = self.log_queue.stats()
+        stats['wakeup'] = {'wakeups': self.ingest_wakeup.wakeups, 'frames': self.ingest_wakeup.frames}
+        if self.log_writer is not None: stats['writer'] = self.log_writer.stats()
+        if self.watchdog is not None: stats['stalls'] = self.watchdog.summary()
+        return stats
+
+    def _toggle_stats_overlay(self):
+        """
+        # Shows or hides the pipeline statistics overlay in the top right corner of the log area.
+        # 로그 영역 오른쪽 위의 파이프라인 통계 오버레이를 표시하거나 숨깁니다.
+        """
+        if self.stats_overlay is not None:
+            if self._stats_overlay_job: self.master.after_cancel(self._stats_overlay_job)
+            self._stats_overlay_job = None
+            self.stats_overlay.destroy(); self.stats_overlay = None
+            return
+        self.stats_overlay = Label(self.log_area_frame, font=(self.theme.FONT_FAMILY_LOG, 9), justify="left", anchor="nw", padx=8, pady=6)
+        self.stats_overlay.place(relx=1.0, x=-24, y=8, anchor="ne")
+        self._refresh_stats_overlay()
+
+    def _refresh_stats_overlay(self):
+        """
+        # Redraws the overlay from a fresh snapshot and reschedules itself while the overlay is shown.
+        # 새 스냅샷으로 오버레이를 다시 그리고, 오버레이가 표시되는 동안 스스로를 다시 예약합니다.
+        """
+        if self.stats_overlay is None: return
+        queue_stats = self.log_queue.stats()
+        text = self.pipeline_stats.format_table()
+        text += f"\n\nqueue now {queue_stats['depth']:,} lines, lag {queue_stats['lag']:.2f}s (F12 to hide)"
+        self.stats_overlay.config(text=text, bg=self.theme.WIDGET_BG_COLOR, fg=self.theme.TEXT_COLOR)
+        self._stats_overlay_job = self.master.after(INSTRUMENTATION_REFRESH_MS, self._refresh_stats_overlay)
+
+    def _dump_pipeline_stats(self):
+        """
+        # Writes get_pipeline_stats() to pipeline_stats_<timestamp>.json in the log directory.
+        # get_pipeline_stats()를 로그 디렉토리의 pipeline_stats_<timestamp>.json에 기록합니다.
+        """
+        log_dir = self.log_dir_var.get() or str(LOG_DIR)
+        path = os.path.join(log_dir, f"pipeline_stats_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+        try:
+            os.makedirs(log_dir, exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(self.get_pipeline_stats(), f, indent=2, default=str)
+            self.update_status(f"Pipeline statistics written to {path}", self.theme.ACCENT_COLOR)
+        except OSError as e:
+            self.update_status(f"Error writing pipeline statistics: {e}", self.theme.LOG_LEVEL_COLORS['DELETED'])
 
     def _on_run_finish(self):
         """
         # Cleans up and updates the UI after the script process has finished.
         # 스크립트 프로세스가 완료된 후 UI를 정리하고 업데이트합니다.
+
+        # The output reader has ended, so the ingest queue only shrinks now. The finish waits until the (time-budgeted)
+        # frames have drained it, so the backlog still reaches the run log file before the writer is closed.
+        # 출력 읽기 스레드가 끝났으므로 수집 큐는 이제 줄어들기만 합니다. 마무리는 (시간 예산이 있는) 프레임이 큐를
+        # 모두 비울 때까지 기다리므로, 백로그도 기록기가 닫히기 전에 실행 로그 파일에 기록됩니다.
         """
+        if not self.log_queue.empty():
+            self.ingest_wakeup.request_frame()
+            self.master.after(1000 // INGEST_MAX_FPS, self._on_run_finish)
+            return
         self.is_running = False
-        self.last_progress_message = None
+        if self._run_status_job: self.master.after_cancel(self._run_status_job)
+        self._run_status_job = None
+        self.ingest_wakeup.stop()
+        self.ingestor.reset()
         self.update_progress_display("")
-        if hasattr(self, 'log_file') and self.log_file and not self.log_file.closed:
-            self.log_file.close()
+        if self.log_writer is not None:
             self.log_file_open = True
-        self.undo_stack.clear(); self.redo_stack.clear()
+        self.undo_journal.clear()
         self.update_ui_for_state()
         self._perform_search_and_filter_logs(scroll_to_end=False)
         self.update_status("Process finished.", self.theme.ACCENT_COLOR)
-
-    def _read_think_core_output(self):
-        """
-        # Reads the output from the running script process in a separate thread.
-        # 별도의 스레드에서 실행 중인 스크립트 프로세스의 출력을 읽습니다.
-        """
-        def enqueue_output(stream):
-            for line in iter(stream.readline, ''):
-                line_stripped = line.strip()
-                if not line_stripped: continue
-                self.log_queue.put(('add', {'message': line_stripped}))
-            stream.close()
-        stdout_thread = threading.Thread(target=enqueue_output, args=(self.think_core_process.stdout,), daemon=True)
-        stderr_thread = threading.Thread(target=enqueue_output, args=(self.think_core_process.stderr,), daemon=True)
-        stdout_thread.start(); stderr_thread.start()
-        self.think_core_process.wait()
-        self.master.after(0, self._on_run_finish)
+        self._close_log_writer()
 
     def toggle_pause_resume(self):
         """
@@ -1801,16 +2077,16 @@ class LogDisplay(tk.Frame):
         # 실행 중인 스크립트의 일시정지/재개 상태를 토글합니다.
         """
         if self.is_paused:
-            if self.undo_stack: self.save_log_changes()
-            if os.path.exists(PAUSE_FLAG_PATH): os.remove(PAUSE_FLAG_PATH)
+            if self.undo_journal.has_changes: self.save_log_changes()
+            if self.script_run is not None: self.script_run.resume()
             self.is_paused = False
-            self.log_queue.put(('add', {'message': f"[{datetime.now().strftime('%H:%M:%S')}] [SYSTEM] Process resumed.", 'level': 'SYSTEM'}))
+            self._enqueue_log('add', {'message': f"[{datetime.now().strftime('%H:%M:%S')}] [SYSTEM] Process resumed.", 'level': 'SYSTEM'})
         else:
             if not self.is_running: return
-            with open(PAUSE_FLAG_PATH, "w") as f: f.write("paused")
+            self.script_run.pause()
             self.is_paused = True
             self._perform_search_and_filter_logs(scroll_to_end=False)
-            self.log_queue.put(('add', {'message': f"[{datetime.now().strftime('%H:%M:%S')}] [SYSTEM] Process paused.", 'level': 'SYSTEM'}))
+            self._enqueue_log('add', {'message': f"[{datetime.now().strftime('%H:%M:%S')}] [SYSTEM] Process paused.", 'level': 'SYSTEM'})
         self.update_ui_for_state()
 
     def open_log_folder(self):
@@ -1830,46 +2106,154 @@ class LogDisplay(tk.Frame):
 
     def _load_log_file(self, file_path: str):
         """
-        # Loads and displays the content of a selected log file.
-        # 선택된 로그 파일의 내용을 로드하고 표시합니다.
+        # Opens a log file lazily: the file is memory-mapped and indexed in the background, and lines are shown as they are indexed.
+        # 로그 파일을 지연 방식으로 엽니다: 파일은 메모리 매핑되어 백그라운드에서 인덱싱되며, 인덱싱되는 대로 라인이 표시됩니다.
         """
+        if self.log_saver is not None:
+            # The save still reads the current store and its mapped file, which opening another file would release.
+            # 저장이 아직 현재 저장소와 매핑된 파일을 읽고 있으며, 다른 파일을 열면 이것이 해제됩니다.
+            self.update_status("Cannot open a log file while saving.", self.theme.LOG_LEVEL_COLORS['DELETED']); return
         if not file_path or not os.path.isfile(file_path):
             self.update_status(f"Error: Log file not found at {file_path}", self.theme.LOG_LEVEL_COLORS['DELETED'])
             return
         try:
-            self.all_logs, self.undo_stack, self.redo_stack = [], [], []
-            all_log_types = "|".join(re.escape(k) for k in self.theme.LOG_LEVEL_COLORS.keys())
-            log_pattern = re.compile(rf"\s*\[({all_log_types})]\\/\[({all_log_types})?\]", re.I)
-            with open(file_path, "r", encoding="utf-8") as f:
-                lines = f.readlines()
-            processed_lines = []
-            for i, line in enumerate(lines):
-                is_progress = "[PROGRESS]" in line
-                if is_progress:
-                    is_last_line = (i == len(lines) - 1)
-                    next_line_is_not_progress = not is_last_line and "[PROGRESS]" not in lines[i + 1]
-                    if is_last_line or next_line_is_not_progress:
-                        processed_lines.append(line)
-                else:
-                    processed_lines.append(line)
-            for line in processed_lines:
-                line_stripped = line.strip()
-                if not line_stripped:
-                    continue
-                match = log_pattern.search(line_stripped)
-                level = match.group(1).upper() if match else "INFO"
-                if level == 'PROGRESS':
-                    level = 'INFO'
-                self.all_logs.append({'message': line_stripped, 'level': level, 'state': 'SAVED'})
-            self.log_file_open, self.is_running = True, False
-            self.current_log_file_path = file_path
-            self.log_dir_var.set(os.path.dirname(file_path))
-            self._perform_search_and_filter_logs(scroll_to_end=True)
-            self.update_status(f"Opened log file: {os.path.basename(file_path)}", self.theme.ACCENT_COLOR)
-        except Exception as e: 
+            indexer = LogFileIndexer(file_path, self.level_classifier)
+        except (OSError, ValueError) as e:
             self.update_status(f"Error reading log file: {e}", self.theme.LOG_LEVEL_COLORS['DELETED'])
-        finally:
             self.update_ui_for_state()
+            return
+        self.all_logs = self._new_log_store(with_timestamps=True); self.undo_journal.clear()
+        self._close_file_indexer()
+        self._close_edit_journal()
+        self._recovered_edits = EditJournal.load(file_path)
+        self.edit_journal = EditJournal(file_path)
+        self.all_logs.attach_mapped(indexer.buffer)
+        self.file_indexer, self._index_published, self._tail_published = indexer, 0, False
+        self.log_file_open, self.is_running = True, False
+        self.current_log_file_path = file_path
+        self.log_dir_var.set(os.path.dirname(file_path))
+        self._perform_search_and_filter_logs(scroll_to_end=False)
+        self.update_status(f"Opening log file: {os.path.basename(file_path)}", self.theme.ACCENT_COLOR)
+        self.update_ui_for_state()
+        indexer.start()
+        self._poll_file_indexer()
+
+    def _poll_file_indexer(self):
+        """
+        # Publishes the lines indexed since the last poll to the log store and view, and reports indexing progress.
+        # 마지막 확인 이후 인덱싱된 라인을 로그 저장소와 뷰에 게시하고, 인덱싱 진행률을 보고합니다.
+
+        # If the indexer indexed a separate tail, it is published first at the end of the store and shown at once; the
+        # lines of the full scan before tail_start are then inserted in front of it, keeping the view where it is.
+        # 인덱서가 별도의 끝부분을 인덱싱했다면, 이를 먼저 저장소 끝에 게시하여 바로 표시합니다. 이후 전체 스캔의
+        # tail_start 이전 라인들을 그 앞에 삽입하며, 뷰는 현재 위치를 유지합니다.
+        """
+        indexer = self.file_indexer
+        if indexer is None:
+            return
+        tail_start = indexer.tail_start
+        if tail_start is not None:
+            table = bytes(self.all_logs.level_code(name) for name in indexer.level_names).ljust(256, b'\0')
+            has_tail = tail_start < indexer.size
+            if has_tail and not self._tail_published:
+                tail = indexer.tail
+                self.all_logs.extend_mapped(tail.offsets, tail.lengths, tail.levels.tobytes().translate(table), tail.times)
+                self._tail_published = True
+                self.log_view.append_from(0, scroll=False)
+                self.log_view.scroll_to_end()
+            start, end = self._index_published, len(indexer)
+            if has_tail:
+                # Entries of the full scan from tail_start on are the tail entries, which are already published.
+                # 전체 스캔에서 tail_start 이후의 항목은 이미 게시된 끝부분 항목입니다.
+                end = bisect_left(indexer.offsets, tail_start, start, end)
+            if end > start:
+                offsets, lengths, times = indexer.offsets[start:end], indexer.lengths[start:end], indexer.times[start:end]
+                level_codes = indexer.levels[start:end].tobytes().translate(table)
+                if has_tail:
+                    self.all_logs.insert_mapped(start, offsets, lengths, level_codes, times)
+                    self._index_published = end
+                    self.log_view.insert_block(start, end - start)
+                else:
+                    store_start = len(self.all_logs)
+                    self.all_logs.extend_mapped(offsets, lengths, level_codes, times)
+                    self._index_published = end
+                    self.log_view.append_from(store_start, scroll=False)
+
+        name = os.path.basename(indexer.path)
+        if indexer.error is not None:
+            self._update_load_indicator()
+            self.update_ui_for_state()
+            self.update_status(f"Error reading log file: {indexer.error}", self.theme.LOG_LEVEL_COLORS['DELETED'])
+        elif indexer.done:
+            self._update_load_indicator()
+            self.update_ui_for_state()
+            reused = " from index" if indexer.reused_bytes else ""
+            self.update_status(f"Opened log file: {name} ({len(self.all_logs):,} lines{reused})", self.theme.ACCENT_COLOR)
+            if self._restore_view_row is not None:
+                self.log_view.render_window(self._restore_view_row)
+                self._restore_view_row = None
+            elif not self._tail_published:
+                self.log_view.scroll_to_end()
+            if self.search_var.get():
+                self.search_engine.run()
+            self._offer_edit_recovery()
+        else:
+            self._update_load_indicator()
+            self.master.after(INDEX_POLL_INTERVAL_MS, self._poll_file_indexer)
+
+    def _file_loading(self) -> bool:
+        """
+        # Returns whether a log file is still being indexed; editing waits until it is complete.
+        # 로그 파일이 아직 인덱싱 중인지 반환합니다. 편집은 인덱싱이 끝날 때까지 기다립니다.
+        """
+        return self.file_indexer is not None and not self.file_indexer.done and self.file_indexer.error is None
+
+    def _update_load_indicator(self):
+        """
+        # Shows the progress of the log file being loaded, with its Cancel action, in the status bar, or hides it.
+        # 로드 중인 로그 파일의 진행률을 취소 동작과 함께 상태 표시줄에 표시하거나 숨깁니다.
+        """
+        indexer = self.file_indexer
+        if not self._file_loading():
+            self.load_frame.pack_forget()
+            return
+        self.load_label.config(text=f"Loading {os.path.basename(indexer.path)}: {indexer.progress:.0%} ({len(self.all_logs):,} lines)")
+        self.load_progressbar['value'] = indexer.progress
+        if not self.load_frame.winfo_manager():
+            self.load_frame.pack(side="left", padx=(10,0), after=self.status_label)
+
+    def _cancel_file_load(self):
+        """
+        # Cancels opening a log file and closes it. Its unsaved edits journal, if any, is kept for the next time it is opened.
+        # 로그 파일 열기를 취소하고 파일을 닫습니다. 저장되지 않은 편집 저널이 있다면 다음에 열 때를 위해 보존됩니다.
+        """
+        if not self._file_loading():
+            return
+        name = os.path.basename(self.file_indexer.path)
+        if self.editor_window_instance and self.editor_window_instance.winfo_exists(): self.editor_window_instance.close_window()
+        self.all_logs = self._new_log_store(); self.undo_journal.clear()
+        self._close_edit_journal()
+        self._close_file_indexer()
+        self.log_view.reset()
+        self.log_file_open = False
+        self.current_log_file_path = None
+        self._restore_view_row = None
+        self.selected_log_line_index = self.selected_log_abs_index = None
+        self.update_ui_for_state()
+        self.update_status(f"Opening {name} cancelled.", self.theme.DISABLED_TEXT_COLOR)
+
+    def _close_file_indexer(self):
+        """
+        # Cancels any file indexing in progress and releases the mapped file. The log store must no longer reference it.
+        # 진행 중인 파일 인덱싱을 취소하고 매핑된 파일을 해제합니다. 로그 저장소는 더 이상 이를 참조하지 않아야 합니다.
+        """
+        indexer, self.file_indexer = self.file_indexer, None
+        if indexer is not None:
+            # A search worker may still be reading the mapping that is about to be closed.
+            # 검색 작업 스레드가 곧 닫힐 매핑을 아직 읽고 있을 수 있습니다.
+            self.search_engine.stop()
+            indexer.close()
+            self._update_load_indicator()
 
     def open_log_file(self):
         """
@@ -1890,7 +2274,7 @@ class LogDisplay(tk.Frame):
         # Increases the font size of the log area.
         # 로그 영역의 글꼴 크기를 늘립니다.
         """
-        self.log_font_size += 1; self.configure_tags(); self._perform_search_and_filter_logs(scroll_to_end=False)
+        self.log_font_size += 1; self.configure_tags(); self.log_view.refresh()
         self.update_status(f"Font size: {self.log_font_size}", self.theme.ACCENT_COLOR)
 
     def _decrease_font_size(self):
@@ -1901,7 +2285,7 @@ class LogDisplay(tk.Frame):
         if self.log_font_size > 8: 
             self.log_font_size -= 1
             self.configure_tags()
-            self._perform_search_and_filter_logs(scroll_to_end=False)
+            self.log_view.refresh()
             self.update_status(f"Font size: {self.log_font_size}", self.theme.ACCENT_COLOR)
         else: 
             self.update_status("Minimum font size reached.", self.theme.DISABLED_TEXT_COLOR)
@@ -1913,8 +2297,12 @@ class LogDisplay(tk.Frame):
         """
         if self.editor_window_instance and self.editor_window_instance.winfo_exists(): self.editor_window_instance.close_window()
         self.log_file_open = False
-        self.all_logs, self.undo_stack, self.redo_stack = [], [], []
-        self.log_area.config(state='normal'); self.log_area.delete(1.0, tk.END); self.log_area.config(state='disabled')
+        if self.log_saver is not None:
+            self.log_saver.cancel(); self.log_saver = None
+        self.all_logs = self._new_log_store(); self.undo_journal.clear()
+        self._close_edit_journal(discard=True)
+        self._close_file_indexer()
+        self.log_view.reset()
         self.current_log_file_path = None
         self.update_ui_for_state()
 
@@ -1922,20 +2310,90 @@ class LogDisplay(tk.Frame):
         """
         # Saves any modifications (add, edit, delete) to the currently open log file.
         # 현재 열려있는 로그 파일에 대한 모든 수정 사항(추가, 편집, 삭제)을 저장합니다.
+
+        # The file is written in the background to a temporary file (unchanged lines are copied from the original) and then
+        # renamed over the log file, so a failed or interrupted save never leaves a partial log behind.
+        # 파일은 백그라운드에서 임시 파일로 기록되며 (변경되지 않은 라인은 원본에서 복사), 이후 로그 파일 위로 이름이
+        # 바뀌므로 실패하거나 중단된 저장이 불완전한 로그를 남기지 않습니다.
         """
         if not self.current_log_file_path:
             self.update_status("No log file open to save changes.", self.theme.LOG_LEVEL_COLORS['DELETED']); return
-        logs_to_write = [{'state': 'SAVED', 'message': e['message'].replace('DELETED: ', '', 1), 'level': e['level']} for e in self.all_logs if e.get('state') != 'DELETED']
-        self.all_logs = logs_to_write
+        if self.file_indexer is not None and not self.file_indexer.done:
+            self.update_status("Cannot save while the log file is still being indexed.", self.theme.LOG_LEVEL_COLORS['DELETED']); return
+        if self.log_saver is not None:
+            self.update_status("A save is already in progress.", self.theme.DISABLED_TEXT_COLOR); return
+        if self.file_indexer is None and self.log_queue.disk_only:
+            self.update_status(f"Cannot save: {self.log_queue.disk_only:,} lines of this run were only written to the log file. Open the file to edit it.", self.theme.LOG_LEVEL_COLORS['DELETED']); return
+        self.log_saver = LogSaver(self.all_logs, self.current_log_file_path)
+        self.log_saver.start()
+        self.update_ui_for_state()
+        self._poll_log_saver()
+
+    def _poll_log_saver(self):
+        """
+        # Reports the progress of the background save and finishes it on the UI thread once the temporary file is complete.
+        # 백그라운드 저장의 진행률을 보고하고, 임시 파일이 완성되면 UI 스레드에서 저장을 마무리합니다.
+        """
+        saver = self.log_saver
+        if saver is None:
+            return
+        name = os.path.basename(saver.path)
+        if not saver.done:
+            self.update_progress_display(f"Saving {name}: {saver.progress:.0%}")
+            self.master.after(SAVE_POLL_INTERVAL_MS, self._poll_log_saver)
+            return
+        self.log_saver = None
+        self.update_progress_display("")
+        if saver.error is not None:
+            self.update_status(f"Error saving changes: {saver.error}", self.theme.LOG_LEVEL_COLORS['DELETED'])
+        elif self.file_indexer is not None:
+            self._finish_mapped_save(saver)
+        else:
+            self._finish_run_save(saver)
+        self.update_ui_for_state()
+
+    def _finish_mapped_save(self, saver):
+        """
+        # Replaces an opened log file with its saved version and re-opens it, keeping the view near its position.
+        # 열린 로그 파일을 저장된 버전으로 교체하고 다시 열며, 뷰는 원래 위치 근처로 유지합니다.
+        """
+        self._restore_view_row = self.log_view.top_row()
+        # The mapping must be released before the file can be replaced (required on Windows); the store is reloaded below.
+        # 파일을 교체하려면 먼저 매핑을 해제해야 합니다 (Windows에서 필수). 저장소는 아래에서 다시 로드됩니다.
+        self._close_file_indexer()
         try:
-            with open(self.current_log_file_path, 'w', encoding='utf-8') as f: 
-                for log_entry in self.all_logs: f.write(log_entry['message'] + '\n')
-            self.update_status(f"Changes saved to {os.path.basename(self.current_log_file_path)}", self.theme.LOG_LEVEL_COLORS['ADDED'])
-            self.undo_stack, self.redo_stack = [], []
-            self.selected_log_line_index = self.selected_log_abs_index = None
-            self._perform_search_and_filter_logs(scroll_to_end=False)
-        except Exception as e: self.update_status(f"Error saving changes: {e}", self.theme.LOG_LEVEL_COLORS['DELETED'])
-        finally: self.update_ui_for_state()
+            saver.replace()
+        except OSError as e:
+            saver.discard()
+            self._close_edit_journal()
+            self._load_log_file(saver.path)
+            self.update_status(f"Error saving changes: {e}", self.theme.LOG_LEVEL_COLORS['DELETED'])
+            return
+        self._close_edit_journal(discard=True)
+        self._load_log_file(saver.path)
+        self.update_status(f"Changes saved to {os.path.basename(saver.path)}", self.theme.LOG_LEVEL_COLORS['ADDED'])
+
+    def _finish_run_save(self, saver):
+        """
+        # Replaces the log file of a run with its saved version, carrying over lines logged while the save was running.
+        # 실행의 로그 파일을 저장된 버전으로 교체하며, 저장 중에 기록된 라인도 함께 옮깁니다.
+        """
+        # The run log writer holds the old file open; it is reopened on the next logged line.
+        # 실행 로그 기록기가 이전 파일을 열고 있으므로 닫으며, 다음 로그 라인에서 다시 열립니다.
+        self._close_log_writer()
+        store = self.all_logs
+        try:
+            saver.append_lines([store.message(i) for i in range(saver.total, len(store)) if not store.is_deleted(i)])
+            saver.replace()
+        except OSError as e:
+            saver.discard()
+            self.update_status(f"Error saving changes: {e}", self.theme.LOG_LEVEL_COLORS['DELETED'])
+            return
+        store.purge_deleted(saver.prefixed)
+        self.undo_journal.clear()
+        self.selected_log_line_index = self.selected_log_abs_index = None
+        self._perform_search_and_filter_logs(scroll_to_end=False)
+        self.update_status(f"Changes saved to {os.path.basename(saver.path)}", self.theme.LOG_LEVEL_COLORS['ADDED'])
 
     def update_ui_for_state(self):
         """
@@ -1958,7 +2416,7 @@ class LogDisplay(tk.Frame):
         elif self.log_file_open:
             current_state = "LOG_VIEW"
 
-        is_editable = current_state in ["PAUSED", "LOG_VIEW"]
+        is_editable = current_state in ["PAUSED", "LOG_VIEW"] and self.log_saver is None and not self._file_loading()
         self.comment_entry.config(state="normal" if is_editable else "disabled")
         self.send_button.config(state="normal" if is_editable else "disabled")
         self.command_button.config(state="normal" if is_editable else "disabled")
@@ -1971,7 +2429,7 @@ class LogDisplay(tk.Frame):
 
         elif current_state == "PAUSED":
             style_btn(self.run_exit_button, text="Kill", bg=self.theme.KILL_COLOR, hover_color=self.theme.KILL_HOVER_COLOR, state="normal", command=self.toggle_run_exit, hover_border_color=self.theme.KILL_HOVER_COLOR)
-            if self.undo_stack:
+            if self.undo_journal.has_changes:
                 style_btn(self.pause_resume_button, text="Save & Resume", bg=self.theme.PRIMARY_COLOR, hover_color=self.theme.PRIMARY_HOVER_COLOR, state="normal", command=self.toggle_pause_resume)
             else:
                 style_btn(self.pause_resume_button, text="Resume", bg=self.theme.SUCCESS_COLOR, hover_color=self.theme.SUCCESS_HOVER_COLOR, state="normal", command=self.toggle_pause_resume, hover_border_color=self.theme.SUCCESS_HOVER_COLOR)
@@ -1980,11 +2438,11 @@ class LogDisplay(tk.Frame):
 
         elif current_state == "LOG_VIEW":
             style_btn(self.run_exit_button, text="Exit", bg=self.theme.KILL_COLOR, hover_color=self.theme.KILL_HOVER_COLOR, state="normal", command=self.exit_log_view_mode, hover_border_color=self.theme.KILL_HOVER_COLOR)
-            if self.undo_stack:
+            if self.undo_journal.has_changes:
                 style_btn(self.pause_resume_button, text="Save", bg=self.theme.PRIMARY_COLOR, hover_color=self.theme.PRIMARY_HOVER_COLOR, state="normal", command=self.save_log_changes)
             else:
                 style_btn(self.pause_resume_button, text="Save", bg=self.theme.DISABLED_BUTTON_STYLE['bg'], fg=self.theme.DISABLED_TEXT_COLOR, state="disabled", command=lambda: None)
-            if not self.undo_stack and "undo" not in self.status_label.cget("text").lower() and "redo" not in self.status_label.cget("text").lower():
+            if not self.undo_journal.has_changes and "undo" not in self.status_label.cget("text").lower() and "redo" not in self.status_label.cget("text").lower():
                 self.update_status(f"Viewing: {os.path.basename(self.current_log_file_path)}", self.theme.ACCENT_COLOR)
             self.comment_entry.config(fg=self.theme.TEXT_COLOR); self.comment_entry.delete(1.0, tk.END)
 
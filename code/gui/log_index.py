@@ -0,0 +1,375 @@
+"""
+# Lazy line index for opening large log files.
+# 대용량 로그 파일을 열기 위한 지연 라인 인덱스입니다.
+
+# The file is memory-mapped and scanned once on a background thread, recording only the offset, length,
+# level code and header time of every kept line. Message text stays in the mapping and is decoded on access.
+# 파일은 메모리 매핑되어 백그라운드 스레드에서 한 번만 스캔되며, 유지되는 각 라인의 오프셋, 길이,
+# 레벨 코드, 헤더 시간만 기록합니다. 메시지 텍스트는 매핑에 남아 있다가 접근할 때 디코딩됩니다.
+
+# The finished index is kept in a sidecar file in DATA_DIR, so reopening the file only loads the index
+# (and scans the appended tail if the file has grown).
+# 완성된 인덱스는 DATA_DIR의 사이드카 파일에 보관되므로, 파일을 다시 열 때는 인덱스만 로드합니다
+# (파일이 커진 경우 추가된 끝부분만 스캔합니다).
+
+# When much remains to be scanned, the last INDEX_TAIL_BYTES are indexed first into separate tail columns,
+# so the end of the file (what is looked at first) can be shown before the full scan reaches it.
+# 스캔할 양이 많으면 마지막 INDEX_TAIL_BYTES를 먼저 별도의 끝부분 열에 인덱싱하여, 전체 스캔이 도달하기 전에
+# 파일의 끝(가장 먼저 보는 부분)을 표시할 수 있게 합니다.
+"""
+
+import os
+import sys
+import json
+import time
+import mmap
+import hashlib
+import threading
+from array import array
+from pathlib import Path
+from typing import Optional
+from .classifier import LevelClassifier
+from .config import INDEX_CHUNK_BYTES, INDEX_DIR, INDEX_HASH_BYTES, INDEX_TAIL_BYTES, INDEX_MAX_AGE_DAYS, INDEX_MAX_BYTES
+
+SIDECAR_MAGIC = b'GLIDX1\n'
+SIDECAR_VERSION = 1
+
+def sidecar_path(path: str) -> Path:
+    """
+    # Returns the sidecar index path for a log file: INDEX_DIR/<name>.<path hash>.idx.
+    # 로그 파일의 사이드카 인덱스 경로를 반환합니다: INDEX_DIR/<이름>.<경로 해시>.idx.
+    """
+    absolute = os.path.abspath(path)
+    digest = hashlib.blake2b(os.path.normcase(absolute).encode('utf-8'), digest_size=4).hexdigest()
+    return INDEX_DIR / f"{os.path.basename(absolute)}.{digest}.idx"
+
+def prune_sidecars(keep: Optional[Path] = None, directory: Path = INDEX_DIR,
+                   max_age_days: float = INDEX_MAX_AGE_DAYS, max_bytes: int = INDEX_MAX_BYTES):
+    """
+    # Deletes sidecars (and leftover temporary files) unused for longer than max_age_days, then the least recently used
+    # ones while the directory exceeds max_bytes. keep is never deleted. A sidecar's mtime is its last use.
+    # max_age_days보다 오래 사용되지 않은 사이드카 (및 남은 임시 파일)를 삭제하고, 이후 디렉토리가 max_bytes를
+    # 넘는 동안 가장 오래전에 사용된 것부터 삭제합니다. keep은 삭제하지 않습니다. 사이드카의 mtime이 마지막 사용 시각입니다.
+    """
+    try:
+        entries = [(entry.stat().st_mtime, entry.stat().st_size, entry.path) for entry in os.scandir(directory)
+                   if entry.is_file() and entry.name.endswith(('.idx', '.idx.tmp'))]
+    except OSError:
+        return
+    entries.sort(reverse=True)
+    cutoff = time.time() - max_age_days * 86400 if max_age_days else None
+    keep_path = os.path.normcase(str(keep)) if keep is not None else None
+    total = sum(size for _, size, path in entries if os.path.normcase(path) == keep_path)
+    for mtime, size, path in entries:
+        if os.path.normcase(path) == keep_path:
+            continue
+        # A temporary file may be a sidecar being written by another process, so it only expires by age.
+        # 임시 파일은 다른 프로세스가 기록 중인 사이드카일 수 있으므로, 나이로만 만료됩니다.
+        temporary = path.endswith('.tmp')
+        if (cutoff is not None and mtime < cutoff) or (max_bytes and not temporary and total + size > max_bytes):
+            try: os.remove(path)
+            except OSError: pass
+        elif not temporary:
+            total += size
+
+class IndexColumns:
+    """
+    # The offset, length, header time and level code of indexed lines, plus the PROGRESS line still waiting for its successor.
+    # 인덱싱된 라인의 오프셋, 길이, 헤더 시간, 레벨 코드와, 다음 라인을 기다리는 PROGRESS 라인입니다.
+    """
+    def __init__(self):
+        self.offsets = array('Q')
+        self.lengths = array('L')
+        self.times = array('d')
+        self.levels = array('B')
+        self.pending = None
+
+    def __len__(self) -> int:
+        # levels is appended last, so every index below len(levels) is complete in all columns.
+        # levels가 마지막에 추가되므로, len(levels) 미만의 모든 인덱스는 모든 열에서 완전합니다.
+        return len(self.levels)
+
+    def emit(self, offset: int, length: int, code: int, time_of_day: float):
+        self.offsets.append(offset)
+        self.lengths.append(length)
+        self.times.append(time_of_day)
+        self.levels.append(code)
+
+    def clear(self):
+        for column in (self.offsets, self.lengths, self.times, self.levels):
+            del column[:]
+        self.pending = None
+
+class LogFileIndexer:
+    """
+    # Builds the line index of a log file over an mmap on a background thread, with progress and cancellation.
+    # 백그라운드 스레드에서 mmap을 통해 로그 파일의 라인 인덱스를 만들며, 진행률과 취소를 지원합니다.
+
+    # Like the previous loader, lines are stripped, empty lines are skipped, and a PROGRESS line is dropped when the
+    # next line is also PROGRESS; the PROGRESS lines that remain are indexed as INFO. The time column holds the
+    # seconds since midnight of the "[HH:MM:SS]" header, or -1 when a line has none.
+    # 이전 로더와 마찬가지로 라인의 공백을 제거하고 빈 라인은 건너뛰며, 다음 라인도 PROGRESS인 PROGRESS 라인은
+    # 제외합니다. 남은 PROGRESS 라인은 INFO로 인덱싱됩니다. 시간 열은 "[HH:MM:SS]" 헤더의 자정 이후 초를
+    # 담으며, 헤더가 없는 라인은 -1입니다.
+    """
+    def __init__(self, path: str, classifier: LevelClassifier):
+        """
+        # Opens and maps the file. Call start() to begin indexing.
+        # 파일을 열고 매핑합니다. 인덱싱을 시작하려면 start()를 호출하십시오.
+
+        # Raises:
+        #     OSError: If the file cannot be opened or mapped. (파일을 열거나 매핑할 수 없는 경우)
+        """
+        self.path = path
+        self.classifier = classifier
+        self.file = open(path, 'rb')
+        self.size = os.fstat(self.file.fileno()).st_size
+        self.buffer = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ) if self.size else b''
+
+        self.level_names = []
+        self.level_codes = {}
+        self._header_codes = {}
+        for level in sorted(classifier.levels):
+            self._header_codes[level.encode('ascii', 'replace')] = self._code(level)
+        self._info_code = self._code('INFO')
+        self._progress_code = self._code('PROGRESS')
+
+        # The columns are only ever modified in place, so these aliases stay valid.
+        # 열은 항상 제자리에서만 수정되므로, 이 별칭들은 계속 유효합니다.
+        self.columns = IndexColumns()
+        self.offsets, self.lengths, self.times, self.levels = self.columns.offsets, self.columns.lengths, self.columns.times, self.columns.levels
+        # Lines from tail_start on are also indexed into tail before the full scan starts. tail_start stays None until
+        # that is decided, and equals the file size when there is no separate tail.
+        # tail_start부터의 라인은 전체 스캔이 시작되기 전에 tail에도 인덱싱됩니다. tail_start는 이것이 결정될 때까지
+        # None이며, 별도의 끝부분이 없으면 파일 크기와 같습니다.
+        self.tail = IndexColumns()
+        self.tail_start: Optional[int] = None
+        self.scanned = 0
+        self.reused_bytes = 0
+        self.done = False
+        self.error: Optional[Exception] = None
+        self._cancel = threading.Event()
+        self._thread = None
+        self.mtime_ns = os.fstat(self.file.fileno()).st_mtime_ns
+        self.sidecar = sidecar_path(path)
+
+    def _code(self, level: str) -> int:
+        code = self.level_codes.get(level)
+        if code is None:
+            if len(self.level_names) >= 256:
+                raise ValueError(f"Too many distinct log levels (max 256): {level}")
+            code = len(self.level_names)
+            self.level_names.append(level)
+            self.level_codes[level] = code
+        return code
+
+    # --- Control (제어) ---
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="LogFileIndexer", daemon=True)
+        self._thread.start()
+
+    def cancel(self):
+        self._cancel.set()
+
+    def close(self):
+        """
+        # Stops indexing and releases the mapping. Entries pointing into it must no longer be accessed.
+        # 인덱싱을 중지하고 매핑을 해제합니다. 이후 매핑을 가리키는 항목에 접근해서는 안 됩니다.
+        """
+        self.cancel()
+        if self._thread is not None:
+            self._thread.join()
+        if isinstance(self.buffer, mmap.mmap):
+            self.buffer.close()
+        self.file.close()
+
+    @property
+    def progress(self) -> float:
+        return self.scanned / self.size if self.size else 1.0
+
+    def __len__(self) -> int:
+        return len(self.columns)
+
+    # --- Scanning (스캔) ---
+
+    def _run(self):
+        try:
+            buffer, size = self.buffer, self.size
+            # Lines up to the last newline are final; an unterminated last line may still grow, so it is not persisted.
+            # 마지막 개행까지의 라인은 확정되며, 종료되지 않은 마지막 라인은 더 늘어날 수 있으므로 저장하지 않습니다.
+            complete = buffer.rfind(b'\n') + 1 if size else 0
+            pos = self.scanned = self._load_sidecar(complete)
+            self.reused_bytes = pos
+            self.tail_start = self._index_tail(pos)
+            while pos < complete:
+                if self._cancel.is_set():
+                    return
+                end = min(pos + INDEX_CHUNK_BYTES, complete)
+                if end < complete:
+                    newline = buffer.rfind(b'\n', pos, end)
+                    if newline == -1:
+                        newline = buffer.find(b'\n', end)
+                    end = newline + 1
+                self._index_block(buffer[pos:end], pos, self.columns)
+                pos = self.scanned = end
+            if complete > self.reused_bytes:
+                self._save_sidecar(complete)
+            if complete < size:
+                self._index_block(buffer[complete:size], complete, self.columns)
+            self._emit_pending(self.columns)
+            self.scanned = size
+            self.done = True
+        except Exception as e:
+            self.error = e
+
+    def _emit_pending(self, columns: IndexColumns):
+        if columns.pending is not None:
+            columns.emit(columns.pending[0], columns.pending[1], self._info_code, columns.pending[2])
+            columns.pending = None
+
+    def _index_tail(self, pos: int) -> int:
+        """
+        # Indexes the last INDEX_TAIL_BYTES (from a line start) into the tail columns if more than that remains to be
+        # scanned from pos, and returns the offset the tail starts at (the file size if there is none).
+        # pos부터 스캔할 양이 INDEX_TAIL_BYTES보다 많으면 (라인 시작부터의) 마지막 INDEX_TAIL_BYTES를 끝부분 열에
+        # 인덱싱하고, 끝부분이 시작하는 오프셋을 반환합니다 (없으면 파일 크기).
+
+        # The full scan indexes these lines again. Whether a line is emitted depends only on the line and the lines
+        # after it, so the entries of the full index from tail_start on are exactly the tail entries.
+        # 전체 스캔은 이 라인들을 다시 인덱싱합니다. 라인의 기록 여부는 그 라인과 이후 라인에만 달려 있으므로,
+        # 전체 인덱스에서 tail_start 이후의 항목은 끝부분 항목과 정확히 같습니다.
+        """
+        size = self.size
+        if not INDEX_TAIL_BYTES or size - pos <= INDEX_TAIL_BYTES:
+            return size
+        start = self.buffer.rfind(b'\n', pos, size - INDEX_TAIL_BYTES) + 1
+        if start <= pos:
+            return size
+        self._index_block(self.buffer[start:size], start, self.tail)
+        self._emit_pending(self.tail)
+        return start
+
+    # --- Sidecar (사이드카) ---
+
+    def _key(self) -> dict:
+        return {
+            'version': SIDECAR_VERSION,
+            'path': os.path.abspath(self.path),
+            'byteorder': sys.byteorder,
+            'itemsizes': [self.offsets.itemsize, self.lengths.itemsize, self.times.itemsize],
+            'classifier_levels': sorted(self.classifier.levels),
+        }
+
+    def _hashes(self, complete: int):
+        head = hashlib.blake2b(self.buffer[:min(INDEX_HASH_BYTES, complete)], digest_size=16).hexdigest()
+        tail = hashlib.blake2b(self.buffer[max(0, complete - INDEX_HASH_BYTES):complete], digest_size=16).hexdigest()
+        return head, tail
+
+    def _load_sidecar(self, complete: int) -> int:
+        """
+        # Restores the index from the sidecar if it still matches the file, and returns the byte offset to continue scanning from.
+        # 사이드카가 여전히 파일과 일치하면 인덱스를 복원하고, 스캔을 계속할 바이트 오프셋을 반환합니다.
+
+        # The sidecar is reused as is when size and mtime are unchanged, and as a prefix when the file has grown;
+        # in both cases the head and tail hashes of the indexed range must match.
+        # 사이드카는 크기와 수정 시각이 같으면 그대로, 파일이 커졌으면 앞부분으로 재사용됩니다.
+        # 두 경우 모두 인덱싱된 범위의 앞/끝 해시가 일치해야 합니다.
+        """
+        try:
+            with open(self.sidecar, 'rb') as f:
+                if f.readline() != SIDECAR_MAGIC:
+                    return 0
+                header = json.loads(f.readline())
+                if header.get('key') != self._key():
+                    return 0
+                indexed = header['complete']
+                unchanged = header['size'] == self.size and header['mtime_ns'] == self.mtime_ns
+                grown = self.size > header['size'] and complete >= indexed
+                if not (unchanged or grown) or indexed > complete:
+                    return 0
+                if [header['head_hash'], header['tail_hash']] != list(self._hashes(indexed)):
+                    return 0
+                names, count = header['level_names'], header['count']
+                codes = bytes(self._code(name) for name in names).ljust(256, b'\0')
+                self.offsets.fromfile(f, count)
+                self.lengths.fromfile(f, count)
+                self.times.fromfile(f, count)
+                self.levels.frombytes(f.read(count).translate(codes))
+                if len(self.levels) != count:
+                    raise EOFError("Truncated sidecar index")
+                self.columns.pending = tuple(header['pending']) if header['pending'] else None
+            # Marks the sidecar as recently used for prune_sidecars().
+            # prune_sidecars()를 위해 사이드카를 최근에 사용된 것으로 표시합니다.
+            try: os.utime(self.sidecar)
+            except OSError: pass
+            return indexed
+        except (OSError, ValueError, KeyError, TypeError, EOFError):
+            self.columns.clear()
+            return 0
+
+    def _save_sidecar(self, complete: int):
+        """
+        # Writes the index of all newline-terminated lines to the sidecar (atomically, through a temporary file).
+        # 개행으로 끝나는 모든 라인의 인덱스를 사이드카에 기록합니다 (임시 파일을 통해 원자적으로).
+        """
+        head_hash, tail_hash = self._hashes(complete)
+        header = {
+            'key': self._key(), 'size': self.size, 'mtime_ns': self.mtime_ns, 'complete': complete,
+            'head_hash': head_hash, 'tail_hash': tail_hash, 'count': len(self),
+            'level_names': self.level_names, 'pending': list(self.columns.pending) if self.columns.pending else None,
+        }
+        temp_path = self.sidecar.with_suffix('.idx.tmp')
+        try:
+            self.sidecar.parent.mkdir(parents=True, exist_ok=True)
+            with open(temp_path, 'wb') as f:
+                f.write(SIDECAR_MAGIC)
+                f.write(json.dumps(header).encode('utf-8') + b'\n')
+                self.offsets.tofile(f)
+                self.lengths.tofile(f)
+                self.times.tofile(f)
+                self.levels.tofile(f)
+            os.replace(temp_path, self.sidecar)
+            prune_sidecars(keep=self.sidecar, directory=self.sidecar.parent)
+        except OSError:
+            # The sidecar is only a cache; failing to write it must not fail the load.
+            # 사이드카는 캐시일 뿐이므로, 기록에 실패해도 로드가 실패해서는 안 됩니다.
+            pass
+
+    def _index_block(self, data: bytes, base: int, columns: IndexColumns):
+        """
+        # Indexes the lines of one block of whole lines starting at file offset base into columns.
+        # 파일 오프셋 base에서 시작하는 완전한 라인들로 이루어진 블록 하나를 columns에 인덱싱합니다.
+        """
+        lines = data.split(b'\n')
+        if data.endswith(b'\n'):
+            lines.pop()
+        header_codes, progress_code = self._header_codes, self._progress_code
+        classify, code_of, emit = self.classifier.classify, self._code, columns.emit
+        offset = base
+        for raw in lines:
+            size = len(raw)
+            if raw[:1] == b'[':
+                lead, length = 0, len(raw.rstrip())
+            else:
+                rest = raw.lstrip()
+                lead, length = size - len(rest), len(rest.rstrip())
+            code = None
+            time_of_day = -1.0
+            if length:
+                if raw[lead + 9:lead + 12] == b'] [':
+                    code = header_codes.get(raw[lead + 12:raw.find(b']', lead + 12)])
+                    clock = raw[lead + 1:lead + 9]
+                    if clock[2:3] == b':' and clock[5:6] == b':':
+                        try: time_of_day = float(int(clock[:2]) * 3600 + int(clock[3:5]) * 60 + int(clock[6:8]))
+                        except ValueError: pass
+                if code is None:
+                    code = code_of(classify(raw[lead:lead + length].decode('utf-8', 'replace')))
+            if code == progress_code:
+                columns.pending = (offset + lead, length, time_of_day)
+            else:
+                if columns.pending is not None:
+                    self._emit_pending(columns)
+                if length:
+                    emit(offset + lead, length, code, time_of_day)
+            offset += size + 1
@@ -0,0 +1,149 @@
+import os
+import threading
+from typing import Optional
+from .config import SAVE_BUFFER_BYTES
+from .log_store import LogStore, DELETED_CODE, DELETED_PREFIX, SOURCE_MAPPED
+
+class LogSaver:
+    """
+    # Saves a log store to its file on a background thread, atomically: a temporary file is written and then renamed over the file.
+    # 백그라운드 스레드에서 로그 저장소를 파일에 원자적으로 저장합니다: 임시 파일을 기록한 뒤 원래 파일 위로 이름을 바꿉니다.
+
+    # Runs of unchanged lines are copied straight from the mapped original file as byte ranges; only added or
+    # edited lines are encoded. Deleted lines are dropped.
+    # 변경되지 않은 라인들의 구간은 매핑된 원본 파일에서 바이트 범위로 그대로 복사되며, 추가되거나 편집된
+    # 라인만 인코딩됩니다. 삭제된 라인은 제외됩니다.
+    """
+    PROGRESS_CHECK_LINES = 4096
+
+    def __init__(self, store: LogStore, path: str, buffer_size: int = SAVE_BUFFER_BYTES):
+        """
+        # Prepares a save of the entries currently in the store. Entries appended later are not included.
+        # 현재 저장소에 있는 항목들의 저장을 준비합니다. 이후에 추가되는 항목은 포함되지 않습니다.
+
+        # Args:
+        #     store (LogStore): The log store; it must not be edited (other than appended to) or spilled until the save is done. (로그 저장소. 저장이 끝날 때까지 추가 외의 편집이나 스필은 안 됨)
+        #     path (str): The log file to replace. (교체할 로그 파일)
+        #     buffer_size (int): Write buffer size and largest copied block. (쓰기 버퍼 크기이자 최대 복사 블록 크기)
+        """
+        self.store = store
+        self.path = path
+        self.temp_path = path + '.saving'
+        self.buffer_size = buffer_size
+        self.total = len(store)
+        self.processed = 0
+        self.copied_bytes = 0
+        self.encoded_bytes = 0
+        # Indices of the encoded messages whose first 'DELETED: ' was dropped, for LogStore.purge_deleted().
+        # 첫 'DELETED: '가 제거된 채 인코딩된 메시지의 인덱스로, LogStore.purge_deleted()에 사용됩니다.
+        self.prefixed = []
+        self.done = False
+        # Set only once every line was written and synced; replace() refuses an incomplete temporary file.
+        # 모든 라인이 기록되고 동기화된 후에만 설정되며, replace()는 불완전한 임시 파일을 거부합니다.
+        self.completed = False
+        self.error: Optional[Exception] = None
+        self._cancelled = False
+        self._thread = threading.Thread(target=self._run, name="LogSaver", daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def cancel(self):
+        """
+        # Stops the save, waits for the thread and removes the temporary file.
+        # 저장을 중단하고 스레드를 기다린 뒤 임시 파일을 삭제합니다.
+        """
+        self._cancelled = True
+        if self._thread.is_alive():
+            self._thread.join()
+        self.discard()
+
+    @property
+    def progress(self) -> float:
+        return self.processed / self.total if self.total else 1.0
+
+    def replace(self):
+        """
+        # Renames the finished temporary file over the log file. Call from the UI thread once done is set.
+        # 완성된 임시 파일의 이름을 로그 파일로 바꿉니다. done이 설정된 후 UI 스레드에서 호출합니다.
+
+        # Raises:
+        #     OSError: If the save did not complete or the rename fails. (저장이 완료되지 않았거나 이름 변경에 실패한 경우)
+        """
+        if not self.completed:
+            raise OSError(f"The save of {os.path.basename(self.path)} did not complete")
+        os.replace(self.temp_path, self.path)
+
+    def append_lines(self, lines):
+        """
+        # Appends lines to the finished temporary file before it replaces the log file (e.g. lines logged during the save).
+        # 로그 파일을 교체하기 전에 완성된 임시 파일에 라인을 추가합니다 (예: 저장 중에 기록된 라인).
+        """
+        with open(self.temp_path, 'ab') as out:
+            for line in lines:
+                out.write((line + '\n').encode('utf-8'))
+
+    def discard(self):
+        try: os.remove(self.temp_path)
+        except OSError: pass
+
+    def _run(self):
+        """
+        # Saver thread: streams the entries into the temporary file and syncs it to disk.
+        # 저장 스레드: 항목들을 임시 파일로 스트리밍하고 디스크에 동기화합니다.
+        """
+        store = self.store
+        mapped = store.mapped
+        offsets, lengths, sources, states = store.offsets, store.lengths, store.sources, store.states
+        try:
+            with open(self.temp_path, 'wb', buffering=self.buffer_size) as out:
+                run_start = run_end = -1
+                for i in range(self.total):
+                    if i % self.PROGRESS_CHECK_LINES == 0:
+                        if self._cancelled:
+                            return
+                        self.processed = i
+                    if states[i] == DELETED_CODE:
+                        continue
+                    if sources[i] == SOURCE_MAPPED:
+                        offset = offsets[i]
+                        if run_start >= 0 and offset == run_end + 1 and mapped[run_end] == 0x0A:
+                            run_end = offset + lengths[i]
+                            continue
+                        if run_start >= 0:
+                            self._copy(out, mapped, run_start, run_end)
+                        run_start, run_end = offset, offset + lengths[i]
+                        continue
+                    if run_start >= 0:
+                        self._copy(out, mapped, run_start, run_end)
+                        run_start = run_end = -1
+                    message = store.message(i)
+                    text = message.replace(DELETED_PREFIX, '', 1)
+                    if len(text) != len(message):
+                        self.prefixed.append(i)
+                    data = (text + '\n').encode('utf-8')
+                    out.write(data)
+                    self.encoded_bytes += len(data)
+                if run_start >= 0:
+                    self._copy(out, mapped, run_start, run_end)
+                out.flush()
+                os.fsync(out.fileno())
+            self.processed = self.total
+            self.completed = True
+        except Exception as e:
+            # Anything else (e.g. the mapping was closed under the saver) must not pass for a finished save either.
+            # 그 밖의 오류도 (예: 저장 중 매핑이 닫힘) 완료된 저장으로 간주되어서는 안 됩니다.
+            self.error = e
+            self.discard()
+        finally:
+            self.done = True
+
+    def _copy(self, out, mapped, start: int, end: int):
+        """
+        # Copies the byte range [start, end) of the original file in blocks, followed by a newline.
+        # 원본 파일의 바이트 범위 [start, end)를 블록 단위로 복사하고 개행을 덧붙입니다.
+        """
+        for position in range(start, end, self.buffer_size):
+            out.write(mapped[position:min(end, position + self.buffer_size)])
+        out.write(b'\n')
+        self.copied_bytes += end - start + 1
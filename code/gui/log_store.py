@@ -0,0 +1,481 @@
+"""
+# Compact columnar storage for log entries.
+# 로그 항목을 위한 압축된 열 기반 저장소입니다.
+
+# Each entry is stored as a uint8 level code, a uint8 state code, an offset/length pair into
+# an append-only UTF-8 text arena and, optionally, an ingest timestamp.
+# 각 항목은 uint8 레벨 코드, uint8 상태 코드, 추가 전용 UTF-8 텍스트 아레나에 대한
+# 오프셋/길이 쌍, 그리고 선택적으로 수집 타임스탬프로 저장됩니다.
+
+# Entries can also point into a read-only mapped buffer (e.g. an mmap of an opened log file), in which case
+# their text is only decoded when it is accessed.
+# 항목은 읽기 전용 매핑 버퍼(예: 열린 로그 파일의 mmap)를 가리킬 수도 있으며, 이 경우
+# 텍스트는 접근할 때만 디코딩됩니다.
+
+# To cap memory during long runs, the text of the oldest entries can be moved to an on-disk spill segment
+# (see spill()); it is read back from there on access.
+# 긴 실행 동안 메모리를 제한하기 위해, 가장 오래된 항목의 텍스트를 디스크의 스필 세그먼트로 옮길 수 있으며
+# (spill() 참고), 접근할 때 그곳에서 다시 읽습니다.
+"""
+
+import time
+from array import array
+from contextlib import contextmanager
+from itertools import compress
+from typing import Callable, Iterable, List, Optional, Tuple
+
+# State names in code order. 'SAVED' must stay at code 0.
+# 코드 순서대로 나열된 상태 이름입니다. 'SAVED'는 반드시 코드 0이어야 합니다.
+STATES = ('SAVED', 'ADDED', 'MODIFIED', 'DELETED')
+STATE_CODES = {name: code for code, name in enumerate(STATES)}
+SOURCE_ARENA = 0
+SOURCE_MAPPED = 1
+SOURCE_SPILLED = 2
+DELETED_CODE = STATE_CODES['DELETED']
+DELETED_PREFIX = 'DELETED: '
+
+# Change events sent to listeners as (event, index). Indices are in the coordinates after the change.
+# 리스너에 (이벤트, 인덱스)로 전달되는 변경 이벤트입니다. 인덱스는 변경 이후의 좌표입니다.
+INSERTED = 'inserted'            # A new entry now sits at index; later entries moved up by one. (index에 새 항목이 생겼고, 이후 항목은 한 칸씩 밀림)
+REMOVED = 'removed'              # The entry at index was removed; later entries moved down by one. (index의 항목이 제거되었고, 이후 항목은 한 칸씩 당겨짐)
+REPLACED = 'replaced'            # The message or level (and possibly the state) of the entry changed. (항목의 메시지나 레벨(및 상태)이 변경됨)
+STATE_CHANGED = 'state_changed'  # Only the state of the entry changed. (항목의 상태만 변경됨)
+RESET = 'reset'                  # Several entries changed inside one batch(); index is -1. (하나의 batch() 안에서 여러 항목이 변경됨, index는 -1)
+
+class LogStore:
+    """
+    # Array-backed log storage with list-like add/insert/pop and field-level edit operations.
+    # 리스트와 유사한 추가/삽입/제거 및 필드 단위 편집 연산을 제공하는 배열 기반 로그 저장소입니다.
+    """
+    def __init__(self, levels: Iterable[str] = (), with_timestamps: bool = False):
+        """
+        # Initializes an empty store.
+        # 빈 저장소를 초기화합니다.
+
+        # Args:
+        #     levels (Iterable[str]): Level names to pre-register, so their codes are stable. (코드가 고정되도록 미리 등록할 레벨 이름)
+        #     with_timestamps (bool): Whether to keep an ingest timestamp column. (수집 타임스탬프 열 유지 여부)
+        """
+        self.level_names = []
+        self.level_codes = {}
+        for level in levels:
+            self.level_code(level)
+        self.levels = array('B')
+        self.states = array('B')
+        self.offsets = array('Q')
+        self.lengths = array('L')
+        self.sources = array('B')
+        self.timestamps = array('d') if with_timestamps else None
+        self.arena = bytearray()
+        self.mapped = None
+        self.spill_segment = None
+        # Entries before this index never keep their text in the arena (it is mapped or spilled).
+        # 이 인덱스 이전의 항목은 텍스트를 아레나에 두지 않습니다 (매핑되었거나 옮겨짐).
+        self.spill_cursor = 0
+        self._garbage = 0
+        # Called before text is relocated or released (compact, spill, purge_deleted, clear), so a reader on another
+        # thread (e.g. a search worker) can be stopped first.
+        # 텍스트를 옮기거나 해제하기 전에 (compact, spill, purge_deleted, clear) 호출되어, 다른 스레드의 읽기 작업
+        # (예: 검색 작업 스레드)을 먼저 중지할 수 있게 합니다.
+        self.before_relocate: Optional[Callable[[], None]] = None
+        self._listeners: List[Callable[[str, int], None]] = []
+        self._batch_depth = 0
+        self._batched_events = []
+
+    def __len__(self) -> int:
+        return len(self.levels)
+
+    def __getitem__(self, index: int) -> dict:
+        """
+        # Returns a detached {'message', 'level', 'state'} snapshot of an entry.
+        # 항목의 분리된 {'message', 'level', 'state'} 스냅샷을 반환합니다.
+        """
+        return {'message': self.message(index), 'level': self.level(index), 'state': self.state(index)}
+
+    # --- Change Notification (변경 알림) ---
+
+    def subscribe(self, listener: Callable[[str, int], None]):
+        """
+        # Registers listener(event, index) to be called after every single-entry edit.
+        # 단일 항목 편집이 끝날 때마다 호출될 listener(event, index)를 등록합니다.
+
+        # Only insert(), pop(), update() and mark_deleted() notify. Bulk operations (append, extend, extend_mapped,
+        # insert_mapped, purge_deleted, clear) do not, since their callers re-index the view themselves.
+        # insert(), pop(), update(), mark_deleted()만 알립니다. 대량 연산(append, extend, extend_mapped,
+        # insert_mapped, purge_deleted, clear)은 호출자가 직접 뷰를 다시 인덱싱하므로 알리지 않습니다.
+        """
+        self._listeners.append(listener)
+
+    def unsubscribe(self, listener: Callable[[str, int], None]):
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    @contextmanager
+    def batch(self):
+        """
+        # Groups edits into one transaction: listeners get the single event if only one edit happened, else one RESET.
+        # 편집을 하나의 트랜잭션으로 묶습니다. 편집이 하나뿐이면 그 이벤트를, 아니면 RESET 하나를 리스너에 전달합니다.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._batched_events:
+                events, self._batched_events = self._batched_events, []
+                self._notify(*(events[0] if len(events) == 1 else (RESET, -1)))
+
+    def _notify(self, event: str, index: int):
+        if self._batch_depth:
+            self._batched_events.append((event, index))
+            return
+        for listener in self._listeners:
+            listener(event, index)
+
+    # --- Field Access (필드 접근) ---
+
+    def level_code(self, level: str) -> int:
+        """
+        # Returns the code of a level name, registering it if it is new.
+        # 레벨 이름의 코드를 반환하며, 새 레벨이면 등록합니다.
+        """
+        code = self.level_codes.get(level)
+        if code is None:
+            if len(self.level_names) >= 256:
+                raise ValueError(f"Too many distinct log levels (max 256): {level}")
+            code = len(self.level_names)
+            self.level_names.append(level)
+            self.level_codes[level] = code
+        return code
+
+    def message(self, index: int) -> str:
+        offset, source = self.offsets[index], self.sources[index]
+        if source == SOURCE_SPILLED:
+            return self.spill_segment.read(offset, self.lengths[index]).decode('utf-8', 'replace')
+        buffer = self.mapped if source else self.arena
+        return buffer[offset:offset + self.lengths[index]].decode('utf-8', 'replace')
+
+    def level(self, index: int) -> str:
+        return self.level_names[self.levels[index]]
+
+    def state(self, index: int) -> str:
+        return STATES[self.states[index]]
+
+    def timestamp(self, index: int) -> Optional[float]:
+        return self.timestamps[index] if self.timestamps is not None else None
+
+    def is_deleted(self, index: int) -> bool:
+        return self.states[index] == DELETED_CODE
+
+    # --- Mutation (변경) ---
+
+    def _store_text(self, message: str, source: int = SOURCE_ARENA) -> Tuple[int, int]:
+        """
+        # Appends the UTF-8 encoded message to the arena (or the spill segment) and returns its (offset, length).
+        # UTF-8로 인코딩된 메시지를 아레나(또는 스필 세그먼트)에 추가하고 (오프셋, 길이)를 반환합니다.
+        """
+        data = message.encode('utf-8')
+        if source == SOURCE_SPILLED:
+            return self.spill_segment.append(data), len(data)
+        offset = len(self.arena)
+        self.arena += data
+        return offset, len(data)
+
+    def append(self, message: str, level: str = 'INFO', state: str = 'SAVED', timestamp: Optional[float] = None):
+        """
+        # Appends one entry.
+        # 항목 하나를 추가합니다.
+        """
+        offset, length = self._store_text(message)
+        self.offsets.append(offset)
+        self.lengths.append(length)
+        self.sources.append(SOURCE_ARENA)
+        self.levels.append(self.level_code(level))
+        self.states.append(STATE_CODES[state])
+        if self.timestamps is not None:
+            self.timestamps.append(time.time() if timestamp is None else timestamp)
+
+    def extend(self, entries: Iterable[Tuple[str, str]], state: str = 'SAVED'):
+        """
+        # Appends a batch of (message, level) entries with the same state and ingest time.
+        # 같은 상태와 수집 시간을 가진 (메시지, 레벨) 항목 배치를 추가합니다.
+        """
+        state_code = STATE_CODES[state]
+        level_code = self.level_code
+        start = len(self.levels)
+        for message, level in entries:
+            offset, length = self._store_text(message)
+            self.offsets.append(offset)
+            self.lengths.append(length)
+            self.levels.append(level_code(level))
+        added = len(self.levels) - start
+        self.states.frombytes(bytes([state_code]) * added)
+        self.sources.frombytes(bytes(added))
+        if self.timestamps is not None:
+            self.timestamps.extend([time.time()] * added)
+
+    def attach_mapped(self, buffer):
+        """
+        # Sets the read-only buffer that entries added with extend_mapped() point into.
+        # extend_mapped()로 추가된 항목이 가리키는 읽기 전용 버퍼를 설정합니다.
+        """
+        self.mapped = buffer
+
+    def extend_mapped(self, offsets: array, lengths: array, level_codes: bytes, timestamps: Optional[array] = None):
+        """
+        # Appends saved entries whose text lives in the mapped buffer. level_codes must already be codes of this store.
+        # 텍스트가 매핑 버퍼에 있는 저장된 항목들을 추가합니다. level_codes는 이미 이 저장소의 코드여야 합니다.
+
+        # For opened log files, timestamps hold the seconds since midnight parsed from each line header (-1 if none).
+        # 열린 로그 파일의 경우, timestamps는 각 라인 헤더에서 파싱한 자정 이후 초를 담습니다 (없으면 -1).
+        """
+        added = len(offsets)
+        self.offsets.extend(offsets)
+        self.lengths.extend(lengths)
+        self.levels.frombytes(level_codes)
+        self.states.frombytes(bytes(added))
+        self.sources.frombytes(bytes([SOURCE_MAPPED]) * added)
+        if self.timestamps is not None:
+            self.timestamps.extend(timestamps if timestamps is not None else array('d', bytes(8 * added)))
+
+    def insert_mapped(self, index: int, offsets: array, lengths: array, level_codes: bytes, timestamps: Optional[array] = None):
+        """
+        # Like extend_mapped(), but inserts the entries before index; only the entries after index are moved.
+        # extend_mapped()와 같지만 항목을 index 앞에 삽입합니다. index 이후의 항목만 이동됩니다.
+        """
+        added = len(offsets)
+        self.offsets[index:index] = offsets
+        self.lengths[index:index] = lengths
+        self.levels[index:index] = array('B', level_codes)
+        self.states[index:index] = array('B', bytes(added))
+        self.sources[index:index] = array('B', bytes([SOURCE_MAPPED]) * added)
+        if self.timestamps is not None:
+            self.timestamps[index:index] = timestamps if timestamps is not None else array('d', bytes(8 * added))
+        if index < self.spill_cursor:
+            self.spill_cursor += added
+
+    def insert(self, index: int, message: str, level: str, state: str = 'ADDED', timestamp: Optional[float] = None):
+        """
+        # Inserts one entry before index.
+        # index 앞에 항목 하나를 삽입합니다.
+        """
+        source = SOURCE_SPILLED if index < self.spill_cursor else SOURCE_ARENA
+        offset, length = self._store_text(message, source)
+        if source == SOURCE_SPILLED:
+            self.spill_cursor += 1
+        self.offsets.insert(index, offset)
+        self.lengths.insert(index, length)
+        self.sources.insert(index, source)
+        self.levels.insert(index, self.level_code(level))
+        self.states.insert(index, STATE_CODES[state])
+        if self.timestamps is not None:
+            self.timestamps.insert(index, time.time() if timestamp is None else timestamp)
+        self._notify(INSERTED, index)
+
+    def pop(self, index: int) -> dict:
+        """
+        # Removes an entry and returns its snapshot.
+        # 항목을 제거하고 그 스냅샷을 반환합니다.
+        """
+        entry = self[index]
+        if self.sources[index] == SOURCE_ARENA:
+            self._garbage += self.lengths[index]
+        if index < self.spill_cursor:
+            self.spill_cursor -= 1
+        for column in (self.offsets, self.lengths, self.sources, self.levels, self.states):
+            column.pop(index)
+        if self.timestamps is not None:
+            self.timestamps.pop(index)
+        self._notify(REMOVED, index)
+        return entry
+
+    def update(self, index: int, message: Optional[str] = None, level: Optional[str] = None, state: Optional[str] = None):
+        """
+        # Replaces individual fields of an entry. The old message bytes become garbage in the arena (or the spill segment).
+        # 항목의 개별 필드를 교체합니다. 이전 메시지 바이트는 아레나(또는 스필 세그먼트)의 가비지가 됩니다.
+        """
+        self._set_fields(index, message, level, state)
+        if message is not None or level is not None:
+            self._notify(REPLACED, index)
+        elif state is not None:
+            self._notify(STATE_CHANGED, index)
+
+    def _set_fields(self, index: int, message: Optional[str], level: Optional[str], state: Optional[str]):
+        if message is not None:
+            if self.sources[index] == SOURCE_ARENA:
+                self._garbage += self.lengths[index]
+            source = SOURCE_SPILLED if index < self.spill_cursor else SOURCE_ARENA
+            self.offsets[index], self.lengths[index] = self._store_text(message, source)
+            self.sources[index] = source
+            if self._garbage > 1024 * 1024 and self._garbage * 2 > len(self.arena):
+                self.compact()
+        if level is not None:
+            self.levels[index] = self.level_code(level)
+        if state is not None:
+            self.states[index] = STATE_CODES[state]
+
+    def mark_deleted(self, index: int):
+        """
+        # Marks an entry as deleted, prefixing its message with 'DELETED: ' once.
+        # 항목을 삭제 상태로 표시하고, 메시지 앞에 'DELETED: '를 한 번만 붙입니다.
+        """
+        message = self.message(index)
+        if not message.strip().startswith('DELETED:'):
+            self._set_fields(index, DELETED_PREFIX + message, None, 'DELETED')
+            self._notify(REPLACED, index)
+        else:
+            self.states[index] = DELETED_CODE
+            self._notify(STATE_CHANGED, index)
+
+    def purge_deleted(self, prefixed: Optional[Iterable[int]] = None):
+        """
+        # Drops deleted entries and marks the rest as saved, as done when changes are written to disk.
+        # The first 'DELETED: ' is removed from kept messages. Kept entries keep pointing into the mapped buffer
+        # or the spill segment, and the arena is compacted.
+        # 삭제된 항목을 제거하고 나머지를 저장됨 상태로 표시합니다 (변경 사항을 디스크에 기록할 때 수행).
+        # 남은 메시지에서 첫 'DELETED: '를 제거합니다. 남은 항목은 계속 매핑 버퍼나 스필 세그먼트를 가리키며,
+        # 아레나는 압축됩니다.
+
+        # Args:
+        #     prefixed (Iterable[int] | None): Indices of the messages containing 'DELETED: ', if already known
+        #         (e.g. from a save); otherwise every message is checked. ('DELETED: '를 포함한 메시지의 인덱스.
+        #         이미 알고 있는 경우(예: 저장 시), 아니면 모든 메시지를 확인)
+        """
+        self._before_relocate()
+        if prefixed is None:
+            prefixed = [i for i in range(len(self)) if DELETED_PREFIX in self.message(i)]
+        for i in prefixed:
+            if self.states[i] != DELETED_CODE:
+                self._set_fields(i, self.message(i).replace(DELETED_PREFIX, '', 1), None, None)
+        mask = self.states.tobytes().translate(bytes(0 if code == DELETED_CODE else 1 for code in range(256)))
+        columns = [self.offsets, self.lengths, self.sources, self.levels]
+        if self.timestamps is not None:
+            columns.append(self.timestamps)
+        for column in columns:
+            column[:] = array(column.typecode, compress(column, mask))
+        self.states[:] = array('B', bytes(len(self.levels)))
+        self.spill_cursor = mask.count(1, 0, self.spill_cursor)
+        self.compact()
+
+    def clear(self):
+        """
+        # Removes all entries, detaches the mapped buffer and deletes the spill segment. Registered level codes are kept.
+        # 모든 항목을 제거하고 매핑 버퍼를 분리하며 스필 세그먼트를 삭제합니다. 등록된 레벨 코드는 유지됩니다.
+        """
+        self._before_relocate()
+        for column in (self.offsets, self.lengths, self.sources, self.levels, self.states):
+            del column[:]
+        if self.timestamps is not None:
+            del self.timestamps[:]
+        self.arena = bytearray()
+        self.mapped = None
+        if self.spill_segment is not None:
+            self.spill_segment.close()
+            self.spill_segment = None
+        self.spill_cursor = 0
+        self._garbage = 0
+
+    def compact(self):
+        """
+        # Rewrites the text arena without the bytes of replaced or removed messages.
+        # 교체되거나 제거된 메시지의 바이트를 제외하고 텍스트 아레나를 다시 작성합니다.
+        """
+        self._before_relocate()
+        arena = bytearray()
+        for i in range(self.spill_cursor, len(self)):
+            if self.sources[i] != SOURCE_ARENA:
+                continue
+            offset = self.offsets[i]
+            self.offsets[i] = len(arena)
+            arena += self.arena[offset:offset + self.lengths[i]]
+        self.arena = arena
+        self._garbage = 0
+
+    def _before_relocate(self):
+        if self.before_relocate is not None:
+            self.before_relocate()
+
+    def attach_spill(self, segment):
+        """
+        # Sets the spill segment (e.g. a SpillSegment) that spill() moves text to. It needs append(data) -> offset and read(offset, length).
+        # spill()이 텍스트를 옮길 스필 세그먼트(예: SpillSegment)를 설정합니다. append(data) -> offset과 read(offset, length)가 필요합니다.
+        """
+        self.spill_segment = segment
+
+    def resident(self) -> Tuple[int, int]:
+        """
+        # Returns (entries, text bytes) after the spilled prefix, i.e. what spill() can still move to disk.
+        # 옮겨진 앞부분 이후의 (항목 수, 텍스트 바이트)를 반환합니다. 즉 spill()이 아직 디스크로 옮길 수 있는 양입니다.
+        """
+        return len(self) - self.spill_cursor, len(self.arena) - self._garbage
+
+    def spill(self, keep_lines: int = 0, keep_bytes: int = 0) -> int:
+        """
+        # Moves the text of the oldest entries to the spill segment until at most keep_lines entries and keep_bytes
+        # bytes of text stay resident (0 means no limit), then compacts the arena. Returns the number of entries moved.
+        # 상주하는 항목이 최대 keep_lines개, 텍스트가 최대 keep_bytes바이트가 될 때까지 (0은 제한 없음) 가장 오래된
+        # 항목의 텍스트를 스필 세그먼트로 옮긴 뒤 아레나를 압축합니다. 옮긴 항목 수를 반환합니다.
+
+        # Entry indices, levels and states are unchanged; only where the text is read from changes.
+        # 항목 인덱스, 레벨, 상태는 바뀌지 않으며 텍스트를 읽는 위치만 바뀝니다.
+        """
+        self._before_relocate()
+        start = end = self.spill_cursor
+        lengths, sources, offsets = self.lengths, self.sources, self.offsets
+        if keep_lines:
+            end = max(end, len(self) - keep_lines)
+        if keep_bytes:
+            excess = self.resident()[1] - keep_bytes
+            for i in range(start, end):
+                if sources[i] == SOURCE_ARENA:
+                    excess -= lengths[i]
+            while excess > 0 and end < len(self):
+                if sources[end] == SOURCE_ARENA:
+                    excess -= lengths[end]
+                end += 1
+        if end == start:
+            return 0
+        moved = [i for i in range(start, end) if sources[i] == SOURCE_ARENA]
+        arena = self.arena
+        # The segment is written before any entry is relocated, so a failed write leaves the store unchanged.
+        # 항목을 옮기기 전에 세그먼트를 먼저 기록하므로, 쓰기에 실패해도 저장소는 바뀌지 않습니다.
+        position = self.spill_segment.append(b''.join([arena[offsets[i]:offsets[i] + lengths[i]] for i in moved]))
+        for i in moved:
+            offsets[i] = position
+            sources[i] = SOURCE_SPILLED
+            position += lengths[i]
+        self.spill_cursor = end
+        self.compact()
+        return end - start
+
+    # --- Queries (조회) ---
+
+    def codes_for(self, levels: Iterable[str]) -> set:
+        """
+        # Returns the codes of the given level names that are registered in the store.
+        # 주어진 레벨 이름 중 저장소에 등록된 레벨의 코드를 반환합니다.
+        """
+        return {self.level_codes[level] for level in levels if level in self.level_codes}
+
+    def select(self, hidden_levels: Iterable[str] = (), start: int = 0) -> array:
+        """
+        # Returns the indices (from start) of entries that are not deleted and whose level is not hidden.
+        # (start부터) 삭제되지 않았고 레벨이 숨겨지지 않은 항목들의 인덱스를 반환합니다.
+        """
+        hidden_codes = self.codes_for(hidden_levels)
+        level_table = bytes(0 if code in hidden_codes else 1 for code in range(256))
+        state_table = bytes(0 if code == DELETED_CODE else 1 for code in range(256))
+        level_mask = self.levels[start:].tobytes().translate(level_table)
+        state_mask = self.states[start:].tobytes().translate(state_table)
+        mask = (int.from_bytes(level_mask, 'little') & int.from_bytes(state_mask, 'little')).to_bytes(len(level_mask), 'little')
+        return array('L', compress(range(start, len(self)), mask))
+
+    def nbytes(self) -> int:
+        """
+        # Returns the approximate memory used by the columns and the text arena (spilled text is not counted).
+        # 열과 텍스트 아레나가 사용하는 대략적인 메모리 크기를 반환합니다 (옮겨진 텍스트는 포함하지 않음).
+        """
+        columns = [self.levels, self.states, self.offsets, self.lengths, self.sources]
+        if self.timestamps is not None:
+            columns.append(self.timestamps)
+        return sum(column.itemsize * column.buffer_info()[1] for column in columns) + len(self.arena)
@@ -0,0 +1,512 @@
+import tkinter as tk
+from typing import TYPE_CHECKING
+from .config import VIEW_WINDOW_LINES, VIEW_WINDOW_MARGIN, VIEW_WINDOW_MAX_ROWS
+from .log_store import INSERTED, REMOVED
+from .row_index import RowIndex
+
+if TYPE_CHECKING:
+    from .log_display import LogDisplay
+
+class VirtualLogView:
+    """
+    # A virtualized viewport over the log: the Text widget only holds the visible window plus a margin.
+    # 로그에 대한 가상화된 뷰포트입니다. Text 위젯은 보이는 창과 여백만 보유합니다.
+
+    # The scrollbar maps to the full filtered index, and scrolling swaps lines in and out of the Text widget.
+    # 스크롤바는 전체 필터링된 인덱스에 매핑되며, 스크롤 시 Text 위젯의 라인을 교체합니다.
+
+    # Level filters do not change the index: hidden levels are elided through their tags, and the window
+    # is sized by the number of visible rows it contains.
+    # 레벨 필터는 인덱스를 바꾸지 않습니다. 숨겨진 레벨은 태그를 통해 생략(elide)되며,
+    # 창의 크기는 그 안에 포함된 보이는 행의 수로 정해집니다.
+    """
+    def __init__(self, master_app: 'LogDisplay', text: tk.Text, scrollbar):
+        """
+        # Initializes the view and takes over the scrolling of the Text widget.
+        # 뷰를 초기화하고 Text 위젯의 스크롤 처리를 넘겨받습니다.
+
+        # Args:
+        #     master_app (LogDisplay): The main application instance. (메인 애플리케이션 인스턴스)
+        #     text (tk.Text): The log area widget. (로그 영역 위젯)
+        #     scrollbar: The vertical scrollbar attached to the log area. (로그 영역에 연결된 세로 스크롤바)
+        """
+        self.master_app = master_app
+        self.text = text
+        self.scrollbar = scrollbar
+        self.rows = RowIndex()
+        self.window_start = 0
+        self.window_end = 0
+        self.search_spans = {}
+        self.current_match = None
+        self.selected_abs = None
+        self._rendering = False
+        self._edge_check_job = None
+
+        self.text.config(yscrollcommand=self._on_text_yscroll)
+        self.scrollbar.config(command=self.yview)
+
+    # --- Index (인덱스) ---
+
+    def rebuild(self, scroll_to_end=False):
+        """
+        # Recomputes the filtered index from the log and re-renders the window, keeping the top line in place.
+        # 로그에서 필터링된 인덱스를 다시 계산하고, 맨 위 라인을 유지한 채 창을 다시 렌더링합니다.
+        """
+        anchor = self.top_abs_index()
+        self.rows = RowIndex(self.master_app.all_logs.select())
+        if scroll_to_end or anchor is None:
+            self.scroll_to_end()
+        else:
+            self.render_window(self.row_for_abs(anchor))
+
+    def reset(self):
+        """
+        # Clears the index and the log area.
+        # 인덱스와 로그 영역을 비웁니다.
+        """
+        self.rows = RowIndex()
+        self.window_start = self.window_end = 0
+        self.search_spans = {}
+        self.current_match = None
+        self.selected_abs = None
+        self.text.config(state='normal'); self.text.delete('1.0', tk.END); self.text.config(state='disabled')
+        self._update_scrollbar()
+
+    def row_for_abs(self, abs_index: int) -> int:
+        """
+        # Returns the filtered row of an absolute log index, or of the next displayed entry if it is hidden.
+        # 절대 로그 인덱스의 필터링된 행을 반환합니다. 숨겨진 항목이면 다음에 표시되는 항목의 행을 반환합니다.
+        """
+        return self.rows.bisect_left(abs_index)
+
+    def top_row(self) -> int:
+        """
+        # Returns the filtered row currently shown at the top of the log area.
+        # 현재 로그 영역 맨 위에 표시된 필터링된 행을 반환합니다.
+        """
+        line = int(self.text.index("@0,0").split('.')[0])
+        return max(0, min(self.window_start + line - 1, self.window_end - 1))
+
+    def bottom_row(self) -> int:
+        """
+        # Returns the filtered row currently shown at the bottom of the log area.
+        # 현재 로그 영역 맨 아래에 표시된 필터링된 행을 반환합니다.
+        """
+        line = int(self.text.index(f"@0,{self.text.winfo_height()}").split('.')[0])
+        return max(0, min(self.window_start + line - 1, self.window_end - 1))
+
+    def top_abs_index(self):
+        """
+        # Returns the absolute log index shown at the top of the log area, or None if nothing is rendered.
+        # 로그 영역 맨 위에 표시된 절대 로그 인덱스를 반환합니다. 렌더링된 내용이 없으면 None을 반환합니다.
+        """
+        if self.window_end <= self.window_start:
+            return None
+        return self.rows[self.top_row()]
+
+    def abs_for_line(self, line: int):
+        """
+        # Returns the absolute log index rendered on a Text line, or None if the line is outside the window.
+        # Text 라인에 렌더링된 절대 로그 인덱스를 반환합니다. 라인이 창 밖이면 None을 반환합니다.
+
+        # The rendered window is the slice rows[window_start:window_end], so it doubles as the line-to-entry map.
+        # 렌더링된 창은 rows[window_start:window_end] 슬라이스이므로, 라인-항목 매핑 역할도 합니다.
+        """
+        row = self.window_start + line - 1
+        if self.window_start <= row < self.window_end:
+            return self.rows[row]
+        return None
+
+    def text_line_for_abs(self, abs_index: int):
+        """
+        # Returns the Text line number of an absolute log index if it is inside the rendered window.
+        # 절대 로그 인덱스가 렌더링된 창 안에 있으면 해당 Text 라인 번호를 반환합니다.
+        """
+        row = self.row_for_abs(abs_index)
+        if row < len(self.rows) and self.rows[row] == abs_index and self.window_start <= row < self.window_end:
+            return row - self.window_start + 1
+        return None
+
+    # --- Rendering (렌더링) ---
+
+    def _hidden_codes(self) -> set:
+        """
+        # Returns the store codes of the levels currently hidden by the level filters.
+        # 현재 레벨 필터에 의해 숨겨진 레벨의 저장소 코드를 반환합니다.
+        """
+        return self.master_app.all_logs.codes_for(self.master_app._get_hidden_levels())
+
+    def _walk_visible(self, row: int, step: int, count: int, hidden_codes: set) -> int:
+        """
+        # Moves from row in the direction of step until count visible rows have been passed, and returns the boundary row.
+        # row에서 step 방향으로 보이는 행을 count개 지날 때까지 이동하고, 경계 행을 반환합니다.
+
+        # The scan stops at either end of the index or after VIEW_WINDOW_MAX_ROWS rows.
+        # 스캔은 인덱스의 양 끝 또는 VIEW_WINDOW_MAX_ROWS개의 행을 지나면 멈춥니다.
+        """
+        total = len(self.rows)
+        if not hidden_codes:
+            return max(0, min(total, row + step * count))
+        levels = self.master_app.all_logs.levels
+        if step < 0:
+            walked = reversed(self.rows.slice(max(0, row - VIEW_WINDOW_MAX_ROWS), row))
+        else:
+            walked = self.rows.slice(row, min(total, row + VIEW_WINDOW_MAX_ROWS))
+        for abs_index in walked:
+            if count <= 0: break
+            row += step
+            if levels[abs_index] not in hidden_codes:
+                count -= 1
+        return row
+
+    def _window_bounds(self, top_row: int, hidden_codes: set):
+        """
+        # Returns the (start, end) rows of a window holding VIEW_WINDOW_MARGIN visible rows above top_row
+        # and VIEW_WINDOW_LINES visible rows in total.
+        # top_row 위로 VIEW_WINDOW_MARGIN개, 전체로는 VIEW_WINDOW_LINES개의 보이는 행을 담는 창의 (시작, 끝) 행을 반환합니다.
+        """
+        total = len(self.rows)
+        start = self._walk_visible(top_row, -1, VIEW_WINDOW_MARGIN, hidden_codes)
+        end = self._walk_visible(start, 1, VIEW_WINDOW_LINES, hidden_codes)
+        if end >= total:
+            end = total
+            start = self._walk_visible(total, -1, VIEW_WINDOW_LINES, hidden_codes)
+        return start, end
+
+    def render_window(self, top_row: int, anchor_end=False):
+        """
+        # Renders the window of rows around top_row into the log area and scrolls top_row to the top.
+        # top_row 주변 행들의 창을 로그 영역에 렌더링하고 top_row를 맨 위로 스크롤합니다.
+        """
+        total = len(self.rows)
+        top_row = max(0, min(top_row, total - 1))
+        start, end = self._window_bounds(top_row, self._hidden_codes())
+        self.window_start, self.window_end = start, end
+
+        self._rendering = True
+        try:
+            self.text.config(state='normal')
+            self.text.delete('1.0', tk.END)
+            segments = self._segments_for_rows(start, end)
+            if segments:
+                self.text.insert(tk.END, *segments)
+            self._decorate_rows(start, end)
+            self.text.config(state='disabled')
+            if anchor_end:
+                self.text.yview_moveto(1.0)
+            else:
+                self.text.yview(f"{top_row - start + 1}.0")
+        finally:
+            self._rendering = False
+        self._update_scrollbar()
+
+    def refresh(self):
+        """
+        # Re-renders the current window without recomputing the filtered index (e.g., after a font change).
+        # 필터링된 인덱스를 다시 계산하지 않고 현재 창을 다시 렌더링합니다 (예: 글꼴 변경 후).
+        """
+        if self.window_end > self.window_start:
+            self.render_window(self.top_row())
+        else:
+            self._update_scrollbar()
+
+    def scroll_to_end(self):
+        """
+        # Renders the last window of rows and scrolls to the bottom.
+        # 마지막 행 창을 렌더링하고 맨 아래로 스크롤합니다.
+        """
+        if not self.rows:
+            self.reset()
+            return
+        self.render_window(len(self.rows) - 1, anchor_end=True)
+
+    def append_from(self, start_abs: int, scroll=True):
+        """
+        # Indexes log entries appended from start_abs and, if the tail is rendered, appends them to the log area.
+        # start_abs부터 추가된 로그 항목을 인덱싱하고, 끝부분이 렌더링되어 있으면 로그 영역에 덧붙입니다.
+        """
+        old_total = len(self.rows)
+        tail_rendered = self.window_end == old_total
+        self.rows.extend(self.master_app.all_logs.select(start=start_abs))
+        if len(self.rows) == old_total:
+            return
+        if not tail_rendered:
+            if scroll: self.scroll_to_end()
+            else: self._update_scrollbar()
+            return
+
+        new_end = len(self.rows) if scroll else min(len(self.rows), self.window_start + VIEW_WINDOW_LINES)
+        self._rendering = True
+        try:
+            self.text.config(state='normal')
+            segments = self._segments_for_rows(old_total, new_end)
+            if segments:
+                self.text.insert(tk.END, *segments)
+            self._decorate_rows(old_total, new_end)
+            self.window_end = new_end
+            overflow = self._walk_visible(new_end, -1, VIEW_WINDOW_LINES, self._hidden_codes()) - self.window_start
+            if overflow > 0:
+                self.text.delete('1.0', f"{overflow + 1}.0")
+                self.window_start += overflow
+            if scroll:
+                self.text.see(tk.END)
+            self.text.config(state='disabled')
+        finally:
+            self._rendering = False
+        self._update_scrollbar()
+
+    def insert_block(self, abs_index: int, count: int):
+        """
+        # Indexes count log entries inserted at abs_index (e.g. the earlier part of a file loaded tail first), keeping
+        # the line shown at the top of the log area in place.
+        # abs_index에 삽입된 count개의 로그 항목을 인덱싱하며 (예: 끝부분부터 로드되는 파일의 앞부분), 로그 영역
+        # 맨 위에 표시된 라인은 그대로 유지합니다.
+
+        # Only the rows after the insertion point are shifted, so inserting just above a short tail stays cheap.
+        # 삽입 위치 이후의 행만 이동되므로, 짧은 끝부분 바로 위에 삽입하는 비용은 작게 유지됩니다.
+        """
+        anchor = self.top_abs_index()
+        row = self.row_for_abs(abs_index)
+        old_total = len(self.rows)
+        self.rows.truncate(row)
+        self.rows.extend(self.master_app.all_logs.select(start=abs_index))
+        added = len(self.rows) - old_total
+        self.search_spans = {(key + count if key >= abs_index else key): value for key, value in self.search_spans.items()}
+        if self.selected_abs is not None and self.selected_abs >= abs_index:
+            self.selected_abs += count
+        if self.current_match is not None and self.current_match[0] >= abs_index:
+            match_index, span_start, span_end = self.current_match
+            self.current_match = (match_index + count, span_start, span_end)
+
+        if anchor is None:
+            self.scroll_to_end()
+            return
+        if row <= self.window_start:
+            # The rendered lines are unchanged; they just sit at later rows now.
+            # 렌더링된 라인은 그대로이며, 이제 더 뒤의 행에 위치할 뿐입니다.
+            self.window_start += added; self.window_end += added
+        elif row < self.window_end:
+            self.render_window(self.row_for_abs(anchor + count if anchor >= abs_index else anchor))
+            return
+        self._update_scrollbar()
+
+    def see_abs(self, abs_index: int):
+        """
+        # Makes an absolute log index visible, re-rendering the window if needed, and returns its Text line.
+        # 절대 로그 인덱스가 보이도록 하고 (필요하면 창을 다시 렌더링), 해당 Text 라인을 반환합니다.
+        """
+        row = self.row_for_abs(abs_index)
+        if row >= len(self.rows) or self.rows[row] != abs_index:
+            return None
+        if not (self.window_start <= row < self.window_end):
+            self.render_window(row - VIEW_WINDOW_MARGIN // 2)
+        line = row - self.window_start + 1
+        self.text.see(f"{line}.0")
+        return line
+
+    def _segments_for_rows(self, start: int, end: int) -> list:
+        """
+        # Builds the flat insert arguments for filtered rows [start, end).
+        # 필터링된 행 [start, end)에 대한 평면 삽입 인수를 만듭니다.
+        """
+        app = self.master_app
+        store = app.all_logs
+        segments = []
+        for abs_index in self.rows.slice(start, end):
+            base_tags = app._get_tags_for_log(store.level(abs_index), store.state(abs_index))
+            segments += app._build_log_segments(store.message(abs_index), base_tags)
+        return segments
+
+    def _decorate_rows(self, start: int, end: int):
+        """
+        # Applies the selection and search highlight tags to rendered rows [start, end).
+        # 렌더링된 행 [start, end)에 선택 및 검색 하이라이트 태그를 적용합니다.
+        """
+        selected = self.selected_abs
+        search_ranges = []
+        for row, abs_index in enumerate(self.rows.slice(start, end), start):
+            line = row - self.window_start + 1
+            if abs_index == selected:
+                self.text.tag_add("highlight", f"{line}.0", f"{line}.0 lineend")
+            for span_start, span_end in self.search_spans.get(abs_index, ()):
+                search_ranges += [f"{line}.{span_start}", f"{line}.{span_end}"]
+        if search_ranges:
+            self.text.tag_add("search_highlight", *search_ranges)
+        if self.current_match:
+            abs_index, span_start, span_end = self.current_match
+            line = self.text_line_for_abs(abs_index)
+            if line is not None and start <= line + self.window_start - 1 < end:
+                self.text.tag_add("current_search_highlight", f"{line}.{span_start}", f"{line}.{span_end}")
+
+    def select(self, abs_index):
+        """
+        # Moves the selection to abs_index (or clears it with None), retagging only the old and the new line.
+        # 선택을 abs_index로 옮기며 (None이면 해제), 이전 라인과 새 라인만 다시 태그합니다.
+        """
+        previous, self.selected_abs = self.selected_abs, abs_index
+        if previous is not None:
+            line = self.text_line_for_abs(previous)
+            if line is not None:
+                self.text.tag_remove("highlight", f"{line}.0", f"{line}.0 lineend")
+        if abs_index is not None:
+            line = self.text_line_for_abs(abs_index)
+            if line is not None:
+                self.text.tag_add("highlight", f"{line}.0", f"{line}.0 lineend")
+
+    def apply_change(self, event: str, abs_index: int, spans: list):
+        """
+        # Applies a single-entry change event of the log store as a local edit of the log area.
+        # 로그 저장소의 단일 항목 변경 이벤트를 로그 영역의 국소 편집으로 적용합니다.
+
+        # The filtered index, the window bounds, the search spans and the selection are shifted in place, and at most
+        # one Text line is inserted, replaced or deleted; the line shown at the top of the log area stays in place.
+        # 필터링된 인덱스, 창 경계, 검색 범위와 선택은 제자리에서 이동되며, Text 라인은 최대 한 줄만 삽입, 교체
+        # 또는 삭제됩니다. 로그 영역 맨 위에 표시된 라인은 그대로 유지됩니다.
+
+        # Args:
+        #     event (str): One of the log_store change events. (log_store 변경 이벤트 중 하나)
+        #     abs_index (int): The changed absolute log index, in the coordinates after the change. (변경 이후 좌표의 변경된 절대 로그 인덱스)
+        #     spans (list): The search match spans of the entry after the change. (변경 이후 항목의 검색 일치 범위)
+        """
+        store = self.master_app.all_logs
+        row = self.row_for_abs(abs_index)
+        was_shown = event != INSERTED and row < len(self.rows) and self.rows[row] == abs_index
+        is_shown = event != REMOVED and not store.is_deleted(abs_index)
+        shift = {INSERTED: 1, REMOVED: -1}.get(event, 0)
+        tail_rendered = self.window_end == len(self.rows)
+
+        if shift:
+            # The rows after the edit only move by one, so their indices are shifted in the row index (a per-block
+            # delta) rather than selected again from the store.
+            # 편집 이후의 행들은 하나씩만 이동하므로, 저장소에서 다시 선택하지 않고 행 인덱스에서 (블록별 delta로) 이동합니다.
+            if was_shown:
+                self.rows.pop(row)
+            self.rows.shift(row, shift)
+            if is_shown:
+                self.rows.insert(row, abs_index)
+            self.search_spans = {(key + shift if key >= abs_index else key): value
+                                 for key, value in self.search_spans.items() if not (event == REMOVED and key == abs_index)}
+            if self.selected_abs is not None and self.selected_abs >= abs_index:
+                self.selected_abs = None if event == REMOVED and self.selected_abs == abs_index else self.selected_abs + shift
+            if self.current_match is not None and self.current_match[0] >= abs_index:
+                match_index, span_start, span_end = self.current_match
+                self.current_match = None if event == REMOVED and match_index == abs_index else (match_index + shift, span_start, span_end)
+        elif was_shown and not is_shown:
+            self.rows.pop(row)
+        elif is_shown and not was_shown:
+            self.rows.insert(row, abs_index)
+        if event != REMOVED:
+            if spans and is_shown:
+                self.search_spans[abs_index] = spans
+            else:
+                self.search_spans.pop(abs_index, None)
+            if self.current_match is not None and self.current_match[0] == abs_index and self.current_match[1:] not in spans:
+                self.current_match = None
+
+        line = row - self.window_start + 1
+        top_line = int(self.text.index("@0,0").split('.')[0])
+        self._rendering = True
+        try:
+            self.text.config(state='normal')
+            if was_shown and is_shown:
+                if self.window_start <= row < self.window_end:
+                    self.text.delete(f"{line}.0", f"{line + 1}.0")
+                    self.text.insert(f"{line}.0", *self._segments_for_rows(row, row + 1))
+                    self._decorate_rows(row, row + 1)
+            elif was_shown:
+                if row < self.window_start:
+                    self.window_start -= 1; self.window_end -= 1
+                elif row < self.window_end:
+                    self.text.delete(f"{line}.0", f"{line + 1}.0")
+                    self.window_end -= 1
+                    if line < top_line: self.text.yview(f"{top_line - 1}.0")
+            elif is_shown:
+                if row < self.window_start:
+                    self.window_start += 1; self.window_end += 1
+                elif row < self.window_end or (row == self.window_end and tail_rendered):
+                    self.text.insert(f"{line}.0", *self._segments_for_rows(row, row + 1))
+                    self.window_end += 1
+                    self._decorate_rows(row, row + 1)
+                    if line < top_line: self.text.yview(f"{top_line + 1}.0")
+            self.text.config(state='disabled')
+        finally:
+            self._rendering = False
+        self._update_scrollbar()
+
+    def redecorate_search(self):
+        """
+        # Re-applies the search highlight tags to the rendered window without re-rendering its text.
+        # 텍스트를 다시 렌더링하지 않고 렌더링된 창에 검색 하이라이트 태그를 다시 적용합니다.
+        """
+        self.text.tag_remove("search_highlight", "1.0", tk.END)
+        self.text.tag_remove("current_search_highlight", "1.0", tk.END)
+        self._decorate_rows(self.window_start, self.window_end)
+
+    # --- Scrolling (스크롤) ---
+
+    def yview(self, *args):
+        """
+        # Scrollbar command: maps 'moveto' fractions to the full filtered index and forwards 'scroll' steps to the Text widget.
+        # 스크롤바 명령: 'moveto' 비율을 전체 필터링된 인덱스에 매핑하고, 'scroll' 단계는 Text 위젯에 전달합니다.
+        """
+        total = len(self.rows)
+        if not total or not args:
+            return
+        if args[0] != 'moveto':
+            self.text.yview(*args)
+            return
+        fraction = min(max(float(args[1]), 0.0), 1.0)
+        target = min(int(fraction * total), total - 1)
+        window_len = self.window_end - self.window_start
+        lower = self.window_start + (VIEW_WINDOW_MARGIN // 2 if self.window_start > 0 else 0)
+        upper = self.window_end - (VIEW_WINDOW_MARGIN // 2 if self.window_end < total else 0)
+        if window_len and lower <= target < upper:
+            self.text.yview_moveto((target - self.window_start) / window_len)
+        else:
+            self.render_window(target, anchor_end=fraction >= 1.0)
+
+    def _on_text_yscroll(self, first, last):
+        """
+        # Text yscrollcommand: updates the scrollbar and schedules a check of the window edges.
+        # Text yscrollcommand: 스크롤바를 업데이트하고 창 가장자리 확인을 예약합니다.
+        """
+        self._update_scrollbar(float(first), float(last))
+        if not self._rendering and self._edge_check_job is None:
+            self._edge_check_job = self.text.after_idle(self._check_window_edges)
+
+    def _check_window_edges(self):
+        """
+        # Re-renders the window around the current position when scrolling comes close to its edges.
+        # 스크롤이 창의 가장자리에 가까워지면 현재 위치를 중심으로 창을 다시 렌더링합니다.
+        """
+        self._edge_check_job = None
+        if self.window_end <= self.window_start:
+            return
+        hidden_codes = self._hidden_codes()
+        top, bottom = self.top_row(), self.bottom_row()
+        near_top = self.window_start > 0 and self._walk_visible(top, -1, VIEW_WINDOW_MARGIN // 2, hidden_codes) <= self.window_start
+        near_bottom = self.window_end < len(self.rows) and self._walk_visible(bottom + 1, 1, VIEW_WINDOW_MARGIN // 2, hidden_codes) >= self.window_end
+        if (near_top or near_bottom) and self._window_bounds(top, hidden_codes) != (self.window_start, self.window_end):
+            self.render_window(top)
+
+    def on_filter_change(self):
+        """
+        # Schedules a window check after level tags were elided or revealed, since the number of visible rows changed.
+        # 레벨 태그가 생략되거나 다시 표시된 후 보이는 행의 수가 바뀌었으므로 창 확인을 예약합니다.
+        """
+        if self._edge_check_job is None:
+            self._edge_check_job = self.text.after_idle(self._check_window_edges)
+
+    def _update_scrollbar(self, first=None, last=None):
+        """
+        # Sets the scrollbar to the position of the rendered window within the full filtered index.
+        # 전체 필터링된 인덱스 내에서 렌더링된 창의 위치로 스크롤바를 설정합니다.
+        """
+        total = len(self.rows)
+        window_len = self.window_end - self.window_start
+        if not total or not window_len:
+            self.scrollbar.set(0.0, 1.0)
+            return
+        if first is None:
+            first, last = self.text.yview()
+        self.scrollbar.set((self.window_start + first * window_len) / total, (self.window_start + last * window_len) / total)
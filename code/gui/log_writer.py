@@ -0,0 +1,150 @@
+import os
+import time
+import queue
+import threading
+from typing import List, Optional
+from .instrumentation import PipelineStats
+from .config import LOG_WRITER_BUFFER_BYTES, LOG_WRITER_DURABILITY, LOG_WRITER_FLUSH_INTERVAL_MS
+
+# Durability modes: 'none' leaves flushing to the file buffer, 'flush' hands data to the OS every interval,
+# 'fsync' additionally forces it to disk every interval.
+# 내구성 모드: 'none'은 플러시를 파일 버퍼에 맡기고, 'flush'는 주기마다 데이터를 OS에 넘기며,
+# 'fsync'는 추가로 주기마다 디스크에 강제로 기록합니다.
+DURABILITY_MODES = ('none', 'flush', 'fsync')
+
+class LogWriter:
+    """
+    # Writes log lines to a file on a dedicated thread, coalescing queued batches into large buffered writes.
+    # 전용 스레드에서 로그 라인을 파일에 기록하며, 큐에 쌓인 배치를 큰 버퍼 쓰기로 합칩니다.
+    """
+    def __init__(self, path: str, durability: str = LOG_WRITER_DURABILITY, flush_interval_ms: int = LOG_WRITER_FLUSH_INTERVAL_MS,
+                 stats: Optional[PipelineStats] = None):
+        """
+        # Opens the file for appending and starts the writer thread.
+        # 파일을 추가 모드로 열고 쓰기 스레드를 시작합니다.
+
+        # Args:
+        #     path (str): The log file path. (로그 파일 경로)
+        #     durability (str): One of DURABILITY_MODES. (DURABILITY_MODES 중 하나)
+        #     flush_interval_ms (int): Interval between flushes (or fsyncs) while lines are being written. (라인 기록 중 플러시(또는 fsync) 간격)
+        #     stats (PipelineStats, optional): Receives 'file_write' (write and sync time) and 'file_latency' (time from
+        #         write_lines to the write) per batch, in ms. (배치마다 'file_write'(쓰기 및 동기화 시간)와 'file_latency'
+        #         (write_lines부터 쓰기까지의 시간)를 ms 단위로 받음)
+
+        # Raises:
+        #     ValueError: If the durability mode is unknown. (알 수 없는 내구성 모드인 경우)
+        #     OSError: If the file cannot be opened. (파일을 열 수 없는 경우)
+        """
+        if durability not in DURABILITY_MODES:
+            raise ValueError(f"Unknown durability mode: {durability}")
+        self.path = path
+        self.durability = durability
+        self.flush_interval = flush_interval_ms / 1000
+        self.stats_sink = stats
+        self.file = open(path, "ab", buffering=LOG_WRITER_BUFFER_BYTES)
+        self.queue = queue.SimpleQueue()
+        self.error: Optional[OSError] = None
+        self.lines_queued = 0
+        self.lines_written = 0
+        self.bytes_written = 0
+        self.started_at = time.monotonic()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="LogWriter", daemon=True)
+        self._thread.start()
+
+    def write_lines(self, lines: List[str]):
+        """
+        # Queues lines (without trailing newlines) for writing. Never blocks on disk I/O.
+        # 기록할 라인(끝 개행 제외)을 큐에 넣습니다. 디스크 I/O로 블로킹되지 않습니다.
+        """
+        if self._closed or not lines:
+            return
+        self.lines_queued += len(lines)
+        self.queue.put((time.perf_counter(), lines))
+
+    def close(self, timeout: Optional[float] = 5.0):
+        """
+        # Writes out the remaining backlog, syncs according to the durability mode and closes the file.
+        # 남은 백로그를 기록하고, 내구성 모드에 따라 동기화한 뒤 파일을 닫습니다.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self.queue.put(None)
+        self._thread.join(timeout)
+
+    @property
+    def backlog(self) -> int:
+        """
+        # Number of queued lines not yet handed to the file.
+        # 아직 파일에 전달되지 않은 큐의 라인 수입니다.
+        """
+        return self.lines_queued - self.lines_written
+
+    def stats(self) -> dict:
+        """
+        # Returns a snapshot of the writer counters, including the average throughput since start.
+        # 시작 이후 평균 처리량을 포함한 쓰기 카운터의 스냅샷을 반환합니다.
+        """
+        elapsed = max(time.monotonic() - self.started_at, 1e-9)
+        return {
+            'lines_written': self.lines_written,
+            'bytes_written': self.bytes_written,
+            'backlog': self.backlog,
+            'lines_per_sec': self.lines_written / elapsed,
+            'bytes_per_sec': self.bytes_written / elapsed,
+            'durability': self.durability,
+            'error': self.error,
+        }
+
+    def _sync(self):
+        if self.durability == 'none':
+            return
+        self.file.flush()
+        if self.durability == 'fsync':
+            os.fsync(self.file.fileno())
+
+    def _run(self):
+        """
+        # Writer thread: drains every batch available, writes them as one string and syncs at most once per interval.
+        # 쓰기 스레드: 사용 가능한 모든 배치를 꺼내 하나의 문자열로 기록하고, 주기마다 최대 한 번 동기화합니다.
+        """
+        last_sync = time.monotonic()
+        dirty = False
+        stop = False
+        while not stop:
+            try:
+                batches = [self.queue.get(timeout=self.flush_interval if dirty else None)]
+            except queue.Empty:
+                batches = []
+            while True:
+                try:
+                    batches.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            if None in batches:
+                stop = True
+                batches = [batch for batch in batches if batch is not None]
+            lines = [line for _, batch in batches for line in batch]
+            write_start = time.perf_counter()
+            try:
+                if lines and self.error is None:
+                    data = ('\n'.join(lines) + '\n').encode('utf-8')
+                    self.file.write(data)
+                    self.bytes_written += len(data)
+                    dirty = True
+                now = time.monotonic()
+                if dirty and (stop or now - last_sync >= self.flush_interval):
+                    self._sync()
+                    last_sync, dirty = now, False
+            except OSError as e:
+                self.error = e
+            self.lines_written += len(lines)
+            if lines and self.stats_sink is not None:
+                now = time.perf_counter()
+                self.stats_sink.observe('file_write', (now - write_start) * 1000)
+                self.stats_sink.observe('file_latency', (now - batches[0][0]) * 1000)
+        try:
+            self.file.close()
+        except OSError as e:
+            self.error = self.error or e
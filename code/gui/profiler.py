@@ -0,0 +1,112 @@
+import os
+import io
+import time
+import pstats
+import cProfile
+import tracemalloc
+from datetime import datetime
+from typing import Dict, List, Optional
+from .config import PROFILE_TOP_N, PROFILE_TRACEMALLOC_FRAMES
+
+# Profiling kinds: 'cpu' runs cProfile on the thread that starts it (the Tk thread, so every Tk callback is covered),
+# 'mem' traces Python allocations of all threads with tracemalloc.
+# 프로파일링 종류: 'cpu'는 시작한 스레드(Tk 스레드이므로 모든 Tk 콜백이 포함됨)에서 cProfile을 실행하고,
+# 'mem'은 tracemalloc으로 모든 스레드의 Python 메모리 할당을 추적합니다.
+PROFILE_KINDS = ('cpu', 'mem')
+
+class ProfilerError(Exception):
+    """
+    # A profiling session could not be started or stopped; the message is meant for the user.
+    # 프로파일링 세션을 시작하거나 중지할 수 없습니다. 메시지는 사용자에게 보여 주기 위한 것입니다.
+    """
+
+class SessionProfiler:
+    """
+    # On-demand CPU and memory profiling of a running session, without restarting it under a profiler.
+    # 실행 중인 세션을 프로파일러로 다시 시작하지 않고, 필요할 때 CPU와 메모리를 프로파일링합니다.
+    """
+    def __init__(self, top_n: int = PROFILE_TOP_N, frames: int = PROFILE_TRACEMALLOC_FRAMES):
+        self.top_n = top_n
+        self.frames = frames
+        self._cpu: Optional[cProfile.Profile] = None
+        self._started_at: Dict[str, float] = {}
+
+    @property
+    def active(self) -> List[str]:
+        return [kind for kind in PROFILE_KINDS if kind in self._started_at]
+
+    def start(self, kind: str = 'cpu'):
+        """
+        # Starts profiling of the given kind.
+        # 주어진 종류의 프로파일링을 시작합니다.
+
+        # Raises:
+        #     ProfilerError: If the kind is unknown, already running, or another profiler is active. (알 수 없는 종류이거나,
+        #         이미 실행 중이거나, 다른 프로파일러가 활성화된 경우)
+        """
+        if kind not in PROFILE_KINDS:
+            raise ProfilerError(f"Unknown profile kind: {kind}")
+        if kind in self._started_at:
+            raise ProfilerError(f"The {kind} profile is already running.")
+        if kind == 'cpu':
+            profile = cProfile.Profile()
+            try:
+                profile.enable()
+            except ValueError as e:
+                raise ProfilerError(f"Cannot start the CPU profiler: {e}") from e
+            self._cpu = profile
+        else:
+            if tracemalloc.is_tracing():
+                raise ProfilerError("tracemalloc is already tracing in this process.")
+            tracemalloc.start(self.frames)
+        self._started_at[kind] = time.monotonic()
+
+    def stop(self, kind: str, out_dir: str) -> List[str]:
+        """
+        # Stops profiling of the given kind and writes its reports to out_dir: profile_cpu_<timestamp>.pstats and .txt
+        # (top functions by cumulative time) for 'cpu', profile_mem_<timestamp>.txt (top allocation sites) for 'mem'.
+        # 주어진 종류의 프로파일링을 중지하고 보고서를 out_dir에 기록합니다. 'cpu'는 profile_cpu_<timestamp>.pstats와
+        # .txt(누적 시간 기준 상위 함수), 'mem'은 profile_mem_<timestamp>.txt(상위 할당 위치)입니다.
+
+        # Returns:
+        #     list: The paths written. (기록된 경로)
+
+        # Raises:
+        #     ProfilerError: If the kind is not running. (해당 종류가 실행 중이 아닌 경우)
+        #     OSError: If a report cannot be written; profiling is stopped regardless. (보고서를 기록할 수 없는 경우, 프로파일링은 어쨌든 중지됨)
+        """
+        if kind not in self._started_at:
+            raise ProfilerError(f"The {kind} profile is not running.")
+        duration = time.monotonic() - self._started_at.pop(kind)
+        base = os.path.join(out_dir, f"profile_{kind}_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
+        if kind == 'cpu':
+            profile, self._cpu = self._cpu, None
+            profile.disable()
+            os.makedirs(out_dir, exist_ok=True)
+            profile.dump_stats(base + '.pstats')
+            report = io.StringIO()
+            report.write(f"CPU profile of the Tk thread over {duration:.1f}s (open the .pstats file with pstats or snakeviz for details)\n\n")
+            pstats.Stats(profile, stream=report).sort_stats('cumulative').print_stats(self.top_n)
+            with open(base + '.txt', 'w', encoding='utf-8') as f:
+                f.write(report.getvalue())
+            return [base + '.pstats', base + '.txt']
+
+        try:
+            snapshot = tracemalloc.take_snapshot().filter_traces((
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+            ))
+            current, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        lines = [f"Memory profile over {duration:.1f}s: {current / 1024 / 1024:,.1f} MB traced now, {peak / 1024 / 1024:,.1f} MB peak", ""]
+        lines.append(f"Top {self.top_n} allocation sites still alive:")
+        lines += [str(stat) for stat in snapshot.statistics('lineno')[:self.top_n]]
+        top = snapshot.statistics('traceback')[:1]
+        if top:
+            lines += ["", f"Largest site, traceback ({top[0].count:,} blocks, {top[0].size / 1024:,.1f} KiB):"]
+            lines += top[0].traceback.format()
+        os.makedirs(out_dir, exist_ok=True)
+        with open(base + '.txt', 'w', encoding='utf-8') as f:
+            f.write("\n".join(lines) + "\n")
+        return [base + '.txt']
@@ -0,0 +1,158 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import List
+
+class RowIndex:
+    """
+    # The filtered index of a log view: the sorted absolute log indices of its rows, stored in blocks.
+    # 로그 뷰의 필터링된 인덱스입니다: 행들의 정렬된 절대 로그 인덱스를 블록 단위로 저장합니다.
+
+    # Every block holds stored values plus a delta added to all of them, so shifting the indices after an edit only
+    # splits the block at the edit and adjusts the deltas of the later blocks; the stored values are never rewritten.
+    # 각 블록은 저장된 값과 그 모두에 더해지는 delta를 가지므로, 편집 이후의 인덱스를 이동할 때는 편집 위치에서
+    # 블록을 나누고 이후 블록의 delta만 조정합니다. 저장된 값은 다시 쓰지 않습니다.
+    """
+    BLOCK_ROWS = 16384
+
+    def __init__(self, values: array = None):
+        self.typecode = values.typecode if values is not None else 'L'
+        self._blocks: List[array] = []
+        self._deltas: List[int] = []
+        self._starts: List[int] = []
+        self._length = 0
+        if values is not None:
+            self.extend(values)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def _locate(self, row: int):
+        block = bisect_right(self._starts, row) - 1
+        return block, row - self._starts[block]
+
+    def __getitem__(self, row: int) -> int:
+        if not 0 <= row < self._length:
+            raise IndexError("row index out of range")
+        block, offset = self._locate(row)
+        return self._blocks[block][offset] + self._deltas[block]
+
+    def slice(self, start: int, end: int) -> array:
+        """
+        # Returns the absolute indices of rows [start, end) as one array.
+        # 행 [start, end)의 절대 인덱스를 하나의 배열로 반환합니다.
+        """
+        result = array(self.typecode)
+        start, end = max(0, start), min(end, self._length)
+        if start >= end:
+            return result
+        block, offset = self._locate(start)
+        while start < end:
+            values, delta = self._blocks[block], self._deltas[block]
+            part = values[offset:offset + end - start]
+            result.extend(array(self.typecode, map(delta.__add__, part)) if delta else part)
+            start += len(part)
+            block, offset = block + 1, 0
+        return result
+
+    def bisect_left(self, value: int) -> int:
+        """
+        # Returns the first row whose absolute index is not below value (len() if there is none).
+        # 절대 인덱스가 value 이상인 첫 번째 행을 반환합니다 (없으면 len()).
+        """
+        blocks, deltas = self._blocks, self._deltas
+        block = bisect_left(range(len(blocks)), value, key=lambda k: blocks[k][-1] + deltas[k])
+        if block == len(blocks):
+            return self._length
+        return self._starts[block] + bisect_left(blocks[block], value - deltas[block])
+
+    # --- Editing (편집) ---
+
+    def extend(self, values: array):
+        """
+        # Appends absolute indices that are all above the last one.
+        # 모두 마지막 값보다 큰 절대 인덱스들을 추가합니다.
+        """
+        position, total = 0, len(values)
+        if total and self._blocks and not self._deltas[-1] and len(self._blocks[-1]) < self.BLOCK_ROWS:
+            position = self.BLOCK_ROWS - len(self._blocks[-1])
+            self._blocks[-1].extend(values[:position])
+        while position < total:
+            self._add_block(len(self._blocks), values[position:position + self.BLOCK_ROWS], 0, self._length + position)
+            position += self.BLOCK_ROWS
+        self._length += total
+
+    def truncate(self, row: int):
+        """
+        # Removes the rows from row on.
+        # row부터의 행들을 제거합니다.
+        """
+        if row >= self._length:
+            return
+        block, offset = self._locate(row)
+        if offset:
+            del self._blocks[block][offset:]
+            block += 1
+        del self._blocks[block:], self._deltas[block:], self._starts[block:]
+        self._length = row
+
+    def shift(self, row: int, delta: int):
+        """
+        # Adds delta to the absolute indices of the rows from row on; it must keep them sorted and non-negative.
+        # row부터의 행들의 절대 인덱스에 delta를 더합니다. 정렬 순서와 음이 아닌 값이 유지되어야 합니다.
+        """
+        if row >= self._length or not delta:
+            return
+        block, offset = self._locate(row)
+        if offset:
+            values = self._blocks[block]
+            self._add_block(block + 1, values[offset:], self._deltas[block], row)
+            del values[offset:]
+            block += 1
+        deltas = self._deltas
+        for k in range(block, len(deltas)):
+            deltas[k] += delta
+
+    def insert(self, row: int, value: int):
+        """
+        # Inserts an absolute index at row; it must fit between its neighbours.
+        # row에 절대 인덱스를 삽입합니다. 이웃한 값들 사이에 맞아야 합니다.
+        """
+        if row > 0:
+            # Appending to the block of the previous row keeps the stored value above that row's, so it stays non-negative.
+            # 이전 행의 블록에 추가하면 저장된 값이 그 행의 값보다 커지므로, 음수가 되지 않습니다.
+            block, offset = self._locate(row - 1)
+            offset += 1
+        else:
+            block, offset = 0, 0
+        if not self._blocks or value < self._deltas[block]:
+            self._add_block(block, array(self.typecode, [0]), value, row)
+        else:
+            self._blocks[block].insert(offset, value - self._deltas[block])
+        self._length += 1
+        starts = self._starts
+        for k in range(block + 1, len(starts)):
+            starts[k] += 1
+
+    def pop(self, row: int) -> int:
+        """
+        # Removes the row and returns its absolute index.
+        # 행을 제거하고 그 절대 인덱스를 반환합니다.
+        """
+        if not 0 <= row < self._length:
+            raise IndexError("pop index out of range")
+        block, offset = self._locate(row)
+        value = self._blocks[block].pop(offset) + self._deltas[block]
+        if not self._blocks[block]:
+            del self._blocks[block], self._deltas[block], self._starts[block]
+        else:
+            block += 1
+        self._length -= 1
+        starts = self._starts
+        for k in range(block, len(starts)):
+            starts[k] -= 1
+        return value
+
+    def _add_block(self, block: int, values: array, delta: int, start: int):
+        self._blocks.insert(block, values)
+        self._deltas.insert(block, delta)
+        self._starts.insert(block, start)
@@ -0,0 +1,216 @@
+import re
+import queue
+import threading
+from itertools import chain
+from typing import TYPE_CHECKING, Optional
+from .config import SEARCH_DEBOUNCE_MS, SEARCH_POLL_INTERVAL_MS
+
+if TYPE_CHECKING:
+    from .log_display import LogDisplay
+
+class SearchEngine:
+    """
+    # Debounced, incremental search-as-you-type over the log store.
+    # 로그 저장소에 대한 디바운스 및 증분 방식의 입력 중 검색입니다.
+
+    # Scans run on a worker thread and are cancelled as soon as a newer query is issued. When a plain query
+    # extends the previous one, only the previously matching entries (plus entries appended since) are rescanned.
+    # 스캔은 작업 스레드에서 실행되며, 더 새로운 검색어가 입력되면 즉시 취소됩니다. 일반 검색어가 이전 검색어를
+    # 확장하는 경우, 이전에 일치한 항목(및 그 이후 추가된 항목)만 다시 스캔합니다.
+    """
+    CANCEL_CHECK_LINES = 2048
+
+    def __init__(self, master_app: 'LogDisplay'):
+        """
+        # Initializes the search engine.
+        # 검색 엔진을 초기화합니다.
+
+        # Args:
+        #     master_app (LogDisplay): The main application instance. (메인 애플리케이션 인스턴스)
+        """
+        self.master_app = master_app
+        self.results = queue.Queue()
+        self._generation = 0
+        self._running_generation = None
+        self._debounce_job = None
+        self._poll_job = None
+        self._workers = []
+        self._last = None  # (store, needle, case_sensitive, scanned_len, matched indices) of the last plain scan
+
+    def schedule(self):
+        """
+        # Restarts the debounce timer; the search runs once typing pauses for SEARCH_DEBOUNCE_MS.
+        # 디바운스 타이머를 다시 시작합니다. 입력이 SEARCH_DEBOUNCE_MS 동안 멈추면 검색이 실행됩니다.
+        """
+        self._generation += 1
+        if self._debounce_job is not None:
+            self.master_app.after_cancel(self._debounce_job)
+        self._debounce_job = self.master_app.after(SEARCH_DEBOUNCE_MS, self.run)
+
+    def invalidate(self):
+        """
+        # Forgets the previous result set, e.g. after log entries were edited, deleted or reloaded.
+        # 이전 결과 집합을 버립니다. 예: 로그 항목이 편집, 삭제 또는 다시 로드된 후.
+        """
+        self._last = None
+
+    def cancel(self):
+        """
+        # Cancels any pending or running search.
+        # 대기 중이거나 실행 중인 검색을 취소합니다.
+        """
+        self._generation += 1
+        if self._debounce_job is not None:
+            self.master_app.after_cancel(self._debounce_job)
+            self._debounce_job = None
+
+    def stop(self):
+        """
+        # Cancels any search and waits for its worker threads to exit. Call before the scanned store is closed or its text
+        # is relocated (e.g. its mapped file is released or its arena compacted).
+        # 모든 검색을 취소하고 작업 스레드가 끝날 때까지 기다립니다. 스캔 중인 저장소를 닫거나 텍스트를 옮기기 전에
+        # (예: 매핑된 파일 해제, 아레나 압축) 호출합니다.
+        """
+        self.cancel()
+        workers, self._workers = self._workers, []
+        for worker in workers:
+            worker.join()
+        self._running_generation = None
+
+    def run(self):
+        """
+        # Starts a search for the current query immediately, cancelling any search still running.
+        # 현재 검색어에 대한 검색을 즉시 시작하며, 아직 실행 중인 검색은 취소합니다.
+        """
+        app = self.master_app
+        self._debounce_job = None
+        self._generation += 1
+        generation = self._generation
+
+        search_term = app.search_var.get()
+        if not search_term:
+            app._apply_search_results({}, [])
+            return
+        case_sensitive = app.case_sensitive_var.get()
+        pattern = None
+        if app.regex_var.get():
+            try:
+                pattern = re.compile(search_term, 0 if case_sensitive else re.IGNORECASE)
+            except re.error as e:
+                app.update_status(f"Regex Error: {e}", app.theme.LOG_LEVEL_COLORS['DELETED'])
+                app._apply_search_results({}, [])
+                return
+        needle = search_term if case_sensitive else search_term.lower()
+
+        store = app.all_logs
+        total = len(store)
+        reuse = None
+        if pattern is None and self._last is not None:
+            last_store, last_needle, last_case, last_len, last_matched = self._last
+            if last_store is store and last_case == case_sensitive and last_needle in needle and last_len <= total:
+                reuse = (last_matched, last_len)
+
+        self._running_generation = generation
+        worker = threading.Thread(target=self._scan, args=(generation, store, reuse, needle, case_sensitive, pattern, total), daemon=True)
+        self._workers = [thread for thread in self._workers if thread.is_alive()] + [worker]
+        worker.start()
+        if self._poll_job is None:
+            self._poll_job = app.after(SEARCH_POLL_INTERVAL_MS, self._poll)
+
+    def _scan(self, generation: int, store, reuse, needle: str, case_sensitive: bool, pattern: Optional[re.Pattern], total: int):
+        """
+        # Worker thread: scans the candidate entries and posts the result unless a newer query superseded it.
+        # 작업 스레드: 후보 항목을 스캔하고, 더 새로운 검색어로 대체되지 않았다면 결과를 게시합니다.
+
+        # Args:
+        #     reuse (tuple | None): (previously matched indices, store length at that scan) when the query extends the last one.
+        #                           (검색어가 이전 검색어를 확장하는 경우, (이전에 일치한 인덱스, 그 스캔 시점의 저장소 길이))
+        """
+        if reuse is not None:
+            last_matched, last_len = reuse
+            candidates = chain(last_matched, store.select(start=last_len))
+        else:
+            candidates = store.select()
+        spans, matches = {}, []
+        message = store.message
+        for count, i in enumerate(candidates):
+            if count % self.CANCEL_CHECK_LINES == 0 and generation != self._generation:
+                return
+            if i >= total:
+                break
+            try:
+                log_message = message(i)
+            except IndexError:
+                continue
+            except (ValueError, OSError):
+                # The store was closed under the scan (its mapping or spill file); the result would be meaningless.
+                # 스캔 중에 저장소가 닫혔으므로 (매핑이나 스필 파일), 결과는 의미가 없습니다.
+                self.results.put((generation, None, None, None))
+                return
+            line_spans = self._find_spans(log_message, needle, case_sensitive, pattern)
+            if line_spans:
+                spans[i] = line_spans
+                matches += [(i, start, end) for start, end in line_spans]
+        self.results.put((generation, spans, matches, None if pattern else (store, needle, case_sensitive, total, list(spans))))
+
+    @staticmethod
+    def _find_spans(message: str, needle: str, case_sensitive: bool, pattern: Optional[re.Pattern]) -> list:
+        if pattern:
+            return [match.span() for match in pattern.finditer(message)]
+        haystack = message if case_sensitive else message.lower()
+        spans = []
+        start = haystack.find(needle)
+        while start != -1:
+            spans.append((start, start + len(needle)))
+            start = haystack.find(needle, start + 1)
+        return spans
+
+    def spans_for(self, message: str) -> list:
+        """
+        # Returns the match spans of the current query in a single message (empty if there is no valid query).
+        # 단일 메시지에서 현재 검색어의 일치 범위를 반환합니다 (유효한 검색어가 없으면 빈 리스트).
+        """
+        app = self.master_app
+        search_term = app.search_var.get()
+        if not search_term:
+            return []
+        case_sensitive = app.case_sensitive_var.get()
+        pattern = None
+        if app.regex_var.get():
+            try:
+                pattern = re.compile(search_term, 0 if case_sensitive else re.IGNORECASE)
+            except re.error:
+                return []
+        return self._find_spans(message, search_term if case_sensitive else search_term.lower(), case_sensitive, pattern)
+
+    @property
+    def busy(self) -> bool:
+        """
+        # Whether a search is pending or running, i.e. a result based on the current log is still to come.
+        # 검색이 대기 중이거나 실행 중인지, 즉 현재 로그 기준의 결과가 아직 도착하지 않았는지 여부입니다.
+        """
+        return self._debounce_job is not None or self._running_generation is not None
+
+    def _poll(self):
+        """
+        # Tk thread: applies the result of the latest search when it arrives and drops stale ones.
+        # Tk 스레드: 최신 검색 결과가 도착하면 적용하고, 오래된 결과는 버립니다.
+        """
+        self._poll_job = None
+        while True:
+            try:
+                generation, spans, matches, last = self.results.get_nowait()
+            except queue.Empty:
+                break
+            if generation != self._generation:
+                continue
+            self._running_generation = None
+            if spans is None:
+                return
+            self._last = last
+            self.master_app._apply_search_results(spans, matches)
+            return
+        if self._running_generation != self._generation:
+            self._running_generation = None
+            return
+        self._poll_job = self.master_app.after(SEARCH_POLL_INTERVAL_MS, self._poll)
@@ -0,0 +1,72 @@
+import os
+import tempfile
+import threading
+import weakref
+from pathlib import Path
+from .config import SPILL_DIR
+
+def _remove(file, path: str):
+    try: file.close()
+    except OSError: pass
+    try: os.remove(path)
+    except OSError: pass
+
+class SpillSegment:
+    """
+    # An append-only temporary file holding the text of log entries evicted from memory.
+    # 메모리에서 밀려난 로그 항목의 텍스트를 보관하는 추가 전용 임시 파일입니다.
+
+    # Reads and appends may come from different threads (e.g. a search worker and the Tk thread) and are serialized.
+    # The file is removed by close() or, at the latest, when the segment is garbage collected.
+    # 읽기와 추가는 서로 다른 스레드(예: 검색 작업 스레드와 Tk 스레드)에서 올 수 있으며 직렬화됩니다.
+    # 파일은 close()로, 늦어도 세그먼트가 가비지 컬렉션될 때 삭제됩니다.
+    """
+    def __init__(self, directory: Path = SPILL_DIR):
+        """
+        # Creates a new, empty segment file in directory.
+        # directory에 비어 있는 새 세그먼트 파일을 생성합니다.
+
+        # Raises:
+        #     OSError: If the file cannot be created. (파일을 생성할 수 없는 경우)
+        """
+        os.makedirs(directory, exist_ok=True)
+        fd, self.path = tempfile.mkstemp(prefix='spill_', suffix='.seg', dir=directory)
+        self._file = os.fdopen(fd, 'w+b')
+        self._lock = threading.Lock()
+        self.size = 0
+        self._finalizer = weakref.finalize(self, _remove, self._file, self.path)
+
+    def append(self, data: bytes) -> int:
+        """
+        # Appends data and returns the offset it was written at.
+        # data를 추가하고 기록된 위치의 오프셋을 반환합니다.
+        """
+        with self._lock:
+            offset = self.size
+            self._file.seek(offset)
+            self._file.write(data)
+            self.size += len(data)
+            return offset
+
+    def read(self, offset: int, length: int) -> bytes:
+        with self._lock:
+            self._file.seek(offset)
+            return self._file.read(length)
+
+    def close(self):
+        self._finalizer()
+
+    @staticmethod
+    def remove_stale(directory: Path = SPILL_DIR):
+        """
+        # Deletes segments left behind by sessions that ended abnormally. Files still open elsewhere are skipped where
+        # the OS refuses to delete them; elsewhere their owners keep reading them through the open handle.
+        # 비정상 종료된 세션이 남긴 세그먼트를 삭제합니다. 다른 곳에서 아직 열려 있는 파일은 OS가 삭제를 거부하면
+        # 건너뛰며, 그렇지 않은 OS에서는 소유자가 열린 핸들로 계속 읽을 수 있습니다.
+        """
+        try: names = os.listdir(directory)
+        except OSError: return
+        for name in names:
+            if name.startswith('spill_') and name.endswith('.seg'):
+                try: os.remove(os.path.join(directory, name))
+                except OSError: pass
@@ -0,0 +1,112 @@
+import os
+import sys
+import codecs
+import selectors
+import threading
+from typing import BinaryIO, Callable, List, Sequence
+from .config import READER_CHUNK_BYTES
+
+class LineSplitter:
+    """
+    # Incrementally decodes UTF-8 chunks and splits them into stripped, non-empty lines.
+    # UTF-8 청크를 증분 디코딩하여 공백이 제거된 비어 있지 않은 라인으로 분할합니다.
+
+    # Like text-mode pipes with universal newlines, '\r', '\n' and '\r\n' all end a line.
+    # 범용 개행을 사용하는 텍스트 모드 파이프와 같이 '\r', '\n', '\r\n'은 모두 라인을 끝냅니다.
+    """
+    def __init__(self):
+        self._decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        self._pending = ''
+
+    def feed(self, chunk: bytes) -> List[str]:
+        """
+        # Returns the complete lines in chunk; a trailing partial line is kept until the next chunk.
+        # chunk의 완전한 라인들을 반환합니다. 끝의 불완전한 라인은 다음 청크까지 보관됩니다.
+        """
+        text = self._pending + self._decoder.decode(chunk)
+        parts = text.replace('\r', '\n').split('\n')
+        self._pending = parts.pop()
+        return [line for line in map(str.strip, parts) if line]
+
+    def finish(self) -> List[str]:
+        """
+        # Flushes the decoder at end of stream and returns the last unterminated line, if any.
+        # 스트림 끝에서 디코더를 비우고, 종료되지 않은 마지막 라인이 있으면 반환합니다.
+        """
+        tail = (self._pending + self._decoder.decode(b'', final=True)).strip()
+        self._pending = ''
+        return [tail] if tail else []
+
+class ChunkedStreamReader:
+    """
+    # Reads child process pipes in large raw chunks and delivers their output as lists of lines.
+    # 자식 프로세스 파이프를 큰 원시 청크 단위로 읽고, 출력을 라인 리스트로 전달합니다.
+
+    # On POSIX a single selector multiplexes all pipes; on Windows, where selectors only support sockets,
+    # each pipe gets a blocking reader thread.
+    # POSIX에서는 하나의 셀렉터가 모든 파이프를 다중화하며, 셀렉터가 소켓만 지원하는 Windows에서는
+    # 파이프마다 블로킹 읽기 스레드를 사용합니다.
+    """
+    def __init__(self, streams: Sequence[BinaryIO], sink: Callable[[List[str]], None], chunk_size: int = READER_CHUNK_BYTES):
+        """
+        # Initializes the reader.
+        # 리더를 초기화합니다.
+
+        # Args:
+        #     streams (Sequence[BinaryIO]): Unbuffered binary pipes (e.g., Popen stdout/stderr with bufsize=0). (버퍼링되지 않는 바이너리 파이프)
+        #     sink (Callable): Called with each non-empty list of lines. (비어 있지 않은 라인 리스트마다 호출되는 함수)
+        #     chunk_size (int): Maximum bytes per os.read call. (os.read 호출당 최대 바이트 수)
+        """
+        self.streams = [stream for stream in streams if stream is not None]
+        self.sink = sink
+        self.chunk_size = chunk_size
+
+    def run(self):
+        """
+        # Reads until every stream reaches end of file, then closes them. Blocks the calling thread.
+        # 모든 스트림이 파일 끝에 도달할 때까지 읽은 뒤 닫습니다. 호출한 스레드를 블로킹합니다.
+        """
+        try:
+            if sys.platform == 'win32':
+                self._run_threads()
+            else:
+                self._run_selector()
+        finally:
+            for stream in self.streams:
+                try: stream.close()
+                except OSError: pass
+
+    def _run_selector(self):
+        selector = selectors.DefaultSelector()
+        for stream in self.streams:
+            selector.register(stream.fileno(), selectors.EVENT_READ, LineSplitter())
+        try:
+            while selector.get_map():
+                lines = []
+                for key, _ in selector.select():
+                    chunk = os.read(key.fd, self.chunk_size)
+                    if chunk:
+                        lines += key.data.feed(chunk)
+                    else:
+                        lines += key.data.finish()
+                        selector.unregister(key.fd)
+                if lines:
+                    self.sink(lines)
+        finally:
+            selector.close()
+
+    def _run_threads(self):
+        threads = [threading.Thread(target=self._read_blocking, args=(stream,), daemon=True) for stream in self.streams]
+        for thread in threads: thread.start()
+        for thread in threads: thread.join()
+
+    def _read_blocking(self, stream: BinaryIO):
+        splitter = LineSplitter()
+        fd = stream.fileno()
+        while True:
+            chunk = os.read(fd, self.chunk_size)
+            lines = splitter.feed(chunk) if chunk else splitter.finish()
+            if lines:
+                self.sink(lines)
+            if not chunk:
+                return
@@ -0,0 +1,95 @@
+import time
+import threading
+import tkinter as tk
+from typing import Callable
+
+class UiWakeup:
+    """
+    # Wakes the Tk event loop from worker threads with a coalesced virtual event and runs a frame callback at most
+    # max_fps times per second.
+    # 작업 스레드에서 병합된 가상 이벤트로 Tk 이벤트 루프를 깨우고, 프레임 콜백을 초당 최대 max_fps번 실행합니다.
+
+    # While nothing arrives, the Tk loop is not woken at all. If Tcl was built without thread support (so Tk must not be
+    # called from other threads), it falls back to polling at the frame interval while active.
+    # 아무것도 도착하지 않으면 Tk 루프는 전혀 깨어나지 않습니다. Tcl이 스레드 지원 없이 빌드된 경우 (다른 스레드에서
+    # Tk를 호출하면 안 되므로) 활성 상태인 동안 프레임 간격으로 확인하는 방식으로 대체됩니다.
+    """
+    EVENT = '<<LogDataReady>>'
+
+    def __init__(self, widget: tk.Misc, callback: Callable[[], None], max_fps: int):
+        """
+        # Initializes the wakeup and binds its virtual event on widget.
+        # 웨이크업을 초기화하고 widget에 가상 이벤트를 바인딩합니다.
+
+        # Args:
+        #     widget (tk.Misc): A widget of the Tk application (e.g., the root window). (Tk 애플리케이션의 위젯, 예: 루트 창)
+        #     callback (Callable): The frame callback, run on the Tk thread. (Tk 스레드에서 실행되는 프레임 콜백)
+        #     max_fps (int): Maximum number of frames per second. (초당 최대 프레임 수)
+        """
+        self.widget = widget
+        self.callback = callback
+        self.frame_interval = 1.0 / max_fps
+        self.threaded = widget.tk.eval('info exists tcl_platform(threaded)') == '1'
+        self.active = False
+        self.wakeups = 0
+        self.frames = 0
+        self._signalled = threading.Event()
+        self._frame_job = None
+        self._poll_job = None
+        self._last_frame = 0.0
+        widget.bind(self.EVENT, self._on_wakeup)
+
+    def notify(self):
+        """
+        # Signals that new data is available. Safe to call from any thread; repeated calls before the next wakeup coalesce.
+        # 새 데이터가 있음을 알립니다. 어느 스레드에서나 호출할 수 있으며, 다음 웨이크업 전의 반복 호출은 병합됩니다.
+        """
+        if not self.threaded or self._signalled.is_set():
+            return
+        self._signalled.set()
+        try:
+            self.widget.event_generate(self.EVENT, when='tail')
+        except (RuntimeError, tk.TclError):
+            # The application is shutting down. (애플리케이션이 종료되는 중입니다.)
+            self._signalled.clear()
+
+    def start(self):
+        """
+        # Marks the source as active (e.g., a run started) and schedules a first frame.
+        # 소스를 활성 상태로 표시하고 (예: 실행 시작) 첫 프레임을 예약합니다.
+        """
+        self.active = True
+        if not self.threaded and self._poll_job is None:
+            self._poll_job = self.widget.after(int(self.frame_interval * 1000), self._poll)
+        self.request_frame()
+
+    def stop(self):
+        self.active = False
+
+    def request_frame(self):
+        """
+        # Schedules the frame callback for the earliest time allowed by the frame rate cap (Tk thread only).
+        # 프레임 속도 제한이 허용하는 가장 이른 시점에 프레임 콜백을 예약합니다 (Tk 스레드 전용).
+        """
+        if self._frame_job is not None:
+            return
+        delay = self._last_frame + self.frame_interval - time.perf_counter()
+        self._frame_job = self.widget.after(max(0, int(delay * 1000)), self._run_frame)
+
+    def _on_wakeup(self, event=None):
+        self._signalled.clear()
+        self.wakeups += 1
+        self.request_frame()
+
+    def _run_frame(self):
+        self._frame_job = None
+        self._last_frame = time.perf_counter()
+        self.frames += 1
+        self.callback()
+
+    def _poll(self):
+        self._poll_job = None
+        if not self.active:
+            return
+        self.request_frame()
+        self._poll_job = self.widget.after(int(self.frame_interval * 1000), self._poll)
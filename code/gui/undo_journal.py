@@ -0,0 +1,163 @@
+from collections import deque
+from typing import Callable, Iterable, List, Optional, Tuple
+from .config import UNDO_MAX_DEPTH, UNDO_MAX_BYTES
+from .log_store import LogStore
+
+# Entry fields in the order of the diff tuples; None in a diff tuple means "unchanged".
+# diff 튜플의 항목 필드 순서입니다. diff 튜플의 None은 "변경 없음"을 뜻합니다.
+FIELDS = ('message', 'level', 'state')
+# Rough fixed cost of one journal record, added to the size of its text.
+# 저널 기록 하나의 대략적인 고정 비용으로, 텍스트 크기에 더해집니다.
+RECORD_OVERHEAD_BYTES = 128
+
+class UndoJournal:
+    """
+    # A bounded undo/redo journal that keeps only the changed fields of each edit.
+    # 각 편집에서 변경된 필드만 보관하는, 크기가 제한된 실행 취소/다시 실행 저널입니다.
+
+    # A record is (label, index, before, after, size). before/after are (message, level, state) tuples holding only
+    # the changed fields, or None if the entry does not exist on that side (an added entry has before=None).
+    # 기록은 (label, index, before, after, size)입니다. before/after는 변경된 필드만 담은 (message, level, state)
+    # 튜플이며, 해당 시점에 항목이 없으면 None입니다 (추가된 항목은 before=None).
+    """
+    def __init__(self, max_depth: int = UNDO_MAX_DEPTH, max_bytes: int = UNDO_MAX_BYTES):
+        """
+        # Initializes an empty journal.
+        # 빈 저널을 초기화합니다.
+
+        # Args:
+        #     max_depth (int): Maximum number of undoable edits. (실행 취소 가능한 최대 편집 수)
+        #     max_bytes (int): Approximate memory budget of the undoable edits. (실행 취소 가능한 편집의 대략적인 메모리 예산)
+        """
+        self.max_depth = max_depth
+        self.max_bytes = max_bytes
+        self._undo = deque()
+        self._redo = []
+        self._undo_bytes = 0
+        self.trimmed = False
+        # Called as on_apply(label, index, current, target) for every transition applied to the store (e.g. to journal it to disk).
+        # 저장소에 적용된 모든 전환마다 on_apply(label, index, current, target)로 호출됩니다 (예: 디스크 저널 기록).
+        self.on_apply: Optional[Callable[[str, int, Optional[tuple], Optional[tuple]], None]] = None
+
+    @property
+    def can_undo(self) -> bool:
+        return bool(self._undo)
+
+    @property
+    def can_redo(self) -> bool:
+        return bool(self._redo)
+
+    @property
+    def has_changes(self) -> bool:
+        """
+        # Whether the log differs from its last saved state, including edits dropped from the journal by its limits.
+        # 로그가 마지막 저장 상태와 다른지 여부이며, 제한으로 인해 저널에서 버려진 편집도 포함합니다.
+        """
+        return bool(self._undo) or self.trimmed
+
+    def clear(self):
+        """
+        # Forgets all edits, e.g. after saving or when another log is loaded.
+        # 모든 편집을 잊습니다. 예: 저장 후 또는 다른 로그를 불러올 때.
+        """
+        self._undo.clear()
+        self._redo.clear()
+        self._undo_bytes = 0
+        self.trimmed = False
+
+    def record(self, label: str, index: int, before: Optional[dict], after: Optional[dict]):
+        """
+        # Records an edit from entry snapshots taken before and after it, and clears the redo history.
+        # 편집 전후에 얻은 항목 스냅샷으로 편집을 기록하고, 다시 실행 기록을 비웁니다.
+
+        # Args:
+        #     label (str): Short action name used in status messages (e.g., 'add'). (상태 메시지에 쓰이는 짧은 작업 이름)
+        #     index (int): The absolute log index of the entry. (항목의 절대 로그 인덱스)
+        #     before (dict | None): The snapshot before the edit, or None for an added entry. (편집 전 스냅샷, 추가된 항목이면 None)
+        #     after (dict | None): The snapshot after the edit, or None for a removed entry. (편집 후 스냅샷, 제거된 항목이면 None)
+        """
+        if before is not None and after is not None:
+            changed = [field for field in FIELDS if before[field] != after[field]]
+            if not changed:
+                return
+            before = tuple(before[field] if field in changed else None for field in FIELDS)
+            after = tuple(after[field] if field in changed else None for field in FIELDS)
+        else:
+            before = tuple(before[field] for field in FIELDS) if before is not None else None
+            after = tuple(after[field] for field in FIELDS) if after is not None else None
+        self._push_undo((label, index, before, after, self._size(before, after)))
+        self._redo.clear()
+        self._notify_apply(label, index, before, after)
+
+    def restore(self, store: LogStore, transitions: Iterable[Tuple[str, int, Optional[tuple], Optional[tuple]]]):
+        """
+        # Re-applies previously journaled (label, index, current, target) transitions as one store transaction and makes them undoable.
+        # 이전에 저널에 기록된 (label, index, current, target) 전환들을 하나의 저장소 트랜잭션으로 다시 적용하고 실행 취소 가능하게 만듭니다.
+        """
+        with store.batch():
+            for label, index, current, target in transitions:
+                self._apply(store, index, current, target)
+                self._push_undo((label, index, current, target, self._size(current, target)))
+                self._notify_apply(label, index, current, target)
+        self._redo.clear()
+
+    def undo(self, store: LogStore, count: int = 1) -> List[Tuple[str, int]]:
+        """
+        # Reverts up to count edits as one store transaction and returns their (label, index) pairs, newest first.
+        # 최대 count개의 편집을 하나의 저장소 트랜잭션으로 되돌리고, 그 (label, index) 쌍을 최신 순으로 반환합니다.
+        """
+        applied = []
+        with store.batch():
+            while self._undo and len(applied) < count:
+                record = self._undo.pop()
+                self._undo_bytes -= record[4]
+                label, index, before, after, _ = record
+                self._apply(store, index, after, before)
+                self._redo.append(record)
+                self._notify_apply(label, index, after, before)
+                applied.append((label, index))
+        return applied
+
+    def redo(self, store: LogStore, count: int = 1) -> List[Tuple[str, int]]:
+        """
+        # Re-applies up to count undone edits as one store transaction and returns their (label, index) pairs.
+        # 실행 취소된 편집을 최대 count개까지 하나의 저장소 트랜잭션으로 다시 적용하고, 그 (label, index) 쌍을 반환합니다.
+        """
+        applied = []
+        with store.batch():
+            while self._redo and len(applied) < count:
+                record = self._redo.pop()
+                label, index, before, after, _ = record
+                self._apply(store, index, before, after)
+                self._push_undo(record)
+                self._notify_apply(label, index, before, after)
+                applied.append((label, index))
+        return applied
+
+    @staticmethod
+    def _size(before: Optional[tuple], after: Optional[tuple]) -> int:
+        return RECORD_OVERHEAD_BYTES + sum(len(value) for diff in (before, after) if diff for value in diff if value)
+
+    def _notify_apply(self, label: str, index: int, current: Optional[tuple], target: Optional[tuple]):
+        if self.on_apply is not None:
+            self.on_apply(label, index, current, target)
+
+    def _push_undo(self, record: tuple):
+        self._undo.append(record)
+        self._undo_bytes += record[4]
+        while len(self._undo) > 1 and (len(self._undo) > self.max_depth or self._undo_bytes > self.max_bytes):
+            self._undo_bytes -= self._undo.popleft()[4]
+            self.trimmed = True
+
+    @staticmethod
+    def _apply(store: LogStore, index: int, current: Optional[tuple], target: Optional[tuple]):
+        """
+        # Moves the entry at index from the current to the target side of a record.
+        # index의 항목을 기록의 현재 쪽에서 목표 쪽으로 옮깁니다.
+        """
+        if target is None:
+            store.pop(index)
+        elif current is None:
+            store.insert(index, *target)
+        else:
+            store.update(index, *target)
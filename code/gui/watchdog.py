@@ -0,0 +1,158 @@
+import sys
+import time
+import threading
+import traceback
+import tkinter as tk
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+from .config import WATCHDOG_INTERVAL_MS, WATCHDOG_STALL_MS, WATCHDOG_LOG_PATH
+
+def _callback_label(frame) -> str:
+    """
+    # Names the Tk callback a stack is in: the function called by the innermost Tk dispatch frame (CallWrapper.__call__
+    # for bindings and commands, callit for after()), or the innermost function outside a callback.
+    # 스택이 속한 Tk 콜백의 이름을 정합니다: 가장 안쪽 Tk 디스패치 프레임(바인딩과 명령은 CallWrapper.__call__,
+    # after()는 callit)이 호출한 함수이며, 콜백 밖이면 가장 안쪽 함수입니다.
+    """
+    frames = []
+    while frame is not None:
+        frames.append(frame)
+        frame = frame.f_back
+    frames.reverse()
+    tk_file = tk.__file__
+    callback = None
+    for i, f in enumerate(frames[:-1]):
+        if f.f_code.co_filename == tk_file and f.f_code.co_name in ('__call__', 'callit'):
+            callback = i + 1
+    chain = frames[callback:callback + 2] if callback is not None else frames[-1:]
+    # A lambda binding says little on its own, so the function it calls is added.
+    # 람다 바인딩은 그 자체로는 알려 주는 것이 적으므로, 람다가 호출한 함수를 덧붙입니다.
+    if len(chain) == 2 and chain[0].f_code.co_name != '<lambda>':
+        chain = chain[:1]
+    return ' -> '.join(getattr(f.f_code, 'co_qualname', f.f_code.co_name) for f in chain)
+
+class StallWatchdog:
+    """
+    # Detects stalls of the Tk event loop from a background thread and records which callback caused them.
+    # 백그라운드 스레드에서 Tk 이벤트 루프의 멈춤을 감지하고, 어떤 콜백이 원인인지 기록합니다.
+
+    # The Tk loop updates a heartbeat every WATCHDOG_INTERVAL_MS through after(). When the heartbeat is more than
+    # WATCHDOG_STALL_MS late, the watchdog snapshots the Tk thread's stack with sys._current_frames() and appends it to
+    # the diagnostics log at once (so a hang is recorded too); the duration is appended when the loop recovers.
+    # Tk 루프는 after()를 통해 WATCHDOG_INTERVAL_MS마다 하트비트를 갱신합니다. 하트비트가 WATCHDOG_STALL_MS보다
+    # 늦어지면, 감시자는 sys._current_frames()로 Tk 스레드의 스택을 캡처해 즉시 진단 로그에 추가하며 (따라서 멈춘
+    # 채로 끝나도 기록됨), 루프가 회복되면 지속 시간을 추가합니다.
+    """
+    def __init__(self, widget: tk.Misc, stall_ms: int = WATCHDOG_STALL_MS, interval_ms: int = WATCHDOG_INTERVAL_MS,
+                 log_path: Path = WATCHDOG_LOG_PATH):
+        """
+        # Initializes the watchdog. Must be called on the Tk thread, which is the thread it watches.
+        # 감시자를 초기화합니다. 감시 대상인 Tk 스레드에서 호출해야 합니다.
+        """
+        self.widget = widget
+        self.stall_ms = stall_ms
+        self.interval_ms = interval_ms
+        self.log_path = Path(log_path)
+        self.error: Optional[OSError] = None
+        self._tk_thread_id = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._beat_job = None
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._summary: Dict[str, dict] = {}
+        self._thread = threading.Thread(target=self._run, name="StallWatchdog", daemon=True)
+
+    def start(self):
+        self._last_beat = time.monotonic()
+        self._beat_job = self.widget.after(self.interval_ms, self._beat)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._beat_job is not None:
+            try: self.widget.after_cancel(self._beat_job)
+            except tk.TclError: pass
+            self._beat_job = None
+
+    def summary(self) -> List[dict]:
+        """
+        # Returns the finished stalls grouped per callback, longest total first: label, count, total_ms, max_ms.
+        # 끝난 멈춤을 콜백별로 묶어 총 시간이 긴 순서로 반환합니다: label, count, total_ms, max_ms.
+        """
+        with self._lock:
+            rows = [dict(label=label, **entry) for label, entry in self._summary.items()]
+        return sorted(rows, key=lambda row: row['total_ms'], reverse=True)
+
+    def reset(self):
+        with self._lock:
+            self._summary.clear()
+
+    def write_summary(self) -> Path:
+        """
+        # Appends the per-callback summary to the diagnostics log and returns its path.
+        # 콜백별 요약을 진단 로그에 추가하고 경로를 반환합니다.
+
+        # Raises:
+        #     OSError: If the log cannot be written. (로그를 기록할 수 없는 경우)
+        """
+        rows = self.summary()
+        lines = [f"{self._now()} Stall summary ({len(rows)} callbacks, threshold {self.stall_ms} ms):"]
+        lines += [f"  {row['count']:>6,}x  total {row['total_ms']:>10,.0f} ms  max {row['max_ms']:>9,.0f} ms  {row['label']}" for row in rows]
+        self._write(lines, raise_errors=True)
+        return self.log_path
+
+    def _beat(self):
+        self._last_beat = time.monotonic()
+        self._beat_job = self.widget.after(self.interval_ms, self._beat)
+
+    def _run(self):
+        """
+        # Watchdog thread: checks the heartbeat every interval and reports the start and the end of each stall.
+        # 감시 스레드: 주기마다 하트비트를 확인하고 각 멈춤의 시작과 끝을 보고합니다.
+        """
+        interval, threshold = self.interval_ms / 1000, self.stall_ms / 1000
+        stalled_beat, label = None, None
+        while not self._stop.wait(interval):
+            beat = self._last_beat
+            if stalled_beat is not None:
+                if beat != stalled_beat:
+                    # The beat was due one interval after the stalled one; everything beyond that is the stall.
+                    # 하트비트는 멈춘 하트비트로부터 한 주기 뒤에 예정되어 있었으므로, 그 이후의 시간이 멈춤입니다.
+                    duration_ms = (beat - stalled_beat - interval) * 1000
+                    self._record(label, duration_ms)
+                    self._write([f"{self._now()} UI stall in {label} ended after {duration_ms:,.0f} ms"])
+                    stalled_beat = None
+                continue
+            late = time.monotonic() - beat - interval
+            if late < threshold:
+                continue
+            frame = sys._current_frames().get(self._tk_thread_id)
+            if frame is None:
+                return
+            label = _callback_label(frame)
+            stack = traceback.format_stack(frame)
+            del frame
+            stalled_beat = beat
+            self._write([f"{self._now()} UI stall over {late * 1000:,.0f} ms in {label}; Tk thread stack:"] +
+                        [line.rstrip('\n') for line in stack])
+
+    def _record(self, label: str, duration_ms: float):
+        with self._lock:
+            entry = self._summary.setdefault(label, {'count': 0, 'total_ms': 0.0, 'max_ms': 0.0})
+            entry['count'] += 1
+            entry['total_ms'] += duration_ms
+            entry['max_ms'] = max(entry['max_ms'], duration_ms)
+
+    def _write(self, lines: List[str], raise_errors: bool = False):
+        try:
+            self.log_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.log_path, 'a', encoding='utf-8') as f:
+                f.write("\n".join(lines) + "\n")
+        except OSError as e:
+            self.error = e
+            if raise_errors: raise
+
+    @staticmethod
+    def _now() -> str:
+        return datetime.now().strftime('%Y-%m-%d %H:%M:%S')
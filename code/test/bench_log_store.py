@@ -0,0 +1,69 @@
+"""
+# Memory benchmark for the columnar log store.
+# 열 기반 로그 저장소를 위한 메모리 벤치마크입니다.
+
+# Compares the peak memory of the previous list-of-dicts representation of all_logs with LogStore
+# for the same generated lines (1M and 10M lines by default).
+# 같은 생성 라인에 대해 이전의 dict 리스트 방식 all_logs와 LogStore의 최대 메모리를 비교합니다
+# (기본값은 100만, 1000만 라인).
+
+# Usage (사용법): python test/bench_log_store.py [--lines N [N ...]] [--skip-dicts]
+"""
+
+import sys
+import time
+import argparse
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from gui.log_store import LogStore
+
+LEVELS = ["TRACE", "DEBUG", "INFO", "PROGRESS", "WARNING", "ERROR", "FATAL", "THINKING", "DATA"]
+
+def generate(count: int):
+    """
+    # Yields (message, level) pairs shaped like the viewer's log lines.
+    # 뷰어의 로그 라인과 같은 모양의 (메시지, 레벨) 쌍을 생성합니다.
+    """
+    for i in range(count):
+        level = LEVELS[i % len(LEVELS)]
+        yield f"[12:{i // 60 % 60:02d}:{i % 60:02d}] [{level}] Processing item {i} of the current batch.", level
+
+def measure(build, count: int):
+    """
+    # Returns (peak bytes, seconds) for building a representation of count lines.
+    # count개의 라인 표현을 만드는 데 드는 (최대 바이트, 초)를 반환합니다.
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build(count)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return peak, elapsed
+
+def build_dicts(count: int):
+    return [{'message': message, 'level': level, 'state': 'SAVED'} for message, level in generate(count)]
+
+def build_store(count: int):
+    store = LogStore(LEVELS)
+    store.extend(generate(count))
+    return store
+
+def main():
+    parser = argparse.ArgumentParser(description="LogStore memory benchmark.")
+    parser.add_argument("--lines", type=int, nargs="+", default=[1_000_000, 10_000_000], help="Line counts to measure.")
+    parser.add_argument("--skip-dicts", action="store_true", help="Only measure LogStore (the list of dicts needs several GB at 10M lines).")
+    args = parser.parse_args()
+
+    print(f"{'lines':>12}{'repr':>12}{'peak MB':>12}{'B/line':>10}{'build s':>10}")
+    for count in args.lines:
+        builders = [('LogStore', build_store)] if args.skip_dicts else [('dicts', build_dicts), ('LogStore', build_store)]
+        for name, build in builders:
+            peak, elapsed = measure(build, count)
+            print(f"{count:>12,}{name:>12}{peak / 1e6:>12.1f}{peak / count:>10.1f}{elapsed:>10.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,326 @@
+"""
+# End-to-end throughput and latency benchmark for the ingest engine.
+# 수집 엔진을 위한 종단 간 처리량 및 지연 시간 벤치마크입니다.
+
+# A generator child process prints synthetic log lines (configurable rate, line length, level mix, link density and
+# PROGRESS frequency) and is run through the same path as a GUI run: ScriptRun -> IngestQueue -> frame loop at
+# INGEST_MAX_FPS -> LogIngestor -> LogStore + LogWriter. Only the Tk rendering is left out; the virtual log view
+# renders a bounded window, so its cost does not grow with the line rate.
+# 생성기 자식 프로세스가 합성 로그 라인(설정 가능한 속도, 라인 길이, 레벨 비율, 링크 밀도, PROGRESS 빈도)을
+# 출력하고, GUI 실행과 같은 경로로 처리됩니다: ScriptRun -> IngestQueue -> INGEST_MAX_FPS 프레임 루프 ->
+# LogIngestor -> LogStore + LogWriter. Tk 렌더링만 제외되며, 가상 로그 뷰는 제한된 창만 렌더링하므로
+# 그 비용은 라인 속도에 따라 늘어나지 않습니다.
+
+# Measured: lines/s ingested, p50/p99 latency from the child's print to the line being applied to the store,
+# memory per million lines, log file open time (cold and with the sidecar index) and search latency.
+# Results are written as JSON and can be compared with an earlier run.
+# 측정 항목: 초당 수집 라인 수, 자식의 출력부터 라인이 저장소에 반영될 때까지의 p50/p99 지연 시간,
+# 100만 라인당 메모리, 로그 파일 열기 시간(콜드 및 사이드카 인덱스 사용), 검색 지연 시간.
+# 결과는 JSON으로 기록되며 이전 실행과 비교할 수 있습니다.
+
+# Usage (사용법):
+#     python test/benchmark.py [--lines N] [--rate LINES_PER_S] [--line-bytes B] [--levels INFO=70,DEBUG=20,...]
+#                              [--link-every N] [--progress-every N] [--probe-every N] [--seed S]
+#                              [--output results.json] [--compare baseline.json]
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import queue
+import random
+import argparse
+import platform
+import tempfile
+import threading
+import subprocess
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from gui.classifier import LevelClassifier
+from gui.config import INGEST_MAX_FPS, INGEST_MAX_LINES_PER_TICK, INGEST_TIME_BUDGET_MS
+from gui.engine import LogIngestor, ScriptRun
+from gui.ingest_queue import IngestQueue
+from gui.log_index import LogFileIndexer, sidecar_path
+from gui.log_store import LogStore
+from gui.log_writer import LogWriter
+from gui.search import SearchEngine
+from gui.theme import DefaultTheme
+
+PROBE_MARKER = "probe t="
+SEARCH_QUERIES = [
+    ('plain_common', 'processed', False),
+    ('plain_rare', 'item 123456 ', False),
+    ('regex', r'item \d+7 ', True),
+]
+
+def parse_levels(text: str) -> dict:
+    """
+    # Parses a level mix such as 'INFO=70,DEBUG=20,WARNING=8,ERROR=2' into {level: weight}.
+    # 'INFO=70,DEBUG=20,WARNING=8,ERROR=2'와 같은 레벨 비율을 {레벨: 가중치}로 파싱합니다.
+    """
+    levels = {}
+    for part in text.split(','):
+        level, _, weight = part.partition('=')
+        levels[level.strip().upper()] = float(weight or 1)
+    return levels
+
+# --- Generator (Child Process) (생성기, 자식 프로세스) ---
+
+def generate(args: argparse.Namespace):
+    """
+    # Child process: prints args.lines synthetic log lines at args.rate lines/s (0 = as fast as possible).
+    # 자식 프로세스: args.lines개의 합성 로그 라인을 초당 args.rate 라인(0 = 최대한 빠르게)으로 출력합니다.
+
+    # Every probe_every-th line carries its print time and is flushed immediately, so its latency can be measured.
+    # probe_every번째 라인마다 출력 시각을 담아 즉시 플러시하여, 지연 시간을 측정할 수 있게 합니다.
+    """
+    rng = random.Random(args.seed)
+    mix = parse_levels(args.levels)
+    names, weights = list(mix), list(mix.values())
+    filler = "lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod tempor "
+    out = sys.stdout
+    pending = []
+    started = time.perf_counter()
+    for i in range(args.lines):
+        if i % 1000 == 0:
+            stamp = datetime.now().strftime('%H:%M:%S')
+        if args.progress_every and i % args.progress_every == args.progress_every - 1:
+            line = f"[{stamp}] [PROGRESS] Processing batch: {i * 100 // args.lines}% Complete"
+        else:
+            level = rng.choices(names, weights)[0]
+            line = f"[{stamp}] [{level}] worker processed item {i} "
+            if args.link_every and i % args.link_every == 0:
+                line += "see https://example.com/items/%d " % i
+            if len(line) < args.line_bytes:
+                line += (filler * (args.line_bytes // len(filler) + 1))[:args.line_bytes - len(line)]
+        probe = args.probe_every and i % args.probe_every == 0
+        if probe:
+            line += f" {PROBE_MARKER}{time.time():.6f}"
+        pending.append(line)
+        if probe or len(pending) >= 256:
+            out.write('\n'.join(pending) + '\n')
+            out.flush()
+            pending = []
+        if args.rate:
+            ahead = (i + 1) / args.rate - (time.perf_counter() - started)
+            if ahead > 0.001:
+                if pending:
+                    out.write('\n'.join(pending) + '\n')
+                    out.flush()
+                    pending = []
+                time.sleep(ahead)
+    if pending:
+        out.write('\n'.join(pending) + '\n')
+    out.flush()
+
+# --- Harness (하네스) ---
+
+def percentile(values: list, fraction: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+def peak_rss_mb():
+    """
+    # Returns the peak resident set size of this process in MB, or None where it is not available (e.g. Windows).
+    # 이 프로세스의 최대 상주 메모리 크기(MB)를 반환하며, 사용할 수 없으면(예: Windows) None을 반환합니다.
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+def bench_ingest(args: argparse.Namespace, classifier: LevelClassifier, log_path: str) -> tuple:
+    """
+    # Runs the generator through the GUI ingest path and returns (metrics, store).
+    # 생성기를 GUI 수집 경로로 실행하고 (지표, 저장소)를 반환합니다.
+    """
+    ingest_queue = IngestQueue()
+    ingestor = LogIngestor(classifier)
+    store = LogStore(with_timestamps=True)
+    writer = LogWriter(log_path)
+    wakeup = threading.Event()
+    finished = threading.Event()
+
+    def on_lines(lines):
+        if ingest_queue.put('lines', lines):
+            wakeup.set()
+
+    def on_exit(returncode):
+        finished.set()
+        wakeup.set()
+
+    command = [sys.executable, str(Path(__file__).resolve()), '--generate'] + sys.argv[1:]
+    run = ScriptRun(command, cwd=str(Path(__file__).resolve().parent))
+    latencies, frames, max_frame_ms = [], 0, 0.0
+    frame_interval = 1.0 / INGEST_MAX_FPS
+    started = time.perf_counter()
+    run.start(on_lines, on_exit)
+    last_frame = 0.0
+    while True:
+        wakeup.wait()
+        wakeup.clear()
+        # Frame rate cap, as UiWakeup applies it. (UiWakeup과 같은 프레임 속도 제한)
+        delay = last_frame + frame_interval - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        last_frame = frame_start = time.perf_counter()
+        deadline = frame_start + INGEST_TIME_BUDGET_MS / 1000
+        batch = []
+        try:
+            while len(batch) < INGEST_MAX_LINES_PER_TICK:
+                _, data = ingest_queue.get_nowait()
+                batch += [(line, None) for line in data]
+                if time.perf_counter() >= deadline:
+                    break
+        except queue.Empty:
+            pass
+        if batch:
+            entries, _ = ingestor.ingest(batch)
+            store.extend(entries)
+            writer.write_lines([message for message, _ in entries])
+            now = time.time()
+            for line, _ in batch:
+                if PROBE_MARKER in line:
+                    latencies.append(now - float(line.rsplit(PROBE_MARKER, 1)[1]))
+            frames += 1
+            max_frame_ms = max(max_frame_ms, (time.perf_counter() - frame_start) * 1000)
+        if not ingest_queue.empty():
+            wakeup.set()
+        elif finished.is_set():
+            break
+    elapsed = time.perf_counter() - started
+    writer.close()
+    metrics = {
+        'lines': len(store),
+        'seconds': elapsed,
+        'lines_per_s': len(store) / elapsed if elapsed else 0.0,
+        'latency_p50_ms': percentile(latencies, 0.50) * 1000,
+        'latency_p99_ms': percentile(latencies, 0.99) * 1000,
+        'latency_max_ms': max(latencies, default=0.0) * 1000,
+        'probes': len(latencies),
+        'frames': frames,
+        'max_frame_ms': max_frame_ms,
+        'blocked_s': ingest_queue.blocked_seconds,
+        'store_mb_per_million_lines': store.nbytes() / len(store) if len(store) else 0.0,
+        'peak_rss_mb': peak_rss_mb(),
+        'exit_code': run.returncode,
+    }
+    return metrics, store
+
+def bench_file_open(classifier: LevelClassifier, log_path: str) -> dict:
+    """
+    # Times indexing the run's log file without a sidecar index (cold) and again with it (warm).
+    # 실행 로그 파일을 사이드카 인덱스 없이(콜드), 그리고 사이드카와 함께(웜) 인덱싱하는 시간을 잽니다.
+    """
+    results = {'file_mb': os.path.getsize(log_path) / (1024 * 1024)}
+    sidecar = sidecar_path(log_path)
+    try: os.remove(sidecar)
+    except OSError: pass
+    for name in ('open_cold_s', 'open_warm_s'):
+        start = time.perf_counter()
+        indexer = LogFileIndexer(log_path, classifier)
+        indexer.start()
+        while not indexer.done:
+            time.sleep(0.001)
+        results[name] = time.perf_counter() - start
+        results['indexed_lines'] = len(indexer)
+        indexer.close()
+    try: os.remove(sidecar)
+    except OSError: pass
+    return results
+
+def bench_search(store: LogStore) -> dict:
+    """
+    # Times a full search scan (as run by the search worker) for a few typical queries.
+    # 몇 가지 대표적인 검색어에 대해 (검색 작업 스레드가 수행하는) 전체 검색 스캔 시간을 잽니다.
+    """
+    results = {}
+    for name, query, is_regex in SEARCH_QUERIES:
+        pattern = re.compile(query, re.I) if is_regex else None
+        needle = query.lower()
+        message, find_spans = store.message, SearchEngine._find_spans
+        start = time.perf_counter()
+        matches = sum(1 for i in store.select() if find_spans(message(i), needle, False, pattern))
+        results[f'search_{name}_ms'] = (time.perf_counter() - start) * 1000
+        results[f'search_{name}_matches'] = matches
+    return results
+
+def git_version() -> str:
+    try:
+        return subprocess.run(['git', 'describe', '--always', '--dirty'], capture_output=True, text=True,
+                              cwd=Path(__file__).resolve().parent, timeout=10).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+def compare(results: dict, baseline_path: str):
+    """
+    # Prints each numeric metric next to its value in an earlier result file, with the relative change.
+    # 각 수치 지표를 이전 결과 파일의 값과 함께 상대 변화율과 나란히 출력합니다.
+    """
+    with open(baseline_path, encoding='utf-8') as f:
+        baseline = json.load(f)['results']
+    print(f"\n{'metric':<34}{'baseline':>14}{'current':>14}{'change':>10}")
+    for key, value in results.items():
+        old = baseline.get(key)
+        if not isinstance(value, (int, float)) or not isinstance(old, (int, float)):
+            continue
+        change = f"{(value - old) / old * 100:+.1f}%" if old else ""
+        print(f"{key:<34}{old:>14.2f}{value:>14.2f}{change:>10}")
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Ingest engine throughput and latency benchmark.")
+    parser.add_argument("--lines", type=int, default=1_000_000, help="Number of lines the generator prints.")
+    parser.add_argument("--rate", type=float, default=0, help="Lines per second (0 = as fast as possible).")
+    parser.add_argument("--line-bytes", type=int, default=80, help="Approximate length of each line.")
+    parser.add_argument("--levels", default="INFO=70,DEBUG=20,WARNING=8,ERROR=2", help="Level mix as LEVEL=weight pairs.")
+    parser.add_argument("--link-every", type=int, default=50, help="Add a URL to every N-th line (0 = none).")
+    parser.add_argument("--progress-every", type=int, default=1000, help="Print a PROGRESS line every N lines (0 = none).")
+    parser.add_argument("--probe-every", type=int, default=1000, help="Timestamp every N-th line for latency (0 = none).")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed of the level mix.")
+    parser.add_argument("--output", help="Write the results to this JSON file.")
+    parser.add_argument("--compare", help="Compare the results with an earlier JSON result file.")
+    parser.add_argument("--generate", action="store_true", help=argparse.SUPPRESS)
+    # Appended by ScriptRun for the generator child; unused. (ScriptRun이 생성기 자식에 덧붙임, 사용하지 않음)
+    parser.add_argument("--data-dir", help=argparse.SUPPRESS)
+    return parser
+
+def main():
+    args = build_parser().parse_args()
+    if args.generate:
+        generate(args)
+        return
+
+    classifier = LevelClassifier(list(DefaultTheme.LOG_LEVEL_COLORS) + list(parse_levels(args.levels)))
+    with tempfile.TemporaryDirectory(prefix="log_bench_") as work_dir:
+        log_path = os.path.join(work_dir, "bench.log")
+        results, store = bench_ingest(args, classifier, log_path)
+        results.update(bench_search(store))
+        del store
+        results.update(bench_file_open(classifier, log_path))
+
+    for key, value in results.items():
+        print(f"{key:<34}{value:>14.2f}" if isinstance(value, float) else f"{key:<34}{value!s:>14}")
+    report = {
+        'version': git_version(),
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'config': {key: value for key, value in vars(args).items() if key not in ('output', 'compare', 'generate', 'data_dir')},
+        'results': results,
+    }
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+    if args.compare:
+        compare(results, args.compare)
+
+if __name__ == "__main__":
+    main()
@@ -6,10 +6,18 @@
 # correctly receives, displays, and handles various log formats and features.
 # 이 스크립트는 대상 프로세스의 출력을 시뮬레이션하여 GUI가 다양한 로그 형식과 기능을
 # 올바르게 수신하고 표시하며 처리하는지 테스트하는 데 사용됩니다.
+
+# With any of --lines, --rate or --burst it runs in flood mode instead, printing reproducible synthetic load
+# (e.g. '--lines 10000000' as fast as possible, or '--rate 50000 --burst 1:4' for 1 s spikes every 5 s).
+# Pause/Resume via the pause flag keeps working under load.
+# --lines, --rate, --burst 중 하나라도 지정하면 대신 플러드 모드로 실행되어 재현 가능한 합성 부하를 출력합니다
+# (예: '--lines 10000000'으로 최대한 빠르게, 또는 '--rate 50000 --burst 1:4'로 5초마다 1초간 급증).
+# 부하 중에도 pause 플래그를 통한 일시정지/재개가 계속 동작합니다.
 """
 
 import time
 import sys
+import random
 import argparse
 from datetime import datetime
 from pathlib import Path
@@ -38,9 +46,115 @@ def log(level, message):
     print(f"[{timestamp}] [{level}] {message}")
     sys.stdout.flush()
 
+# --- Flood Mode (플러드 모드) ---
+
+# The pause flag is checked (and the timestamp header refreshed) every FLOOD_CHECK_LINES lines, at least every
+# FLOOD_CHECK_SECONDS, and between the slices of every sleep. The level mix is also drawn FLOOD_CHECK_LINES at a time.
+# pause 플래그 확인(및 타임스탬프 헤더 갱신)은 FLOOD_CHECK_LINES 라인마다, 최소 FLOOD_CHECK_SECONDS마다, 그리고 모든
+# 대기를 나눈 조각 사이마다 이루어집니다. 레벨 비율도 FLOOD_CHECK_LINES개씩 뽑습니다.
+FLOOD_CHECK_LINES = 1000
+FLOOD_CHECK_SECONDS = 0.1
+FLOOD_FILLER = "lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod tempor incididunt "
+
+def parse_burst(text: str):
+    """
+    # Parses '--burst ON[:OFF]' (seconds) into (on, off); OFF defaults to ON.
+    # '--burst ON[:OFF]'(초)를 (on, off)로 파싱합니다. OFF의 기본값은 ON입니다.
+    """
+    on, _, off = text.partition(':')
+    return float(on), float(off or on)
+
+def parse_levels(text: str):
+    """
+    # Parses a level mix such as 'INFO=70,DEBUG=20,ERROR=10' (or just 'INFO,ERROR') into (names, weights).
+    # 'INFO=70,DEBUG=20,ERROR=10'(또는 'INFO,ERROR')와 같은 레벨 비율을 (이름, 가중치)로 파싱합니다.
+    """
+    mix = [part.partition('=') for part in text.split(',') if part.strip()]
+    return [level.strip().upper() for level, _, _ in mix], [float(weight or 1) for _, _, weight in mix]
+
+def flood(args, pause_flag_path: Path):
+    """
+    # Prints args.lines synthetic lines (forever if None) at args.rate lines/s (as fast as possible if None),
+    # optionally only during bursts, and waits on the pause flag like the demo does.
+    # args.lines개의 합성 라인(None이면 무한히)을 초당 args.rate 라인(None이면 최대한 빠르게)으로 출력하며,
+    # 선택적으로 버스트 동안에만 출력하고, 데모와 마찬가지로 pause 플래그에서 대기합니다.
+    """
+    rng = random.Random(args.seed)
+    names, weights = parse_levels(args.levels)
+    burst_on, burst_off = args.burst or (0, 0)
+    out = sys.stdout
+    pending, levels = [], []
+    stamp, next_check = '', 0.0
+
+    def check():
+        # Flushes, waits on the pause flag and refreshes the stamp; returns True if it paused.
+        # 출력을 비우고, pause 플래그에서 대기하며, 타임스탬프를 갱신합니다. 일시정지했다면 True를 반환합니다.
+        nonlocal pending, stamp, next_check
+        if pending:
+            out.write('\n'.join(pending) + '\n'); out.flush(); pending = []
+        paused = pause_flag_path.exists()
+        if paused:
+            _check_pause(pause_flag_path)
+        stamp = datetime.now().strftime('%H:%M:%S')
+        next_check = time.perf_counter() + FLOOD_CHECK_SECONDS
+        return paused
+
+    def wait(seconds):
+        # Sleeps in FLOOD_CHECK_SECONDS slices, checking before each; a pause cuts the wait short and returns True.
+        # FLOOD_CHECK_SECONDS 단위로 나누어 대기하며 매번 먼저 확인합니다. 일시정지하면 대기를 끝내고 True를 반환합니다.
+        end = time.perf_counter() + seconds
+        while True:
+            if check():
+                return True
+            left = end - time.perf_counter()
+            if left <= 0:
+                return False
+            time.sleep(min(left, FLOOD_CHECK_SECONDS))
+
+    # Pacing restarts with every burst and after every pause. (버스트마다, 그리고 일시정지 후마다 속도 조절을 다시 시작합니다.)
+    segment_start, segment_lines = time.perf_counter(), 0
+    i = 0
+    while args.lines is None or i < args.lines:
+        if i % FLOOD_CHECK_LINES == 0:
+            levels = rng.choices(names, weights, k=FLOOD_CHECK_LINES)
+        if (i % FLOOD_CHECK_LINES == 0 or time.perf_counter() >= next_check) and check():
+            segment_start, segment_lines = time.perf_counter(), 0
+        if burst_on and time.perf_counter() - segment_start >= burst_on:
+            wait(burst_off)
+            segment_start, segment_lines = time.perf_counter(), 0
+
+        if args.progress_every and i % args.progress_every == args.progress_every - 1:
+            percent = f"{i * 100 / args.lines:.1f}%" if args.lines else f"{i:,} lines"
+            line = f"[{stamp}] [PROGRESS] Flooding: {percent}"
+        else:
+            line = f"[{stamp}] [{levels[i % FLOOD_CHECK_LINES]}] Flood line {i}: "
+            if len(line) < args.line_bytes:
+                line += (FLOOD_FILLER * (args.line_bytes // len(FLOOD_FILLER) + 1))[:args.line_bytes - len(line)]
+        pending.append(line)
+        i += 1
+        segment_lines += 1
+        if len(pending) >= 256:
+            out.write('\n'.join(pending) + '\n'); out.flush(); pending = []
+        if args.rate:
+            ahead = segment_lines / args.rate - (time.perf_counter() - segment_start)
+            if ahead > 0.001 and wait(ahead):
+                segment_start, segment_lines = time.perf_counter(), 0
+    if pending:
+        out.write('\n'.join(pending) + '\n')
+    out.flush()
+    return i
+
 # --- Initialization (초기화) ---
 parser = argparse.ArgumentParser(description="Test surrogate for the Glen Log Viewer.")
 parser.add_argument("--data-dir", type=str, required=True, help="Path to the shared data directory for flags.")
+flood_group = parser.add_argument_group("flood mode", "Any of --lines, --rate or --burst replaces the demo with synthetic load.")
+flood_group.add_argument("--lines", type=int, help="Number of lines to print (default: until killed).")
+flood_group.add_argument("--rate", type=float, help="Lines per second (default: as fast as possible).")
+flood_group.add_argument("--burst", type=parse_burst, metavar="ON[:OFF]", help="Print only during ON-second bursts separated by OFF seconds of silence.")
+flood_group.add_argument("--line-bytes", type=int, default=80, help="Pad each line to about this many characters.")
+flood_group.add_argument("--levels", default="INFO=70,DEBUG=20,WARNING=7,ERROR=3", help="Level mix as LEVEL=weight pairs.")
+flood_group.add_argument("--progress-every", type=int, default=0, help="Print a PROGRESS line every N lines (0 = never).")
+flood_group.add_argument("--seed", type=int, default=0, help="Random seed of the level mix, for reproducible runs.")
 args = parser.parse_args()
 DATA_DIR = Path(args.data_dir)
 PAUSE_FLAG_PATH = DATA_DIR / "pause.flag"
@@ -48,6 +162,13 @@ script_path = Path(__file__).resolve()
 
 log('SYSTEM', '--- Starting Logger Test Surrogate (Python) ---')
 
+if args.lines is not None or args.rate is not None or args.burst is not None:
+    started = time.perf_counter()
+    count = flood(args, PAUSE_FLAG_PATH)
+    elapsed = time.perf_counter() - started
+    log('SYSTEM', f'--- Flood finished: {count:,} lines in {elapsed:.2f}s ({count / elapsed if elapsed else 0:,.0f} lines/s) ---')
+    sys.exit(0)
+
 # --- Log Simulation (로그 시뮬레이션) ---
 logs = [
     (0.2, 'THINKING', 'Initializing cognitive matrix...'),